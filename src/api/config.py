@@ -0,0 +1,25 @@
+# File: src\api\config.py
+
+"""
+Module pour configurer les constantes de l'API (file d'inférence, contre-pression).
+
+Les valeurs par défaut peuvent être surchargées par des variables d'environnement.
+"""
+
+import os
+from etl.config.config import REQUEST_CLASS_HEADER  # noqa: F401 (ré-exporté, partagé avec l'ETL)
+
+
+# Threads dédiés à l'inférence. Avec le micro-batching, prévoir au moins
+# MICRO_BATCH_MAX_SIZE threads pour que des requêtes puissent être regroupées.
+INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", "8"))
+
+# Nombre maximal de requêtes en attente par classe de priorité ; au-delà : HTTP 429
+INFERENCE_QUEUE_SIZE: int = int(os.getenv("INFERENCE_QUEUE_SIZE", "64"))
+
+# Délai conseillé au client avant de réessayer (en-tête Retry-After), en secondes
+INFERENCE_RETRY_AFTER_SECONDS: int = int(os.getenv("INFERENCE_RETRY_AFTER_SECONDS", "1"))
+
+# Part minimale des prédictions réservée aux requêtes 'bulk' (ETL) quand des requêtes
+# 'interactive' (frontend) attendent aussi : 0.2 = au moins une prédiction sur cinq
+INFERENCE_BULK_MIN_SHARE: float = float(os.getenv("INFERENCE_BULK_MIN_SHARE", "0.2"))
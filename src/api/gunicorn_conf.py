@@ -0,0 +1,65 @@
+# File: src\api\gunicorn_conf.py
+
+"""
+Configuration Gunicorn pour servir l'API avec plusieurs processus workers.
+
+Le modèle (backend torch) est chargé une seule fois dans le processus maître, puis
+les workers sont créés par 'fork' : les pages mémoire des poids sont partagées en
+copie sur écriture (copy-on-write) au lieu d'être dupliquées par worker. Chaque
+worker limite ensuite ses threads de calcul à sa part des cœurs disponibles, puis
+préchauffe le modèle dans le cycle de vie FastAPI.
+
+Le backend ONNX n'est pas préchargé dans le maître : les threads d'une session
+ONNX Runtime ne survivent pas à un 'fork', chaque worker charge donc sa session.
+Si 'MODEL_LOAD_ON_STARTUP' est désactivé, le maître ne charge pas non plus le modèle :
+il est chargé par chaque worker au premier appel, comme avec uvicorn seul.
+
+Usage :
+------
+API_WORKERS=4 gunicorn -c src/api/gunicorn_conf.py api.main:app
+"""
+
+import gc
+import os
+from loguru import logger
+from machine_learning.config import INFERENCE_BACKEND, INFERENCE_THREADS, MODEL_LOAD_ON_STARTUP
+from machine_learning.predict import load_model, set_inference_threads
+
+
+bind = os.getenv("API_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("API_WORKERS", "1"))
+worker_class = "uvicorn_worker.UvicornWorker"
+# Importe l'application (et donc le modèle) dans le maître avant de créer les workers
+preload_app = True
+timeout = 120
+
+
+def threads_per_worker() -> int:
+    """Répartit les cœurs disponibles entre les workers (au moins un thread chacun)."""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    return max(1, cores // workers)
+
+
+def on_starting(server) -> None:
+    """Charge le modèle torch dans le maître, avant le 'fork' des workers."""
+    if not MODEL_LOAD_ON_STARTUP:
+        logger.info("Chargement du modèle au démarrage désactivé : modèle chargé au premier appel")
+        return
+    if INFERENCE_BACKEND != "torch":
+        logger.info(f"Backend {INFERENCE_BACKEND} : modèle chargé dans chaque worker")
+        return
+
+    # Un seul thread dans le maître : aucun pool de threads OpenMP actif au moment du fork
+    set_inference_threads(1)
+    load_model(warmup=False)
+    # Les objets chargés ne sont plus parcourus par le ramasse-miettes : leurs pages
+    # ne sont pas réécrites dans les workers et restent partagées
+    gc.freeze()
+    logger.success(f"Modèle chargé dans le maître, partagé entre {workers} worker(s)")
+
+
+def post_fork(server, worker) -> None:
+    """Dimensionne les threads de calcul du worker pour éviter la sur-souscription."""
+    threads = INFERENCE_THREADS or threads_per_worker()
+    set_inference_threads(threads)
+    logger.info(f"Worker {worker.pid} : {threads} thread(s) de calcul")
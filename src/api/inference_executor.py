@@ -0,0 +1,197 @@
+# File: src\api\inference_executor.py
+
+"""
+Module de l'exécuteur d'inférence borné de l'API.
+
+Les prédictions ne passent plus par le pool de threads par défaut de Starlette (file
+d'attente non bornée) mais par un pool dédié avec une file de taille fixe. Quand la file
+est pleine, la requête est refusée immédiatement ('QueueFullError', traduite en HTTP 429)
+au lieu d'attendre : la latence des utilisateurs reste maîtrisée pendant une rafale de l'ETL.
+
+Deux classes de priorité se partagent les threads d'inférence :
+- 'interactive' (frontend, appels unitaires) : servie en priorité,
+- 'bulk' (ETL) : servie après, mais avec une part minimale garantie des prédictions
+  lancées pour ne jamais être affamée.
+"""
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from api.config import INFERENCE_WORKERS, INFERENCE_QUEUE_SIZE, INFERENCE_BULK_MIN_SHARE
+from etl.config.config import REQUEST_CLASS_BULK, REQUEST_CLASS_INTERACTIVE
+
+
+# Classes de priorité, définies avec l'ETL (valeurs de l'en-tête 'REQUEST_CLASS_HEADER')
+INTERACTIVE = REQUEST_CLASS_INTERACTIVE
+BULK = REQUEST_CLASS_BULK
+PRIORITY_CLASSES = (INTERACTIVE, BULK)
+
+
+class QueueFullError(Exception):
+    """Erreur levée lorsque la file d'inférence est pleine."""
+
+
+class InferenceExecutor:
+    """Classe de pool de threads d'inférence avec files d'attente bornées par priorité."""
+
+    def __init__(self, max_workers: int, max_queue_size: int, bulk_min_share: float = 0.2) -> None:
+        """
+        Initialise l'exécuteur (les threads sont démarrés à la première soumission).
+
+        Parameters
+        ----------
+        max_workers : int
+            Nombre de threads exécutant les prédictions.
+
+        max_queue_size : int
+            Nombre maximal de tâches en attente d'un thread, pour chaque classe de priorité.
+
+        bulk_min_share : float, optionnel
+            Part minimale (entre 0 et 1) des tâches lancées réservée à la classe 'bulk'
+            lorsque les deux files sont occupées. Par défaut, 0.2 (une tâche sur cinq).
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(1, max_queue_size)
+        # Nombre de tâches interactives lancées avant de céder un tour à la classe 'bulk'
+        bulk_min_share = min(1.0, max(0.0, bulk_min_share))
+        self.interactive_per_bulk = round((1 - bulk_min_share) / bulk_min_share) if bulk_min_share else None
+        self._lanes: Dict[str, Deque[Tuple[Future, Callable, tuple]]] = {
+            priority: deque() for priority in PRIORITY_CLASSES}
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._pid: Optional[int] = None
+        self._interactive_streak = 0
+        self._active = 0
+        self.rejected = {priority: 0 for priority in PRIORITY_CLASSES}
+        self.completed = {priority: 0 for priority in PRIORITY_CLASSES}
+
+    def submit(self, fn: Callable, *args: Any, priority: str = INTERACTIVE) -> Future:
+        """
+        Place une tâche dans la file d'inférence de sa classe de priorité.
+
+        Parameters
+        ----------
+        fn : Callable
+            Fonction à exécuter dans un thread d'inférence.
+
+        *args
+            Arguments transmis à 'fn'.
+
+        priority : str, optionnel
+            Classe de priorité : 'interactive' (par défaut) ou 'bulk'.
+
+        Returns
+        -------
+        Future
+            Futur résolu avec le résultat de 'fn' (ou son exception).
+
+        Raises
+        ------
+        ValueError
+            Si la classe de priorité est inconnue.
+
+        QueueFullError
+            Si la file d'attente de cette classe est pleine.
+        """
+        if priority not in self._lanes:
+            raise ValueError(f"Classe de priorité inconnue : {priority}")
+        self._ensure_workers()
+        future: Future = Future()
+        with self._condition:
+            lane = self._lanes[priority]
+            if len(lane) >= self.max_queue_size:
+                self.rejected[priority] += 1
+                raise QueueFullError(
+                    f"File d'inférence '{priority}' pleine ({self.max_queue_size} requêtes en attente)")
+            lane.append((future, fn, args))
+            self._condition.notify()
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne l'état de l'exécuteur (pour l'exposition Prometheus).
+
+        Returns
+        -------
+        Dict[str, Any]
+            'queue_depth', 'rejected' et 'completed' (par classe de priorité),
+            'queue_capacity', 'active' et 'workers'.
+        """
+        with self._condition:
+            return {
+                "queue_depth": {priority: len(lane) for priority, lane in self._lanes.items()},
+                "queue_capacity": self.max_queue_size,
+                "active": self._active,
+                "workers": self.max_workers,
+                "rejected": dict(self.rejected),
+                "completed": dict(self.completed),
+            }
+
+    def _ensure_workers(self) -> None:
+        """Démarre les threads d'inférence s'ils n'existent pas (ou après un 'fork')."""
+        if self._pid == os.getpid():
+            return
+        with self._condition:
+            if self._pid == os.getpid():
+                return
+            # Files héritées d'un processus parent : on repart de files vides
+            for lane in self._lanes.values():
+                lane.clear()
+            self._workers = [
+                threading.Thread(target=self._run, name=f"inference-{index}", daemon=True)
+                for index in range(self.max_workers)
+            ]
+            for worker in self._workers:
+                worker.start()
+            self._pid = os.getpid()
+
+    def _next_task(self) -> Tuple[str, Tuple[Future, Callable, tuple]]:
+        """
+        Attend puis retire la prochaine tâche à exécuter (appelé avec le verrou pris).
+
+        La file 'interactive' est servie en premier, sauf lorsque 'interactive_per_bulk'
+        tâches interactives ont été lancées d'affilée alors que des tâches 'bulk' attendaient.
+
+        Returns
+        -------
+        Tuple[str, Tuple[Future, Callable, tuple]]
+            La classe de priorité et la tâche retenue.
+        """
+        while not any(self._lanes.values()):
+            self._condition.wait()
+
+        interactive, bulk = self._lanes[INTERACTIVE], self._lanes[BULK]
+        bulk_turn = self.interactive_per_bulk is not None and self._interactive_streak >= self.interactive_per_bulk
+        if bulk and (not interactive or bulk_turn):
+            self._interactive_streak = 0
+            return BULK, bulk.popleft()
+
+        self._interactive_streak = self._interactive_streak + 1 if bulk else 0
+        return INTERACTIVE, interactive.popleft()
+
+    def _run(self) -> None:
+        """Boucle d'un thread d'inférence : exécute les tâches des files par ordre de priorité."""
+        while True:
+            with self._condition:
+                priority, (future, fn, args) = self._next_task()
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._active += 1
+            try:
+                future.set_result(fn(*args))
+            except BaseException as error:
+                future.set_exception(error)
+            finally:
+                with self._condition:
+                    self._active -= 1
+                    self.completed[priority] += 1
+
+
+# Exécuteur partagé par les routes de prédiction
+inference_executor = InferenceExecutor(
+    max_workers=INFERENCE_WORKERS,
+    max_queue_size=INFERENCE_QUEUE_SIZE,
+    bulk_min_share=INFERENCE_BULK_MIN_SHARE,
+)
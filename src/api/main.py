@@ -2,15 +2,42 @@
 
 """
 Module principal de l'application FastAPI.
-Initialise l'application FastAPI, configure les métadonnées
-et expose les métriques Prometheus.
+Initialise l'application FastAPI, configure les métadonnées,
+charge le modèle de sentiment au démarrage et expose les métriques Prometheus.
 """
 
+import threading
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from api.routes import predict
+from loguru import logger
+from api.routes import predict, health
 from prometheus_fastapi_instrumentator import PrometheusFastApiInstrumentator
 from prometheus_client import Counter
 from api.routes.es_queries import router as es_router
+from api.metrics import register_inference_metrics
+from machine_learning.config import MODEL_LOAD_ON_STARTUP
+from machine_learning.predict import load_model
+
+
+def _load_model_in_background() -> None:
+    """Charge et préchauffe le modèle ; l'erreur éventuelle est exposée par '/health/ready'."""
+    try:
+        load_model()
+    except Exception as error:
+        logger.error(f"Le modèle n'a pas pu être chargé au démarrage : {error}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Cycle de vie de l'application : lance le chargement du modèle au démarrage.
+
+    Le chargement se fait dans un thread afin que l'API réponde immédiatement à
+    '/health/live' ; '/health/ready' ne passe à 200 qu'une fois le préchauffage terminé.
+    """
+    if MODEL_LOAD_ON_STARTUP:
+        threading.Thread(target=_load_model_in_background, name="model-loader", daemon=True).start()
+    yield
 
 
 # Création de l’application FastAPI
@@ -21,11 +48,15 @@ app = FastAPI(
         "en utilisant un modèle de traitement du langage naturel."
     ),
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Inclusion des routes API
 app.include_router(predict.router)
 
+# Inclusion des sondes de santé
+app.include_router(health.router)
+
 # Inclusion des routes ES
 app.include_router(es_router)
 
@@ -36,6 +67,9 @@ API_REQUESTS_TOTAL = Counter(
     labelnames=["method", "route", "status"]
 )
 
+# Métriques d'inférence (cache de prédictions, chargement du modèle)
+register_inference_metrics()
+
 # Instrumentation Prometheus automatique (HTTP, latence, status)
 PrometheusFastApiInstrumentator(
     should_group_status_codes=True,
@@ -0,0 +1,116 @@
+# File: src\api\metrics.py
+
+"""
+Module des métriques Prometheus liées à l'inférence du modèle de sentiment.
+
+Les compteurs sont tenus par les composants d'inférence eux-mêmes (sans dépendance
+à Prometheus côté 'machine_learning') et lus au moment du scraping par des
+collecteurs personnalisés enregistrés au démarrage de l'API. Seule la latence par
+classe de priorité, mesurée par les routes, est un histogramme Prometheus classique.
+"""
+
+from typing import Iterator
+from prometheus_client import Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, REGISTRY
+from prometheus_client.registry import Collector
+from api.inference_executor import inference_executor
+from machine_learning.predict import prediction_cache, LOAD_TIMINGS, is_model_ready
+
+
+# Latence des requêtes de prédiction (attente dans la file comprise), par classe de priorité
+INFERENCE_LATENCY = Histogram(
+    "inference_request_seconds",
+    "Durée des requêtes de prédiction, attente dans la file d'inférence comprise",
+    labelnames=["priority"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+
+class PredictionCacheCollector(Collector):
+    """Collecteur Prometheus exposant les statistiques du cache de prédictions."""
+
+    def collect(self) -> Iterator:
+        stats = prediction_cache.stats()
+
+        yield CounterMetricFamily(
+            "sentiment_cache_hits",
+            "Nombre de prédictions servies depuis le cache",
+            value=stats["hits"],
+        )
+        yield CounterMetricFamily(
+            "sentiment_cache_misses",
+            "Nombre de prédictions absentes du cache (passage du modèle)",
+            value=stats["misses"],
+        )
+        yield CounterMetricFamily(
+            "sentiment_cache_evictions",
+            "Nombre d'entrées évincées du cache (LRU ou TTL)",
+            value=stats["evictions"],
+        )
+        yield GaugeMetricFamily(
+            "sentiment_cache_size",
+            "Nombre d'entrées actuellement dans le cache",
+            value=stats["size"],
+        )
+
+
+class ModelLoadCollector(Collector):
+    """Collecteur Prometheus exposant la durée des phases de chargement du modèle."""
+
+    def collect(self) -> Iterator:
+        phases = GaugeMetricFamily(
+            "model_load_phase_seconds",
+            "Durée de chaque phase de chargement du modèle (construction, quantification, préchauffage)",
+            labels=["phase"],
+        )
+        for phase, seconds in dict(LOAD_TIMINGS).items():
+            phases.add_metric([phase], seconds)
+        yield phases
+
+        yield GaugeMetricFamily(
+            "model_ready",
+            "1 si le modèle est chargé et préchauffé, 0 sinon",
+            value=1 if is_model_ready() else 0,
+        )
+
+
+class InferenceQueueCollector(Collector):
+    """Collecteur Prometheus exposant l'état de la file d'inférence bornée."""
+
+    def collect(self) -> Iterator:
+        stats = inference_executor.stats()
+
+        depth = GaugeMetricFamily(
+            "inference_queue_depth",
+            "Nombre de requêtes en attente d'un thread d'inférence",
+            labels=["priority"],
+        )
+        rejected = CounterMetricFamily(
+            "inference_rejected",
+            "Nombre de requêtes refusées (HTTP 429) car la file d'inférence était pleine",
+            labels=["priority"],
+        )
+        for priority, value in stats["queue_depth"].items():
+            depth.add_metric([priority], value)
+        for priority, value in stats["rejected"].items():
+            rejected.add_metric([priority], value)
+        yield depth
+        yield rejected
+
+        yield GaugeMetricFamily(
+            "inference_queue_capacity",
+            "Taille maximale de chaque file d'inférence",
+            value=stats["queue_capacity"],
+        )
+        yield GaugeMetricFamily(
+            "inference_in_flight",
+            "Nombre de prédictions en cours d'exécution",
+            value=stats["active"],
+        )
+
+
+def register_inference_metrics() -> None:
+    """Enregistre les collecteurs d'inférence dans le registre Prometheus par défaut."""
+    REGISTRY.register(PredictionCacheCollector())
+    REGISTRY.register(ModelLoadCollector())
+    REGISTRY.register(InferenceQueueCollector())
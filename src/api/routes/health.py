@@ -0,0 +1,50 @@
+# File: src\api\routes\health.py
+
+"""
+Module FastAPI pour les sondes de santé de l'API (liveness / readiness).
+
+- '/health/live'  : le processus répond (utilisé pour redémarrer un conteneur bloqué)
+- '/health/ready' : le modèle est chargé et préchauffé (utilisé pour router le trafic) ;
+  en chargement paresseux ('MODEL_LOAD_ON_STARTUP' désactivé), l'API est prête immédiatement
+  et le modèle est chargé par la première requête
+"""
+
+from typing import Dict, Optional
+from fastapi import APIRouter, Response, status
+from machine_learning.predict import is_model_ready, get_model_load_error
+
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get(
+    "/health/live",
+    summary="Sonde de vivacité",
+    description="Retourne 200 dès que le processus de l'API répond, même si le modèle est en cours de chargement.",
+    response_description="Statut du processus",
+)
+def live() -> Dict[str, str]:
+    """Indique que le processus de l'API est vivant."""
+    return {"status": "alive"}
+
+
+@router.get(
+    "/health/ready",
+    summary="Sonde de disponibilité",
+    description=(
+        "Retourne 200 lorsque le modèle de sentiment est chargé et préchauffé (ou seulement chargé "
+        "si le préchauffage est désactivé, ou immédiatement en chargement paresseux), "
+        "503 tant qu'il est en cours de chargement ou si son chargement a échoué."
+    ),
+    response_description="Statut du modèle",
+)
+def ready(response: Response) -> Dict[str, Optional[str]]:
+    """Indique si l'API est prête à servir des prédictions."""
+    if is_model_ready():
+        return {"status": "ready"}
+
+    response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    error = get_model_load_error()
+    if error:
+        return {"status": "error", "detail": error}
+    return {"status": "loading"}
@@ -3,19 +3,76 @@
 """
 Module FastAPI pour la prédiction de sentiment des avis clients.
 
-Ce module expose un endpoint permettant d'analyser un texte d'avis client
-et de retourner un sentiment (Négatif, Neutre ou Positif) à l'aide
+Ce module expose des endpoints permettant d'analyser un ou plusieurs textes
+d'avis clients et de retourner un sentiment (Négatif, Neutre ou Positif) à l'aide
 d'un modèle de Machine Learning.
 """
 
-from fastapi import APIRouter, HTTPException
-from api.schemas import PredictRequest, PredictResponse
-from machine_learning.predict import predict_sentiment
+import asyncio
+import time
+from typing import Any, Callable, Literal
+from fastapi import APIRouter, Header, HTTPException
+from api.config import INFERENCE_RETRY_AFTER_SECONDS, REQUEST_CLASS_HEADER
+from api.inference_executor import inference_executor, QueueFullError, INTERACTIVE, BULK
+from api.metrics import INFERENCE_LATENCY
+from api.schemas import (
+    PredictRequest,
+    PredictResponse,
+    PredictBatchRequest,
+    PredictBatchResponse,
+    ModelVersionResponse,
+)
+from machine_learning.predict import model_version, predict_sentiment, predict_sentiment_batch
 
 
 # Création du routeur pour les endpoints liés à la prédiction
 router = APIRouter(tags=["Predict ML"])
 
+# Classe de priorité d'une requête, lue dans l'en-tête 'X-Request-Class'
+# (valeurs de 'PRIORITY_CLASSES', partagées avec l'ETL)
+RequestClass = Literal["interactive", "bulk"]
+
+
+async def run_inference(fn: Callable, *args: Any, priority: str = INTERACTIVE) -> Any:
+    """
+    Exécute une fonction de prédiction dans la file d'inférence bornée de sa classe de priorité.
+
+    Parameters
+    ----------
+    fn : Callable
+        Fonction de prédiction à exécuter.
+
+    *args
+        Arguments transmis à 'fn'.
+
+    priority : str, optionnel
+        Classe de priorité : 'interactive' (par défaut) ou 'bulk'.
+
+    Returns
+    -------
+    Any
+        Le résultat de 'fn'.
+
+    Raises
+    ------
+    HTTPException
+        Erreur HTTP 429 (avec en-tête Retry-After) si la file d'inférence est pleine.
+    """
+    start = time.perf_counter()
+    try:
+        future = inference_executor.submit(fn, *args, priority=priority)
+    except QueueFullError as error:
+        raise HTTPException(
+            status_code=429,
+            detail=str(error),
+            headers={"Retry-After": str(INFERENCE_RETRY_AFTER_SECONDS)},
+        )
+    try:
+        return await asyncio.wrap_future(future)
+    finally:
+        # Latence attente comprise, par classe de priorité
+        INFERENCE_LATENCY.labels(priority=priority).observe(time.perf_counter() - start)
+
 
 # Endpoint pour prédire le sentiment d'un avis client
 @router.post(
@@ -26,7 +83,10 @@ router = APIRouter(tags=["Predict ML"])
     response_model=PredictResponse,
 )
 # ajout de la fonction de gestion de la route
-def predict(request: PredictRequest) -> PredictResponse:
+async def predict(
+    request: PredictRequest,
+    request_class: RequestClass = Header(INTERACTIVE, alias=REQUEST_CLASS_HEADER),
+) -> PredictResponse:
     """
     Endpoint FastAPI permettant de prédire le sentiment d'un avis client.
 
@@ -41,6 +101,9 @@ def predict(request: PredictRequest) -> PredictResponse:
     request : PredictRequest
         Objet contenant le texte de l'avis client à analyser.
 
+    request_class : str, optionnel
+        Classe de priorité (en-tête 'X-Request-Class') : 'interactive' (par défaut) ou 'bulk'.
+
     Returns
     -------
     PredictResponse
@@ -51,9 +114,77 @@ def predict(request: PredictRequest) -> PredictResponse:
     Raises
     ------
     HTTPException
-        Erreur HTTP 400 si le texte fourni est vide ou non valide.
+        Erreur HTTP 400 si le texte fourni est vide ou non valide,
+        erreur HTTP 429 si la file d'inférence est pleine.
     """
     try:
-        return predict_sentiment(request.text)
+        return await run_inference(predict_sentiment, request.text, priority=request_class)
     except ValueError as error:
         raise HTTPException(status_code=400, detail=str(error))
+
+
+# Endpoint pour prédire le sentiment d'une liste d'avis clients
+@router.post(
+    "/predict/batch",
+    summary="Prédire le sentiment d'une liste d'avis clients",
+    description=(
+        "Cette endpoint prend en entrée une liste de textes d'avis clients et retourne, pour chacun, "
+        "le sentiment prédit. Les textes sont envoyés au modèle par lots ; une erreur sur un texte "
+        "est retournée dans l'élément concerné sans faire échouer la requête."
+    ),
+    response_description="Les sentiments prédits, dans l'ordre des textes fournis",
+    response_model=PredictBatchResponse,
+)
+async def predict_batch(
+    request: PredictBatchRequest,
+    request_class: RequestClass = Header(BULK, alias=REQUEST_CLASS_HEADER),
+) -> PredictBatchResponse:
+    """
+    Endpoint FastAPI permettant de prédire le sentiment d'une liste d'avis clients.
+
+    Parameters
+    ----------
+    request : PredictBatchRequest
+        Objet contenant la liste des textes à analyser et, optionnellement,
+        la taille des lots envoyés au modèle.
+
+    request_class : str, optionnel
+        Classe de priorité (en-tête 'X-Request-Class') : 'bulk' (par défaut) ou 'interactive'.
+
+    Returns
+    -------
+    PredictBatchResponse
+        Objet contenant un résultat par texte (index, text_clean, sentiment, error)
+        et la version du modèle ayant produit les prédictions.
+
+    Raises
+    ------
+    HTTPException
+        Erreur HTTP 429 si la file d'inférence est pleine.
+    """
+    results = await run_inference(
+        predict_sentiment_batch, request.texts, request.batch_size, priority=request_class)
+    return PredictBatchResponse(results=results, model_version=model_version())
+
+
+# Endpoint pour connaître la version du modèle servi
+@router.get(
+    "/predict/model",
+    summary="Version du modèle de sentiment",
+    description=(
+        "Retourne la version du modèle servi (modèle, backend d'inférence et quantification), "
+        "sans appel au modèle. Les prédictions d'une autre version ne sont pas réutilisées par l'ETL."
+    ),
+    response_description="La version du modèle",
+    response_model=ModelVersionResponse,
+)
+def get_model_version() -> ModelVersionResponse:
+    """
+    Endpoint FastAPI retournant la version du modèle de sentiment servi.
+
+    Returns
+    -------
+    ModelVersionResponse
+        Objet contenant la version du modèle ("<modèle>|<backend>|<quantification>").
+    """
+    return ModelVersionResponse(model_version=model_version())
@@ -4,13 +4,40 @@
 Module des schémas pour les requêtes et réponses de l'API
 """
 
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from machine_learning.config import PREDICT_BATCH_MAX_ITEMS
 
 
 class PredictResponse(BaseModel):
     text_clean: str
     sentiment: str
+    # Probabilités de 1 à 5 étoiles
+    star_probabilities: Optional[List[float]] = None
 
 
 class PredictRequest(BaseModel):
     text: str
+
+
+class PredictBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=PREDICT_BATCH_MAX_ITEMS)
+    batch_size: Optional[int] = Field(None, ge=1, le=256)
+
+
+class PredictBatchItem(BaseModel):
+    index: int
+    text_clean: Optional[str] = None
+    sentiment: Optional[str] = None
+    star_probabilities: Optional[List[float]] = None
+    error: Optional[str] = None
+
+
+class PredictBatchResponse(BaseModel):
+    results: List[PredictBatchItem]
+    # Version du modèle ayant produit les prédictions
+    model_version: Optional[str] = None
+
+
+class ModelVersionResponse(BaseModel):
+    model_version: str
@@ -0,0 +1,65 @@
+# File: src\benchmarks\bench_anonymizer.py
+
+"""
+Benchmark de l'anonymisation des avis (caractères par seconde)
+--------------------------------------------------------------
+Compare, sur un échantillon d'avis :
+- "legacy"   : six appels 're.sub' non compilés par texte (implémentation d'origine),
+- "compiled" : moteur de règles précompilées avec tests rapides, texte par texte,
+- "parallel" : 'anonymize_texts' réparti sur plusieurs processus.
+
+Usage :
+------
+python -m benchmarks.bench_anonymizer --texts 20000 --workers 4
+"""
+
+import argparse
+import os
+import re
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+from benchmarks.bench_utils import sample_texts, write_results
+from etl.transform.anonymizer import ANONYMIZATION_RULES, anonymize_text, anonymize_texts
+
+
+def legacy_anonymize_text(text: str) -> str:
+    """Anonymisation d'origine : expressions passées à 're.sub' à chaque appel."""
+    for pattern, replacement, _ in ANONYMIZATION_RULES:
+        text = re.sub(pattern.pattern, replacement, text, flags=pattern.flags)
+    return text
+
+
+def measure(run: Callable[[List[str]], List[str]], texts: List[str]) -> Dict[str, float]:
+    """Mesure le débit (caractères par seconde) d'une fonction d'anonymisation par lots."""
+    start = time.perf_counter()
+    run(texts)
+    elapsed = time.perf_counter() - start
+    return {"seconds": round(elapsed, 3), "chars_per_second": round(sum(map(len, texts)) / elapsed)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Débit de l'anonymisation des avis")
+    parser.add_argument("--texts", type=int, default=20000, help="Nombre de textes")
+    parser.add_argument("--workers", type=int, default=0, help="Processus du mode parallèle (0 : cœurs)")
+    parser.add_argument("--sample", type=str, default=None, help="Fichier JSONL d'avis (optionnel)")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join("benchmarks", "results", f"anonymizer_{datetime.now():%Y%m%d_%H%M%S}.json"),
+        help="Fichier JSON des résultats",
+    )
+    args = parser.parse_args()
+
+    texts = sample_texts(args.texts, path=args.sample)
+
+    results = {
+        "texts": len(texts),
+        "chars": sum(map(len, texts)),
+        "legacy": measure(lambda batch: [legacy_anonymize_text(text) for text in batch], texts),
+        "compiled": measure(lambda batch: [anonymize_text(text) for text in batch], texts),
+        "parallel": measure(lambda batch: anonymize_texts(batch, workers=args.workers), texts),
+    }
+    for name, value in results.items():
+        print(f"{name} : {value}")
+    print(f"Résultats écrits dans {write_results(results, args.output)}")
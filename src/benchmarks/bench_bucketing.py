@@ -0,0 +1,59 @@
+# File: src\benchmarks\bench_bucketing.py
+
+"""
+Benchmark du regroupement des textes par longueur (length bucketing)
+--------------------------------------------------------------------
+Compare, sur une distribution de longueurs réaliste, le débit en tokens utiles par
+seconde lorsque les lots sont formés dans l'ordre d'arrivée ou après tri par longueur
+en tokens, ainsi que la part de padding calculée par le modèle.
+
+Usage :
+------
+python -m benchmarks.bench_bucketing --texts 512 --batch-sizes 8 16 32
+"""
+
+import argparse
+import time
+from typing import Dict, List
+from benchmarks.bench_utils import sample_texts
+from machine_learning.config import MODEL_MAX_LENGTH
+from machine_learning.predict import _token_lengths, load_model
+
+
+def run_batches(model, texts: List[str], lengths: List[int], order: List[int], batch_size: int) -> Dict[str, float]:
+    """Exécute le modèle sur les lots formés selon 'order' et mesure le débit."""
+    padded_tokens = 0
+    start = time.perf_counter()
+    for position in range(0, len(order), batch_size):
+        chunk = order[position:position + batch_size]
+        model([texts[index] for index in chunk], batch_size=len(chunk), max_length=MODEL_MAX_LENGTH)
+        padded_tokens += max(lengths[index] for index in chunk) * len(chunk)
+    elapsed = time.perf_counter() - start
+
+    useful_tokens = sum(lengths)
+    return {
+        "seconds": round(elapsed, 3),
+        "tokens_per_second": round(useful_tokens / elapsed, 1),
+        "padding_ratio": round(1 - useful_tokens / padded_tokens, 3),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark du tri des lots par longueur")
+    parser.add_argument("--texts", type=int, default=512, help="Nombre de textes de l'échantillon")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 16, 32], help="Tailles de lots")
+    parser.add_argument("--sample", type=str, default=None, help="Fichier JSONL d'avis (optionnel)")
+    args = parser.parse_args()
+
+    texts = sample_texts(args.texts, path=args.sample)
+    model = load_model(warmup=True)
+    lengths = _token_lengths(texts)
+    arrival_order = list(range(len(texts)))
+    bucketed_order = sorted(arrival_order, key=lambda index: lengths[index])
+
+    print(f"{len(texts)} textes, {sum(lengths)} tokens utiles, longueur max {max(lengths)} tokens")
+    for batch_size in args.batch_sizes:
+        unsorted = run_batches(model, texts, lengths, arrival_order, batch_size)
+        bucketed = run_batches(model, texts, lengths, bucketed_order, batch_size)
+        speedup = bucketed["tokens_per_second"] / unsorted["tokens_per_second"]
+        print(f"[batch {batch_size}] sans tri : {unsorted} | avec tri : {bucketed} | gain x{speedup:.2f}")
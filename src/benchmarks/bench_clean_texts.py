@@ -0,0 +1,79 @@
+# File: src\benchmarks\bench_clean_texts.py
+
+"""
+Benchmark du nettoyage des textes : 'DataUtils.clean_text' vs 'DataUtils.clean_texts'
+------------------------------------------------------------------------------------
+Nettoie une colonne de textes représentative de la transformation (avis, réponses,
+identifiants ; majorité ASCII, une part de textes accentués ou à normaliser) texte par
+texte puis en une passe, et vérifie que les deux résultats sont identiques.
+
+Usage :
+------
+python -m benchmarks.bench_clean_texts --texts 100000
+"""
+
+import argparse
+import os
+import random
+import time
+from datetime import datetime
+from typing import List, Optional
+from benchmarks.bench_utils import sample_texts, write_results
+from etl.utils.data_utils import DataUtils
+
+
+def build_column(n: int, seed: int = 42) -> List[Optional[str]]:
+    """Colonne de 'n' textes : avis, identifiants ASCII, textes à normaliser et valeurs vides."""
+    rng = random.Random(seed)
+    reviews = sample_texts(min(n, 2000), seed=seed)
+    column: List[Optional[str]] = []
+    for index in range(n):
+        draw = rng.random()
+        if draw < 0.35:
+            column.append(f"  {rng.getrandbits(96):024x}  ")                   # identifiant ASCII
+        elif draw < 0.45:
+            column.append(None)                                                  # champ absent
+        elif draw < 0.55:
+            column.append("Livraison rapide, ﬁable\n\nMerci !")   # texte à normaliser
+        else:
+            column.append(reviews[index % len(reviews)])                         # avis (accentué)
+    return column
+
+
+def measure(run, column) -> dict:
+    """Durée et débit d'un nettoyage de la colonne."""
+    start = time.perf_counter()
+    run(column)
+    elapsed = time.perf_counter() - start
+    return {"seconds": round(elapsed, 3), "texts_per_second": round(len(column) / elapsed)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nettoyage des textes texte par texte vs par colonne")
+    parser.add_argument("--texts", type=int, default=100000, help="Nombre de textes")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join("benchmarks", "results", f"clean_texts_{datetime.now():%Y%m%d_%H%M%S}.json"),
+        help="Fichier JSON des résultats",
+    )
+    args = parser.parse_args()
+
+    column = build_column(args.texts)
+    assert DataUtils.clean_texts(column) == [DataUtils.clean_text(text) for text in column]
+
+    ascii_column = [text for text in column if text and text.isascii()]
+    results = {
+        "texts": len(column),
+        "clean_text": measure(lambda texts: [DataUtils.clean_text(text) for text in texts], column),
+        "clean_texts": measure(DataUtils.clean_texts, column),
+        "ascii_only": {
+            "texts": len(ascii_column),
+            "clean_text": measure(lambda texts: [DataUtils.clean_text(text) for text in texts], ascii_column),
+            "clean_texts": measure(DataUtils.clean_texts, ascii_column),
+        },
+    }
+    results["speedup"] = round(results["clean_text"]["seconds"] / results["clean_texts"]["seconds"], 2)
+    for name, value in results.items():
+        print(f"{name} : {value}")
+    print(f"Résultats écrits dans {write_results(results, args.output)}")
@@ -0,0 +1,97 @@
+# File: src\benchmarks\bench_cold_start.py
+
+"""
+Benchmark du démarrage à froid : temps jusqu'à la première prédiction
+-----------------------------------------------------------------------
+Lance plusieurs processus neufs pour chaque variante de chargement du modèle torch :
+- "hub"      : pipeline construit depuis le cache Hugging Face (MODEL_USE_ARTIFACT=false),
+- "artifact" : artefact safetensors (mmap) + tokenizer rapide de 'build_artifact.py',
+et mesure le temps jusqu'à la première prédiction (démarrage de l'interpréteur compris)
+ainsi que la durée de construction du modèle. L'artefact est construit s'il manque.
+
+Usage :
+------
+HF_HUB_OFFLINE=1 python -m benchmarks.bench_cold_start --runs 5
+"""
+
+import time
+
+# Chronomètre du processus enfant, démarré avant tout import lourd
+_PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from benchmarks.bench_utils import write_results
+
+
+VARIANTS = {"hub": "false", "artifact": "true"}
+
+
+def child() -> None:
+    """Charge le modèle, prédit un texte et affiche les durées mesurées (JSON)."""
+    from machine_learning import predict
+
+    predict.load_model(warmup=False)
+    predict.get_model()("Premier avis après démarrage.")
+    print(json.dumps({
+        "model_build_seconds": predict.LOAD_TIMINGS.get("model_build"),
+        "time_to_first_prediction_seconds": time.perf_counter() - _PROCESS_START,
+    }))
+
+
+def run_variant(use_artifact: str, runs: int) -> dict:
+    """Mesure 'runs' démarrages à froid d'une variante, chacun dans un nouveau processus."""
+    env = dict(os.environ, MODEL_USE_ARTIFACT=use_artifact, INFERENCE_BACKEND="torch")
+    wall, build, first_prediction = [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_cold_start", "--child"],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        wall.append(time.perf_counter() - start)
+        measures = json.loads(output.strip().splitlines()[-1])
+        build.append(measures["model_build_seconds"])
+        first_prediction.append(measures["time_to_first_prediction_seconds"])
+
+    return {
+        "runs": runs,
+        "model_build_seconds_median": round(statistics.median(build), 3),
+        "time_to_first_prediction_seconds_median": round(statistics.median(first_prediction), 3),
+        "process_wall_seconds_median": round(statistics.median(wall), 3),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage à froid du modèle")
+    parser.add_argument("--runs", type=int, default=5, help="Nombre de démarrages par variante")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join("benchmarks", "results", f"cold_start_{datetime.now():%Y%m%d_%H%M%S}.json"),
+        help="Fichier JSON des résultats",
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        sys.exit(0)
+
+    from machine_learning.config import MODEL_NAME, MODEL_ARTIFACT_DIR
+    from machine_learning.model_artifact import build_model_artifact
+    build_model_artifact(MODEL_NAME, MODEL_ARTIFACT_DIR)
+
+    results = {name: run_variant(use_artifact, args.runs) for name, use_artifact in VARIANTS.items()}
+    results["speedup"] = round(
+        results["hub"]["time_to_first_prediction_seconds_median"]
+        / results["artifact"]["time_to_first_prediction_seconds_median"], 2)
+
+    for name, value in results.items():
+        print(f"{name} : {value}")
+    print(f"Résultats écrits dans {write_results(results, args.output)}")
@@ -0,0 +1,120 @@
+# File: src\benchmarks\bench_inference.py
+
+"""
+Benchmark de l'inférence de sentiment ('machine_learning.predict')
+------------------------------------------------------------------
+Mesure, hors ligne sur le modèle du cache local et avec le backend configuré
+(INFERENCE_BACKEND / INFERENCE_QUANTIZATION) :
+- le démarrage à froid (import, construction du modèle, première prédiction),
+- la latence unitaire de 'predict_sentiment' (percentiles, cache désactivé),
+- le débit par lots pour plusieurs tailles de lots et tranches de longueur de texte,
+- la mémoire résidente (RSS actuelle et pic).
+
+Les résultats sont écrits en JSON (avec les métadonnées d'exécution) pour comparer
+les exécutions dans le temps et entre backends.
+
+Usage :
+------
+HF_HUB_OFFLINE=1 python -m benchmarks.bench_inference --texts 300 --batch-sizes 1 8 32
+INFERENCE_BACKEND=onnx python -m benchmarks.bench_inference --output benchmarks/results/onnx.json
+"""
+
+import time
+
+# Chronomètre démarré avant l'import du module de prédiction (démarrage à froid complet)
+_PROCESS_START = time.perf_counter()
+
+import argparse
+import os
+from datetime import datetime
+from typing import Any, Dict, List
+from benchmarks.bench_utils import current_rss_mb, latency_summary, peak_rss_mb, sample_texts, write_results
+from machine_learning import predict
+from machine_learning.config import INFERENCE_BACKEND, MODEL_MAX_LENGTH
+
+
+# Tranches de longueur (en tokens) pour le débit par lots
+LENGTH_BUCKETS = {"short": (0, 64), "medium": (64, 256), "long": (256, MODEL_MAX_LENGTH + 1)}
+
+
+def measure_cold_start() -> Dict[str, float]:
+    """Mesure le chargement du modèle et la première prédiction."""
+    import_seconds = time.perf_counter() - _PROCESS_START
+
+    start = time.perf_counter()
+    predict.load_model(warmup=False)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predict.get_model()("Premier avis après démarrage.", max_length=MODEL_MAX_LENGTH)
+    first_prediction_seconds = time.perf_counter() - start
+
+    return {
+        "import_seconds": round(import_seconds, 3),
+        "load_seconds": round(load_seconds, 3),
+        "first_prediction_seconds": round(first_prediction_seconds, 3),
+        "time_to_first_prediction_seconds": round(time.perf_counter() - _PROCESS_START, 3),
+    }
+
+
+def measure_single_latency(texts: List[str]) -> Dict[str, float]:
+    """Mesure la latence de 'predict_sentiment' texte par texte (nettoyage compris)."""
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        predict.predict_sentiment(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latency_summary(latencies)
+
+
+def measure_batch_throughput(texts: List[str], batch_sizes: List[int]) -> Dict[str, Dict[str, Any]]:
+    """Mesure le débit de 'predict_sentiment_batch' par tranche de longueur et taille de lot."""
+    lengths = predict._token_lengths(texts)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for bucket, (low, high) in LENGTH_BUCKETS.items():
+        bucket_texts = [text for text, length in zip(texts, lengths) if low <= length < high]
+        if not bucket_texts:
+            continue
+        results[bucket] = {"texts": len(bucket_texts)}
+        for batch_size in batch_sizes:
+            start = time.perf_counter()
+            predict.predict_sentiment_batch(bucket_texts, batch_size=batch_size)
+            elapsed = time.perf_counter() - start
+            results[bucket][f"batch_{batch_size}_texts_per_second"] = round(len(bucket_texts) / elapsed, 2)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de l'inférence de sentiment")
+    parser.add_argument("--texts", type=int, default=300, help="Nombre de textes de l'échantillon")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32], help="Tailles de lots")
+    parser.add_argument("--sample", type=str, default=None, help="Fichier JSONL d'avis (optionnel)")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join(
+            "benchmarks", "results", f"inference_{INFERENCE_BACKEND}_{datetime.now():%Y%m%d_%H%M%S}.json"),
+        help="Fichier JSON des résultats",
+    )
+    args = parser.parse_args()
+
+    # Les mesures portent sur le modèle : le cache de prédictions est désactivé
+    predict.prediction_cache.max_size = 0
+
+    cold_start = measure_cold_start()
+    predict.warmup_model()
+    texts = sample_texts(args.texts, path=args.sample)
+
+    results = {
+        "texts": len(texts),
+        "cold_start": cold_start,
+        "single_latency_ms": measure_single_latency(texts),
+        "batch_throughput": measure_batch_throughput(texts, args.batch_sizes),
+        "rss_mb": current_rss_mb(),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+    for name, value in results.items():
+        print(f"{name} : {value}")
+    print(f"Résultats écrits dans {write_results(results, args.output)}")
@@ -0,0 +1,70 @@
+# File: src\benchmarks\bench_sentiment_modes.py
+
+"""
+Comparaison du débit de la transformation selon le mode de prédiction du sentiment
+---------------------------------------------------------------------------------
+Transforme le même lot d'avis synthétiques en mode "http" (API FastAPI, lots parallèles)
+puis en mode "local" (modèle chargé dans le processus) et rapporte le nombre d'avis
+transformés par seconde. Le mode "http" nécessite une API démarrée (PREDICT_BATCH_API_URL).
+
+Usage :
+------
+PREDICT_BATCH_API_URL=http://localhost:8000/predict/batch python -m benchmarks.bench_sentiment_modes --reviews 2000
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+from benchmarks.bench_utils import sample_texts, write_results
+from etl.transform.transform_reviews import transform_reviews_for_elasticsearch
+
+
+def make_raw_reviews(n: int) -> List[Dict[str, Any]]:
+    """Construit une extraction brute (format du scraper) de 'n' avis synthétiques."""
+    reviews = [
+        {"id": f"review_{index}", "consumer": {"id": f"user_{index}"}, "text": text, "rating": 3}
+        for index, text in enumerate(sample_texts(n))
+    ]
+    return [{"enterprise_url": "www.example.com", "enterprise": {"name": "Example"}, "reviews": reviews}]
+
+
+def run_mode(raw: List[Dict[str, Any]], mode: str) -> Dict[str, float]:
+    """Transforme l'extraction dans un mode donné et mesure le débit."""
+    nb_reviews = sum(len(item["reviews"]) for item in raw)
+    start = time.perf_counter()
+    documents = transform_reviews_for_elasticsearch(raw, sentiment_mode=mode)
+    elapsed = time.perf_counter() - start
+    undefined = sum(document["user_sentiment"] == "Indéfini" for document in documents)
+    return {
+        "seconds": round(elapsed, 3),
+        "reviews_per_second": round(nb_reviews / elapsed, 1),
+        "undefined_sentiments": undefined,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Débit de la transformation : mode http vs local")
+    parser.add_argument("--reviews", type=int, default=2000, help="Nombre d'avis transformés")
+    parser.add_argument("--modes", nargs="+", default=["http", "local"], help="Modes comparés")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join("benchmarks", "results", f"sentiment_modes_{datetime.now():%Y%m%d_%H%M%S}.json"),
+        help="Fichier JSON des résultats",
+    )
+    args = parser.parse_args()
+
+    raw = make_raw_reviews(args.reviews)
+
+    # Le modèle local est chargé avant la mesure (coût de démarrage mesuré par bench_cold_start)
+    if "local" in args.modes:
+        from machine_learning.predict import load_model
+        load_model()
+
+    results = {"reviews": args.reviews}
+    for mode in args.modes:
+        results[mode] = run_mode(raw, mode)
+        print(f"[{mode}] {results[mode]}")
+    print(f"Résultats écrits dans {write_results(results, args.output)}")
@@ -0,0 +1,122 @@
+# File: src\benchmarks\bench_streaming_etl.py
+
+"""
+Benchmark de la mémoire de l'ETL : pipeline par étapes vs pipeline en flux
+--------------------------------------------------------------------------
+Pour plusieurs volumes d'extraction (nombre de pages de 20 avis), lance un processus neuf
+par mode et mesure le pic de RSS :
+- "batch"     : toutes les pages, puis tous les documents, puis toutes les actions en mémoire,
+- "streaming" : 'run_streaming_pipeline' (files bornées entre les étapes).
+L'extraction est simulée (pages synthétiques) et le sentiment est prédit par le backend
+"stub" dans le processus ; le chargement écrit le fichier d'audit JSONL et construit les
+actions bulk sans les envoyer.
+
+Usage :
+------
+python -m benchmarks.bench_streaming_etl --pages 100 400 1600
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+from benchmarks.bench_utils import peak_rss_mb, sample_texts, write_results
+
+
+REVIEWS_PER_PAGE = 20
+
+
+def make_page(number: int, texts: List[str]) -> Dict[str, Any]:
+    """Construit une page brute synthétique (même forme que 'iter_review_pages')."""
+    return {
+        "enterprise_url": "www.entreprise.com",
+        "enterprise": {"name": "Entreprise", "ratings": {"total": 10, "one": 2, "five": 8}},
+        "reviews": [
+            {
+                "id": f"review_{number}_{index}",
+                "consumer": {"id": f"user_{index}"},
+                "text": texts[(number * REVIEWS_PER_PAGE + index) % len(texts)],
+                "rating": 1 + index % 5,
+                "dates": {"publishedDate": "2024-03-01T10:00:00.000Z"},
+                "reply": {"message": "Merci pour votre retour.", "publishedDate": "2024-03-02T09:00:00.000Z"},
+                "labels": {"verification": {"isVerified": True}},
+            }
+            for index in range(REVIEWS_PER_PAGE)
+        ],
+    }
+
+
+def child(mode: str, pages: int) -> None:
+    """Exécute un mode du pipeline puis affiche le pic de RSS et la durée (JSON)."""
+    from etl.load.elasticsearch_bulk_loader import _bulk_actions
+    from etl.pipeline.streaming_etl import run_streaming_pipeline
+    from etl.transform.transform_reviews import transform_reviews_for_elasticsearch
+    from etl.utils.files_utils import FileUtils
+
+    texts = sample_texts(500)
+    audit_path = os.path.join(tempfile.mkdtemp(), "reviews.jsonl")
+
+    def transform(page_list):
+        return transform_reviews_for_elasticsearch(page_list, sentiment_mode="local")
+
+    start = time.perf_counter()
+    if mode == "batch":
+        raw = [make_page(number, texts) for number in range(pages)]
+        documents = transform(raw)
+        FileUtils.append_to_jsonl(documents, audit_path)
+        actions = _bulk_actions(documents, "reviews", True)
+        total = len(actions)
+    else:
+        async def page_source():
+            for number in range(pages):
+                yield make_page(number, texts)
+                await asyncio.sleep(0)
+
+        total = asyncio.run(run_streaming_pipeline(
+            page_source(),
+            lambda page: transform([page]),
+            [lambda docs: FileUtils.append_to_jsonl(docs, audit_path),
+             lambda docs: _bulk_actions(docs, "reviews", True)],
+        ))
+    print(json.dumps({
+        "documents": total,
+        "seconds": round(time.perf_counter() - start, 3),
+        "peak_rss_mb": peak_rss_mb(),
+    }))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pic mémoire de l'ETL par étapes vs en flux")
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 400, 1600], help="Volumes (pages)")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PAGES"), help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join("benchmarks", "results", f"streaming_etl_{datetime.now():%Y%m%d_%H%M%S}.json"),
+        help="Fichier JSON des résultats",
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], int(args.child[1]))
+        sys.exit(0)
+
+    env = dict(os.environ, INFERENCE_BACKEND="stub", SENTIMENT_STORE_ENABLED="false",
+               MODEL_WARMUP_ENABLED="false", PREDICTION_CACHE_SIZE="0")
+    results: Dict[str, Any] = {"reviews_per_page": REVIEWS_PER_PAGE, "runs": []}
+    for pages in args.pages:
+        for mode in ("batch", "streaming"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_streaming_etl", "--child", mode, str(pages)],
+                env=env, capture_output=True, text=True, check=True,
+            ).stdout
+            run = {"mode": mode, "pages": pages, **json.loads(output.strip().splitlines()[-1])}
+            results["runs"].append(run)
+            print(run)
+    print(f"Résultats écrits dans {write_results(results, args.output)}")
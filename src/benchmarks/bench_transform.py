@@ -0,0 +1,84 @@
+# File: src\benchmarks\bench_transform.py
+
+"""
+Benchmark de la transformation parallèle des avis
+-------------------------------------------------
+Mesure le débit (avis par seconde) du nettoyage, de l'anonymisation et du formatage
+des dates en fonction du moteur de transformation ("rows" ou "columnar") et du nombre
+de processus. La prédiction du sentiment n'est pas incluse (voir 'bench_sentiment_modes.py').
+
+Usage :
+------
+python -m benchmarks.bench_transform --reviews 50000 --workers 1 2 4 8 --engines rows columnar
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+from benchmarks.bench_utils import sample_texts, write_results
+from etl.transform.transform_reviews import _enterprise_fields, _transform_documents
+
+
+def build_raw(nb_reviews: int, nb_enterprises: int = 4) -> List[Dict[str, Any]]:
+    """Construit des extractions brutes synthétiques réparties sur plusieurs entreprises."""
+    texts = sample_texts(nb_reviews)
+    per_enterprise = max(1, nb_reviews // nb_enterprises)
+    raw_list = []
+    for start in range(0, nb_reviews, per_enterprise):
+        raw_list.append({
+            "enterprise_url": f"www.entreprise{start}.com",
+            "enterprise": {"name": f"Entreprise {start}", "ratings": {"total": 10, "one": 2, "five": 8}},
+            "reviews": [
+                {
+                    "id": f"review_{index}",
+                    "consumer": {"id": f"user_{index}"},
+                    "text": f"Bonjour Mme Martin,\n{texts[index]}\nJean Dupont",
+                    "rating": 1 + index % 5,
+                    "dates": {"publishedDate": "2024-03-01T10:00:00.000Z"},
+                    "reply": {"message": "Merci pour votre retour.", "publishedDate": "2024-03-02T09:00:00.000Z"},
+                    "labels": {"verification": {"isVerified": True}},
+                }
+                for index in range(start, min(nb_reviews, start + per_enterprise))
+            ],
+        })
+    return raw_list
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Débit de la transformation en fonction du nombre de processus")
+    parser.add_argument("--reviews", type=int, default=50000, help="Nombre d'avis")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Nombres de processus")
+    parser.add_argument("--engines", nargs="+", default=["rows", "columnar"], help="Moteurs de transformation")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join("benchmarks", "results", f"transform_{datetime.now():%Y%m%d_%H%M%S}.json"),
+        help="Fichier JSON des résultats",
+    )
+    args = parser.parse_args()
+
+    items = []
+    for raw in build_raw(args.reviews):
+        enterprise_fields = _enterprise_fields(raw)
+        items.extend((enterprise_fields, review) for review in raw["reviews"])
+
+    results: Dict[str, Any] = {"reviews": len(items), "runs": []}
+    baseline = None
+    for engine in args.engines:
+        for workers in args.workers:
+            start = time.perf_counter()
+            _transform_documents(items, workers, engine)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            run = {
+                "engine": engine,
+                "workers": workers,
+                "seconds": round(elapsed, 3),
+                "reviews_per_second": round(len(items) / elapsed, 1),
+                "speedup": round(baseline / elapsed, 2),
+            }
+            results["runs"].append(run)
+            print(run)
+    print(f"Résultats écrits dans {write_results(results, args.output)}")
@@ -0,0 +1,209 @@
+# File: src\benchmarks\bench_utils.py
+
+"""
+Module utilitaire commun aux scripts de benchmark.
+
+Fournit un échantillon d'avis reproductible (chargé depuis un export JSONL de l'ETL
+ou généré hors ligne avec une distribution de longueurs réaliste), le calcul
+des statistiques de latence et l'écriture des résultats au format JSON.
+"""
+
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Phrases types utilisées pour générer des avis synthétiques
+_SENTENCES = [
+    "Commande reçue rapidement, produit conforme à la description.",
+    "Livraison en retard de plus d'une semaine, aucune information du service client.",
+    "Très bon rapport qualité prix, je recommande.",
+    "Le colis est arrivé abîmé et le remboursement a pris un mois.",
+    "Service client joignable et efficace, problème résolu en deux jours.",
+    "Article de taille trop petite, retour gratuit mais procédure compliquée.",
+    "Ventes privées intéressantes mais les frais de port sont élevés.",
+    "Je suis déçu, la qualité n'est pas au rendez-vous.",
+    "Site facile à utiliser, paiement sécurisé, rien à redire.",
+    "Produit jamais reçu malgré plusieurs relances, très mécontent.",
+]
+
+
+def sample_texts(n: int = 200, seed: int = 42, path: Optional[str] = None) -> List[str]:
+    """
+    Retourne un échantillon reproductible de textes d'avis.
+
+    Parameters
+    ----------
+    n : int, optionnel
+        Nombre de textes souhaités. Par défaut, 200.
+
+    seed : int, optionnel
+        Graine aléatoire pour la reproductibilité. Par défaut, 42.
+
+    path : str, optionnel
+        Fichier JSONL produit par l'ETL (champ 'user_review'). Si absent, les avis sont
+        générés : la longueur suit une loi log-normale (majorité d'avis courts, quelques
+        avis très longs), comme les avis réels.
+
+    Returns
+    -------
+    List[str]
+        Liste de 'n' textes.
+    """
+    rng = random.Random(seed)
+
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            texts = [json.loads(line).get("user_review") for line in f]
+        texts = [text for text in texts if text and text != "indisponible"]
+        return [rng.choice(texts) for _ in range(n)]
+
+    texts = []
+    for _ in range(n):
+        nb_sentences = max(1, min(60, int(rng.lognormvariate(0.8, 0.9))))
+        texts.append(" ".join(rng.choice(_SENTENCES) for _ in range(nb_sentences)))
+    return texts
+
+
+def load_labelled_sample(path: str, n: int = 500, seed: int = 42) -> Tuple[List[str], List[int]]:
+    """
+    Charge un échantillon d'avis étiquetés (texte + note utilisateur) depuis un JSONL de l'ETL.
+
+    Parameters
+    ----------
+    path : str
+        Fichier JSONL produit par l'ETL (champs 'user_review' et 'user_rating').
+
+    n : int, optionnel
+        Nombre maximal d'avis retenus. Par défaut, 500.
+
+    seed : int, optionnel
+        Graine aléatoire pour la reproductibilité. Par défaut, 42.
+
+    Returns
+    -------
+    Tuple[List[str], List[int]]
+        Les textes et les notes utilisateur (1 à 5) correspondantes.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        docs = [json.loads(line) for line in f]
+    docs = [
+        doc for doc in docs
+        if doc.get("user_review") and doc["user_review"] != "indisponible" and doc.get("user_rating")
+    ]
+    random.Random(seed).shuffle(docs)
+    docs = docs[:n]
+    return [doc["user_review"] for doc in docs], [int(doc["user_rating"]) for doc in docs]
+
+
+def peak_rss_mb() -> float:
+    """
+    Retourne la mémoire résidente maximale (RSS) du processus courant, en Mo.
+
+    Returns
+    -------
+    float
+        Pic de RSS du processus, en mégaoctets.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS et en kilo-octets sous Linux
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def current_rss_mb() -> float:
+    """
+    Retourne la mémoire résidente actuelle (RSS) du processus, en Mo.
+
+    Lit '/proc/self/statm' (Linux) ; à défaut, retourne le pic de RSS.
+
+    Returns
+    -------
+    float
+        RSS actuelle du processus, en mégaoctets.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return round(resident_pages * resource.getpagesize() / (1024 * 1024), 1)
+    except (OSError, IndexError, ValueError):
+        return peak_rss_mb()
+
+
+def latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    """
+    Calcule les statistiques de latence (moyenne et percentiles).
+
+    Parameters
+    ----------
+    latencies_ms : List[float]
+        Latences mesurées, en millisecondes.
+
+    Returns
+    -------
+    Dict[str, float]
+        Dictionnaire contenant 'mean', 'p50', 'p90', 'p95' et 'p99' (en ms).
+    """
+    ordered = sorted(latencies_ms)
+
+    def percentile(p: float) -> float:
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    return {
+        "mean": round(statistics.fmean(ordered), 3),
+        "p50": round(percentile(50), 3),
+        "p90": round(percentile(90), 3),
+        "p95": round(percentile(95), 3),
+        "p99": round(percentile(99), 3),
+    }
+
+
+def run_metadata() -> Dict[str, Any]:
+    """
+    Décrit l'environnement d'exécution d'un benchmark (pour comparer des résultats).
+
+    Returns
+    -------
+    Dict[str, Any]
+        Date, machine, versions et configuration d'inférence (modèle, backend, quantification).
+    """
+    from machine_learning.config import INFERENCE_BACKEND, INFERENCE_QUANTIZATION, MODEL_NAME
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "model": MODEL_NAME,
+        "backend": INFERENCE_BACKEND,
+        "quantization": INFERENCE_QUANTIZATION,
+    }
+
+
+def write_results(results: Dict[str, Any], path: str) -> str:
+    """
+    Écrit les résultats d'un benchmark (et les métadonnées d'exécution) dans un fichier JSON.
+
+    Parameters
+    ----------
+    results : Dict[str, Any]
+        Résultats mesurés.
+
+    path : str
+        Chemin du fichier JSON à écrire (les dossiers sont créés si besoin).
+
+    Returns
+    -------
+    str
+        Chemin du fichier écrit.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"metadata": run_metadata(), "results": results}, f, ensure_ascii=False, indent=2)
+    return path
@@ -0,0 +1,134 @@
+# File: src\benchmarks\bench_workers.py
+
+"""
+Benchmark du débit de '/predict' en fonction du nombre de workers Gunicorn
+--------------------------------------------------------------------------
+Pour chaque nombre de workers, démarre l'API avec 'api/gunicorn_conf.py' (modèle chargé
+dans le maître puis partagé par fork), envoie des requêtes concurrentes pendant une durée
+fixe et rapporte les requêtes par seconde, la latence, ainsi que la mémoire totale :
+RSS (compte les pages partagées une fois par processus) et PSS (pages partagées réparties
+entre les processus, donc représentative de la RAM réellement consommée).
+
+Le cache de prédictions et le micro-batching sont désactivés pour mesurer le modèle seul.
+
+Usage (depuis src/) :
+------
+python -m benchmarks.bench_workers --workers 1 2 4 --duration 30
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List
+import httpx
+from benchmarks.bench_utils import latency_summary, sample_texts
+
+
+def process_tree(pid: int) -> List[int]:
+    """Retourne le pid du maître et ceux de ses processus enfants (Linux)."""
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children", "r") as f:
+            return [pid] + [int(child) for child in f.read().split()]
+    except OSError:
+        return [pid]
+
+
+def memory_mb(pids: List[int]) -> Dict[str, float]:
+    """Somme des RSS et PSS (en Mo) d'un ensemble de processus, via /proc/<pid>/smaps_rollup."""
+    totals = {"rss_mb": 0.0, "pss_mb": 0.0}
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+                for line in f:
+                    key, _, value = line.partition(":")
+                    if key in ("Rss", "Pss"):
+                        totals[f"{key.lower()}_mb"] += int(value.split()[0]) / 1024
+        except OSError:
+            continue
+    return {key: round(value, 1) for key, value in totals.items()}
+
+
+def wait_until_ready(url: str, workers: int, timeout: float = 300) -> None:
+    """Attend que '/health/ready' réponde 200 plusieurs fois de suite (tous les workers prêts)."""
+    deadline = time.monotonic() + timeout
+    successes = 0
+    while successes < workers * 4:
+        if time.monotonic() > deadline:
+            raise TimeoutError("L'API n'est pas prête dans le délai imparti")
+        try:
+            successes = successes + 1 if httpx.get(f"{url}/health/ready").status_code == 200 else 0
+        except httpx.HTTPError:
+            successes = 0
+        time.sleep(0.2)
+
+
+def load_test(url: str, texts: List[str], concurrency: int, duration: float) -> Dict[str, object]:
+    """Envoie des requêtes '/predict' concurrentes pendant 'duration' secondes."""
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def worker(offset: int) -> None:
+        with httpx.Client(base_url=url, timeout=60) as client:
+            index = offset
+            while time.monotonic() < stop_at:
+                start = time.perf_counter()
+                response = client.post("/predict", json={"text": texts[index % len(texts)]})
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    if response.status_code == 200:
+                        latencies.append(elapsed)
+                    else:
+                        errors[0] += 1
+                index += concurrency
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "requests_per_second": round(len(latencies) / duration, 2),
+        "latency_ms": latency_summary(latencies),
+        "errors": errors[0],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Débit de /predict en fonction du nombre de workers")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Nombres de workers testés")
+    parser.add_argument("--duration", type=float, default=30, help="Durée de chaque mesure (secondes)")
+    parser.add_argument("--concurrency", type=int, default=0, help="Clients simultanés (défaut : 4 x workers)")
+    parser.add_argument("--port", type=int, default=8765, help="Port d'écoute de l'API de test")
+    args = parser.parse_args()
+
+    texts = sample_texts(2000)
+    url = f"http://127.0.0.1:{args.port}"
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    for workers in args.workers:
+        env = {
+            **os.environ,
+            "API_WORKERS": str(workers),
+            "API_BIND": f"127.0.0.1:{args.port}",
+            "PREDICTION_CACHE_SIZE": "0",
+            "MICRO_BATCH_ENABLED": "false",
+            "PYTHONPATH": src_dir,
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "api/gunicorn_conf.py", "api.main:app"],
+            cwd=src_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_until_ready(url, workers)
+            result = load_test(url, texts, args.concurrency or 4 * workers, args.duration)
+            result.update(memory_mb(process_tree(server.pid)))
+            print(f"[{workers} worker(s)] {result}")
+        finally:
+            server.terminate()
+            server.wait(timeout=60)
@@ -0,0 +1,74 @@
+# File: src\benchmarks\compare_backends.py
+
+"""
+Comparaison de latence entre les backends d'inférence torch et ONNX Runtime
+-----------------------------------------------------------------------------
+Charge les deux backends sur le même modèle, vérifie que leurs labels concordent
+puis mesure la latence unitaire (percentiles) et le débit par lots.
+
+Usage :
+------
+python -m benchmarks.compare_backends --texts 200 --batch-size 16
+"""
+
+import argparse
+import time
+from transformers import pipeline, logging
+from benchmarks.bench_utils import sample_texts, latency_summary
+from machine_learning.config import MODEL_NAME, MODEL_MAX_LENGTH, ONNX_MODEL_DIR, ONNX_NUM_THREADS
+from machine_learning.onnx_backend import OnnxSentimentPipeline, export_to_onnx
+
+
+logging.set_verbosity_error()
+
+
+def benchmark_backend(model, texts, batch_size):
+    """Mesure la latence unitaire et le débit par lots d'un backend."""
+    # Préchauffage
+    model(texts[:4], batch_size=4, max_length=MODEL_MAX_LENGTH)
+
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        model(text, max_length=MODEL_MAX_LENGTH)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    model(texts, batch_size=batch_size, max_length=MODEL_MAX_LENGTH)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        "single": latency_summary(latencies),
+        "batch_texts_per_second": round(len(texts) / batch_seconds, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Comparaison des backends torch / ONNX")
+    parser.add_argument("--texts", type=int, default=200, help="Nombre de textes de l'échantillon")
+    parser.add_argument("--batch-size", type=int, default=16, help="Taille des lots pour le débit")
+    parser.add_argument("--sample", type=str, default=None, help="Fichier JSONL d'avis (optionnel)")
+    args = parser.parse_args()
+
+    texts = sample_texts(args.texts, path=args.sample)
+
+    export_to_onnx(MODEL_NAME, ONNX_MODEL_DIR)
+    backends = {
+        "torch": pipeline(task="sentiment-analysis", model=MODEL_NAME, tokenizer=MODEL_NAME, truncation=True),
+        "onnx": OnnxSentimentPipeline(ONNX_MODEL_DIR, num_threads=ONNX_NUM_THREADS),
+    }
+
+    # Concordance des labels entre les deux backends
+    labels = {
+        name: [output["label"] for output in model(texts, batch_size=args.batch_size, max_length=MODEL_MAX_LENGTH)]
+        for name, model in backends.items()
+    }
+    agreement = sum(a == b for a, b in zip(labels["torch"], labels["onnx"])) / len(texts)
+    print(f"Concordance des labels torch / onnx : {agreement:.2%}")
+
+    for name, model in backends.items():
+        result = benchmark_backend(model, texts, args.batch_size)
+        print(
+            f"[{name}] unitaire (ms) {result['single']} | "
+            f"lots de {args.batch_size} : {result['batch_texts_per_second']} textes/s"
+        )
@@ -0,0 +1,138 @@
+# File: src\benchmarks\quantization_report.py
+
+"""
+Rapport précision / latence / mémoire de la quantification INT8 dynamique
+-------------------------------------------------------------------------
+Score un échantillon d'avis avec le modèle fp32 puis avec le modèle INT8 (chaque variante
+dans un processus séparé pour mesurer sa mémoire propre) et rapporte :
+- la concordance des prédictions INT8 avec fp32 (étoiles et sentiment),
+- la justesse de chaque variante face à la note utilisateur (si l'échantillon est étiqueté),
+- le gain de latence (percentiles unitaires, débit par lots),
+- le gain mémoire (RSS après chargement et prédiction ; le pic de RSS est aussi rapporté,
+  la quantification au chargement passant brièvement par les poids fp32).
+
+Usage :
+------
+python -m benchmarks.quantization_report --sample reviews_20260101_000000.jsonl --backend torch
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import time
+from typing import Any, Dict, List
+from benchmarks.bench_utils import current_rss_mb, latency_summary, load_labelled_sample, peak_rss_mb, sample_texts
+from machine_learning.config import MODEL_NAME, MODEL_MAX_LENGTH, ONNX_MODEL_DIR, ONNX_NUM_THREADS
+
+
+def _stars(label: str) -> int:
+    """Convertit un label du modèle ("4 stars") en nombre d'étoiles."""
+    return int(label.split()[0])
+
+
+def _sentiment(stars: int) -> str:
+    """Regroupe un nombre d'étoiles en sentiment, comme 'convert_stars_to_sentiment'."""
+    return "Négatif" if stars <= 2 else "Neutre" if stars == 3 else "Positif"
+
+
+def _run_variant(backend: str, quantized: bool, texts: List[str], batch_size: int, results) -> None:
+    """Charge une variante du modèle, la mesure, et publie le résultat dans 'results'."""
+    from transformers import logging
+    logging.set_verbosity_error()
+
+    start = time.perf_counter()
+    if backend == "torch":
+        from transformers import pipeline
+        model = pipeline(task="sentiment-analysis", model=MODEL_NAME, tokenizer=MODEL_NAME, truncation=True)
+        if quantized:
+            from machine_learning.quantization import quantize_pipeline_int8
+            model = quantize_pipeline_int8(model)
+    else:
+        from machine_learning.onnx_backend import OnnxSentimentPipeline
+        model = OnnxSentimentPipeline(ONNX_MODEL_DIR, num_threads=ONNX_NUM_THREADS, quantized=quantized)
+    load_seconds = time.perf_counter() - start
+
+    # Préchauffage puis latence unitaire
+    model(texts[:4], batch_size=4, max_length=MODEL_MAX_LENGTH)
+    latencies = []
+    for text in texts[:200]:
+        start = time.perf_counter()
+        model(text, max_length=MODEL_MAX_LENGTH)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    # Débit par lots et labels pour la concordance
+    start = time.perf_counter()
+    outputs = model(texts, batch_size=batch_size, max_length=MODEL_MAX_LENGTH)
+    batch_seconds = time.perf_counter() - start
+    gc.collect()
+
+    results.put({
+        "load_seconds": round(load_seconds, 3),
+        "single_ms": latency_summary(latencies),
+        "batch_texts_per_second": round(len(texts) / batch_seconds, 2),
+        "rss_mb": current_rss_mb(),
+        "peak_rss_mb": peak_rss_mb(),
+        "stars": [_stars(output["label"]) for output in outputs],
+    })
+
+
+def measure(backend: str, quantized: bool, texts: List[str], batch_size: int) -> Dict[str, Any]:
+    """Exécute une variante dans un processus neuf (mesure mémoire isolée)."""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_run_variant, args=(backend, quantized, texts, batch_size, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def build_report(fp32: Dict[str, Any], int8: Dict[str, Any], ratings: List[int]) -> Dict[str, Any]:
+    """Compare les deux variantes et construit le rapport."""
+    n = len(fp32["stars"])
+    report: Dict[str, Any] = {
+        "texts": n,
+        "agreement_stars": round(sum(a == b for a, b in zip(fp32["stars"], int8["stars"])) / n, 4),
+        "agreement_sentiment": round(
+            sum(_sentiment(a) == _sentiment(b) for a, b in zip(fp32["stars"], int8["stars"])) / n, 4),
+        "speedup_single_p50": round(fp32["single_ms"]["p50"] / int8["single_ms"]["p50"], 2),
+        "speedup_single_p99": round(fp32["single_ms"]["p99"] / int8["single_ms"]["p99"], 2),
+        "speedup_batch": round(int8["batch_texts_per_second"] / fp32["batch_texts_per_second"], 2),
+        "rss_saving_mb": round(fp32["rss_mb"] - int8["rss_mb"], 1),
+    }
+    if ratings:
+        for name, variant in (("fp32", fp32), ("int8", int8)):
+            report[f"accuracy_sentiment_{name}"] = round(
+                sum(_sentiment(p) == _sentiment(r) for p, r in zip(variant["stars"], ratings)) / n, 4)
+    for name, variant in (("fp32", fp32), ("int8", int8)):
+        report[name] = {key: value for key, value in variant.items() if key != "stars"}
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rapport de quantification INT8 du modèle de sentiment")
+    parser.add_argument("--sample", type=str, default=None,
+                        help="JSONL de l'ETL (user_review, user_rating) ; sinon échantillon synthétique non étiqueté")
+    parser.add_argument("--texts", type=int, default=500, help="Nombre d'avis de l'échantillon")
+    parser.add_argument("--backend", choices=["torch", "onnx"], default="torch", help="Backend à évaluer")
+    parser.add_argument("--batch-size", type=int, default=16, help="Taille des lots pour le débit")
+    parser.add_argument("--output", type=str, default=None, help="Fichier JSON où écrire le rapport")
+    args = parser.parse_args()
+
+    if args.sample:
+        texts, ratings = load_labelled_sample(args.sample, args.texts)
+    else:
+        texts, ratings = sample_texts(args.texts), []
+
+    report = build_report(
+        measure(args.backend, False, texts, args.batch_size),
+        measure(args.backend, True, texts, args.batch_size),
+        ratings,
+    )
+    report["backend"] = args.backend
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
@@ -4,10 +4,97 @@
 Module pour configurer les constantes pour l'ETL (Elasticsearch et entreprises)
 """
 
+import os
 from typing import List, Dict
 
 
 ES_HOST: str = "http://elasticsearch:9200"
+
+# Dossier des données de l'ETL (extractions, JSONL, store des sentiments)
+ETL_DATA_DIR: str = os.getenv("ETL_DATA_DIR", "/opt/airflow/etl/data")
 ENTERPRISES: List[Dict[str, str]] = [
     {"enterprise_url": "www.showroomprive.com"}
-]
\ No newline at end of file
+]
+
+# Re-calcul du sentiment sans inférence ('etl/pipeline/rebucket_sentiment.py') : les seuils
+# sont comparés aux étoiles selon la règle choisie :
+# - "argmax"   : étoile la plus probable (règle de l'ingestion, 'convert_stars_to_sentiment')
+# - "expected" : note attendue (somme des étoiles pondérées par leur probabilité)
+SENTIMENT_BUCKET_RULE: str = os.getenv("SENTIMENT_BUCKET_RULE", "argmax").lower()
+SENTIMENT_NEGATIVE_MAX_STARS: float = 2.5
+SENTIMENT_POSITIVE_MIN_STARS: float = 3.5
+# Probabilité minimale de l'étoile la plus probable ; en dessous, le sentiment est "Indéfini"
+SENTIMENT_MIN_CONFIDENCE: float = 0.0
+
+
+# Mode de prédiction du sentiment dans la transformation :
+# - "http"  : appels à l'API FastAPI (par défaut, conteneur Airflow)
+# - "local" : modèle chargé dans le processus de l'ETL (machine_learning), sans appel HTTP
+SENTIMENT_MODE: str = os.getenv("SENTIMENT_MODE", "http").lower()
+
+# API de prédiction de sentiment (appelée par la transformation)
+PREDICT_API_URL: str = os.getenv("PREDICT_API_URL", "http://fastapi:8000/predict")
+PREDICT_BATCH_API_URL: str = os.getenv("PREDICT_BATCH_API_URL", "http://fastapi:8000/predict/batch")
+PREDICT_MODEL_API_URL: str = os.getenv("PREDICT_MODEL_API_URL", "http://fastapi:8000/predict/model")
+# Nombre d'avis par appel à /predict/batch et nombre d'appels simultanés
+SENTIMENT_CHUNK_SIZE: int = int(os.getenv("SENTIMENT_CHUNK_SIZE", "64"))
+SENTIMENT_MAX_CONCURRENCY: int = int(os.getenv("SENTIMENT_MAX_CONCURRENCY", "4"))
+# Classe de priorité des appels à l'API de prédiction, transmise dans l'en-tête 'REQUEST_CLASS_HEADER'
+# (définis une seule fois, utilisés aussi par l'API) : l'ETL est 'bulk', le frontend 'interactive'
+REQUEST_CLASS_HEADER: str = "X-Request-Class"
+REQUEST_CLASS_INTERACTIVE: str = "interactive"
+REQUEST_CLASS_BULK: str = "bulk"
+# Délai maximal d'un appel (en secondes) et nombre de nouvelles tentatives (erreurs réseau, 429, 502, 503, 504)
+SENTIMENT_TIMEOUT_SECONDS: float = float(os.getenv("SENTIMENT_TIMEOUT_SECONDS", "120"))
+SENTIMENT_MAX_RETRIES: int = int(os.getenv("SENTIMENT_MAX_RETRIES", "3"))
+
+# Store persistant des sentiments (SQLite) : un avis déjà scoré dont le texte n'a pas changé
+# n'est pas renvoyé au modèle. Seule l'empreinte du texte est conservée, jamais le texte.
+SENTIMENT_STORE_ENABLED: bool = os.getenv("SENTIMENT_STORE_ENABLED", "true").lower() in ("1", "true", "yes")
+SENTIMENT_STORE_PATH: str = os.getenv("SENTIMENT_STORE_PATH", os.path.join(ETL_DATA_DIR, "sentiment_store.sqlite3"))
+# Version du modèle de sentiment : un changement de modèle invalide les entrées du store.
+# Vide par défaut : version lue auprès du modèle réellement appelé (modèle, backend et
+# quantification, via 'PREDICT_MODEL_API_URL' ou le modèle local) ; une valeur la force
+SENTIMENT_MODEL_VERSION: str = os.getenv("SENTIMENT_MODEL_VERSION", "")
+# Compaction : entrées non relues depuis plus de N jours supprimées, taille maximale du store
+# ('0' : sans limite), et nombre d'entrées supprimées au-delà duquel le fichier est réécrit (VACUUM)
+SENTIMENT_STORE_MAX_AGE_DAYS: int = int(os.getenv("SENTIMENT_STORE_MAX_AGE_DAYS", "90"))
+SENTIMENT_STORE_MAX_ENTRIES: int = int(os.getenv("SENTIMENT_STORE_MAX_ENTRIES", "500000"))
+SENTIMENT_STORE_VACUUM_MIN_DELETED: int = int(os.getenv("SENTIMENT_STORE_VACUUM_MIN_DELETED", "10000"))
+
+# Anonymisation par lots : nombre de processus (0 : nombre de cœurs) et nombre total de
+# caractères à partir duquel un lot est réparti sur plusieurs processus
+ANONYMIZE_WORKERS: int = int(os.getenv("ANONYMIZE_WORKERS", "0"))
+ANONYMIZE_PARALLEL_MIN_CHARS: int = int(os.getenv("ANONYMIZE_PARALLEL_MIN_CHARS", "2000000"))
+
+# Transformation parallèle des gros volumes d'avis : nombre de processus (1 : transformation
+# séquentielle, 0 : nombre de cœurs), nombre d'avis par lot envoyé à un processus et nombre
+# minimal d'avis à partir duquel la transformation est répartie sur plusieurs processus
+TRANSFORM_WORKERS: int = int(os.getenv("TRANSFORM_WORKERS", "1"))
+TRANSFORM_CHUNK_SIZE: int = int(os.getenv("TRANSFORM_CHUNK_SIZE", "2000"))
+TRANSFORM_PARALLEL_MIN_REVIEWS: int = int(os.getenv("TRANSFORM_PARALLEL_MIN_REVIEWS", "5000"))
+
+# ETL en flux : les pages d'avis sont transformées et chargées dès leur extraction, via des
+# files bornées entre les étapes (contre-pression). Taille des files (en pages) et nombre de
+# pages demandées à l'avance par l'extraction
+ETL_STREAMING: bool = os.getenv("ETL_STREAMING", "false").lower() in ("1", "true", "yes")
+STREAM_QUEUE_SIZE: int = int(os.getenv("STREAM_QUEUE_SIZE", "4"))
+STREAM_PREFETCH_PAGES: int = int(os.getenv("STREAM_PREFETCH_PAGES", "4"))
+
+# Moteur de transformation des avis : "rows" (un document à la fois) ou "columnar"
+# (colonnes NumPy converties par opérations vectorisées, documents construits à la fin)
+TRANSFORM_ENGINE: str = os.getenv("TRANSFORM_ENGINE", "rows").lower()
+
+# Extraction concurrente des entreprises : nombre maximal de requêtes HTTP simultanées,
+# toutes destinations confondues et vers un même hôte
+SCRAPE_MAX_CONCURRENCY: int = int(os.getenv("SCRAPE_MAX_CONCURRENCY", "8"))
+SCRAPE_MAX_CONCURRENCY_PER_HOST: int = int(os.getenv("SCRAPE_MAX_CONCURRENCY_PER_HOST", "4"))
+
+# Durée de validité (en secondes) du 'buildId' Next.js mis en cache par la session de scraping.
+# Identique pour toutes les entreprises, il n'est récupéré qu'une fois par période
+SCRAPE_BUILD_ID_TTL: int = int(os.getenv("SCRAPE_BUILD_ID_TTL", "600"))
+
+# Extraction incrémentale : avis le plus récent déjà ingéré, par entreprise (store SQLite).
+# La pagination s'arrête à la première page ne contenant que des avis déjà vus
+SCRAPE_INCREMENTAL: bool = os.getenv("SCRAPE_INCREMENTAL", "true").lower() in ("1", "true", "yes")
+SCRAPE_STATE_PATH: str = os.getenv("SCRAPE_STATE_PATH", os.path.join(ETL_DATA_DIR, "scrape_state.sqlite3"))
@@ -6,16 +6,23 @@ Module pour scraper les avis d'une ou plusieurs entreprises.
 Ce module permet d'extraire les avis à partir de l'URL d'une entreprise,
 en utilisant l'API, tout en gérant la pagination et les erreurs éventuelles.
 
-Les avis sont récupérés par pages, avec un maximum configurable par entreprise.
+Les avis sont récupérés par pages, avec un maximum configurable par entreprise. Les entreprises
+sont extraites en parallèle ; le nombre de requêtes simultanées est borné globalement et par
+hôte ('ConcurrencyLimiter'). Une session de scraping ('ScrapeSession') partage le 'buildId' du
+site entre les entreprises et compte les requêtes effectuées.
 """
 
 import json
+import time
 import asyncio
-from typing import List, Dict
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
+from httpx import Response
 from loguru import logger
 from parsel import Selector
+from etl.utils.concurrency_limiter import ConcurrencyLimiter
+from etl.utils.high_water_marks import is_seen_review
 from etl.utils.http_client import HttpClient
-from etl.config.config import ENTERPRISES
+from etl.config.config import ENTERPRISES, SCRAPE_BUILD_ID_TTL, STREAM_PREFETCH_PAGES
 
 
 # Création d'un client HTTP pour effectuer les requêtes API
@@ -24,12 +31,99 @@ client = HttpClient.get_client()
 # Log des entreprises configurées pour l'extraction
 logger.info(f"Entreprises configurées : {[e['enterprise_url'] for e in ENTERPRISES]}")
 
+
+async def _request(method: str, url: str) -> Response:
+    """
+    Effectue une requête HTTP en respectant les limites de requêtes simultanées (globale et par hôte).
+
+    Parameters
+    ----------
+    method : str
+        Méthode du client HTTP ("get" ou "post").
+
+    url : str
+        URL de la requête.
+
+    Returns
+    -------
+    Response
+        La réponse HTTP.
+    """
+    async with ConcurrencyLimiter.get_limiter().limit(url):
+        return await getattr(client, method)(url)
+
+
+async def get_build_id(url_base: str) -> str:
+    """
+    Extrait le 'buildId' Next.js de la page HTML d'une entreprise.
+
+    Le 'buildId' identifie la version déployée du site : il est identique pour toutes les
+    entreprises et change à chaque déploiement.
+
+    Parameters
+    ----------
+    url_base : str
+        L'URL de la page de l'entreprise.
+
+    Returns
+    -------
+    str
+        Le 'buildId' de la page.
+
+    Raises
+    -----
+    RuntimeError
+        Si les données '__NEXT_DATA__' sont introuvables dans la page.
+    """
+    # Effectue une requête GET sur la page de l'entreprise pour récupérer son contenu
+    response = await _request("get", url_base)
+    selector = Selector(response.text)
+    # Extraction des données JSON contenues dans un script
+    raw_data = selector.xpath("//script[@id='__NEXT_DATA__']/text()").get()
+    if not raw_data:
+        # Lève une erreur si les données sont manquantes
+        raise RuntimeError(f"__NEXT_DATA__ introuvable sur {url_base}")
+    return json.loads(raw_data)["buildId"]
+
+
+def build_reviews_url_api(build_id: str, url_base: str) -> str:
+    """
+    Construit l'URL de l'API des avis d'une entreprise à partir du 'buildId'.
+
+    Parameters
+    ----------
+    build_id : str
+        Identifiant de build Next.js (voir 'get_build_id').
+
+    url_base : str
+        L'URL de la page de l'entreprise.
+
+    Returns
+    -------
+    str
+        L'URL complète de l'API pour récupérer les avis de l'entreprise.
+    """
+    # Récupération de l'ID de l'entreprise dans l'URL
+    business_unit = url_base.split("review/")[-1]
+
+    # Construction de l'URL de l'API interne(Next.js)
+    # - build_id      : identifiant dynamique de build extrait de la page HTML
+    # - business_unit : identifiant de l'entreprise
+    # - sort=recency  : tri des avis par date la plus récente
+    # - languages=fr  : récupération des avis en français uniquement
+    return (
+        f"https://www.trustpilot.com/_next/data/{build_id}/review/"
+        f"{business_unit}.json?sort=recency&businessUnit={business_unit}&languages=fr"
+    )
+
+
 async def get_reviews_url_api(url_base: str) -> str:
     """
     Génére l'URL de l'API pour récupérer les avis d'une entreprise.
 
     Cette fonction extrait dynamiquement le 'buildId' de la page HTML de l'entreprise
-    et construit l'URL de l'API pour accéder aux avis.
+    et construit l'URL de l'API pour accéder aux avis. Le 'buildId' n'est pas mis en cache :
+    pour plusieurs entreprises, utiliser 'ScrapeSession'.
 
     Parameters
     ----------
@@ -47,41 +141,260 @@ async def get_reviews_url_api(url_base: str) -> str:
         Si l'URL de l'API ne peut être générée (par exemple si le 'buildId' est introuvable).
     """
     try:
-        # Effectue une requête GET sur la page de l'entreprise pour récupérer son contenu
-        response = await client.get(url_base)
-        selector = Selector(response.text)
-        # Extraction des données JSON contenues dans un script
-        raw_data = selector.xpath("//script[@id='__NEXT_DATA__']/text()").get()
-        if not raw_data:
-            # Lève une erreur si les données sont manquantes
-            raise RuntimeError(f"__NEXT_DATA__ introuvable sur {url_base}")
-        
-        # Récupération du buildId à partir du JSON
-        build_id = json.loads(raw_data)["buildId"]
-        # Récupération de l'ID de l'entreprise dans l'URL
-        business_unit = url_base.split("review/")[-1]
-
-        # Construction de l'URL de l'API interne(Next.js)
-        # - build_id      : identifiant dynamique de build extrait de la page HTML
-        # - business_unit : identifiant de l'entreprise
-        # - sort=recency  : tri des avis par date la plus récente
-        # - languages=fr  : récupération des avis en français uniquement
-        url_api = (
-            f"https://www.trustpilot.com/_next/data/{build_id}/review/"
-            f"{business_unit}.json?sort=recency&businessUnit={business_unit}&languages=fr"
-        )
-        return url_api
+        return build_reviews_url_api(await get_build_id(url_base), url_base)
     except Exception as e:
         # Log l'erreur si l'URL ne peut être générée
         logger.exception(f"[get_reviews_url_api] Impossible de générer l'API URL pour {url_base}: {e}")
         raise
 
+
+class ScrapeSession:
+    """
+    Session de scraping partagée par les entreprises d'une même extraction.
+
+    Le 'buildId' (commun à tout le site) est récupéré une seule fois puis conservé pendant
+    'SCRAPE_BUILD_ID_TTL' secondes ; il est renouvelé avant expiration si l'API répond 404
+    (nouveau déploiement). La première page d'avis d'une entreprise fournit à la fois les avis
+    et les informations de l'entreprise : une page HTML par session et une requête par page
+    d'avis, au lieu de deux pages HTML et de deux premières pages par entreprise.
+    """
+
+    def __init__(self, build_id_ttl: Optional[float] = None):
+        """
+        Parameters
+        ----------
+        build_id_ttl : float, optionnel
+            Durée de validité du 'buildId' en secondes. Par défaut, 'SCRAPE_BUILD_ID_TTL'.
+        """
+        self.build_id_ttl = SCRAPE_BUILD_ID_TTL if build_id_ttl is None else build_id_ttl
+        self._build_id: Optional[str] = None
+        self._build_id_expires_at = 0.0
+        # Les entreprises extraites en parallèle attendent le premier 'buildId' au lieu de le redemander
+        self._build_id_lock = asyncio.Lock()
+        # Nombre de requêtes HTTP effectuées pendant la session
+        self.request_count = 0
+
+    async def request(self, method: str, url: str) -> Response:
+        """Effectue une requête HTTP limitée ('_request') et la comptabilise."""
+        self.request_count += 1
+        return await _request(method, url)
+
+    async def get_build_id(self, url_base: str, refresh: bool = False) -> str:
+        """
+        Retourne le 'buildId' en cache, ou le récupère depuis la page de 'url_base' s'il a expiré.
+
+        Parameters
+        ----------
+        url_base : str
+            L'URL de la page d'une entreprise (utilisée si le 'buildId' doit être récupéré).
+
+        refresh : bool, optionnel
+            Si True, ignore le 'buildId' en cache. Par défaut, False.
+
+        Returns
+        -------
+        str
+            Le 'buildId' du site.
+        """
+        stale_build_id = self._build_id if refresh else None
+        async with self._build_id_lock:
+            # Une autre entreprise a pu renouveler le 'buildId' pendant l'attente du verrou
+            if self._build_id is not None and self._build_id != stale_build_id \
+                    and time.monotonic() < self._build_id_expires_at:
+                return self._build_id
+
+            self.request_count += 1
+            self._build_id = await get_build_id(url_base)
+            self._build_id_expires_at = time.monotonic() + self.build_id_ttl
+            logger.info(f"buildId récupéré : {self._build_id}")
+            return self._build_id
+
+    async def get_first_page(self, url_base: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Récupère la première page d'avis d'une entreprise.
+
+        Parameters
+        ----------
+        url_base : str
+            L'URL de la page de l'entreprise.
+
+        Returns
+        -------
+        Tuple[str, Dict[str, Any]]
+            L'URL de l'API des avis et le champ 'pageProps' de la première page.
+
+        Raises
+        -----
+        Exception
+            Si le 'buildId' ou la première page ne peuvent être récupérés.
+        """
+        build_id = await self.get_build_id(url_base)
+        url_api = build_reviews_url_api(build_id, url_base)
+        response = await self.request("post", url_api)
+        if response.status_code == 404:
+            # 'buildId' périmé (site redéployé) : un seul renouvellement
+            logger.warning(f"buildId {build_id} périmé, renouvellement")
+            url_api = build_reviews_url_api(await self.get_build_id(url_base, refresh=True), url_base)
+            response = await self.request("post", url_api)
+        # Vérifie si la requête a réussi
+        response.raise_for_status()
+        return url_api, json.loads(response.text)["pageProps"]
+
+    async def scrape_reviews(
+        self,
+        url_base: str,
+        max_pages: int = 1,
+        high_water_mark: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[Dict], Dict[str, Any], bool]:
+        """
+        Récupère et agrège les avis depuis l'API avec gestion de la pagination.
+
+        Sans repère, les pages suivantes sont demandées en parallèle et une page en erreur est
+        ignorée. Avec un repère (avis le plus récent déjà ingéré), elles sont demandées une à une
+        et la pagination s'arrête à la première page ne contenant que des avis déjà vus, ou à la
+        première page en erreur ; seuls les nouveaux avis sont retournés.
+
+        Parameters
+        ----------
+        url_base : str
+            L'URL de la page de l'entreprise.
+
+        max_pages : int, optionnel
+            Le nombre maximal de pages à récupérer. Par défaut, 1.
+
+        high_water_mark : Dict[str, str], optionnel
+            Avis le plus récent déjà ingéré ('review_id', 'published_date'). Par défaut, 'None'
+            (extraction complète).
+
+        Returns
+        -------
+        Tuple[List[Dict], Dict[str, Any], bool]
+            Les avis récupérés, le champ 'pageProps' de la première page (informations de
+            l'entreprise) et 'True' si aucune page n'a été perdue. Une extraction incomplète ne
+            doit pas faire avancer le repère de l'entreprise : les avis des pages perdues ne
+            seraient plus jamais extraits.
+
+        Raises
+        -----
+        Exception
+            Si la première page ne peut être récupérée. Une erreur sur une page suivante est
+            loguée et l'extraction est signalée incomplète.
+        """
+        # ---- Première page ----
+        url_api, page_props = await self.get_first_page(url_base)
+
+        # Récupère les avis de la première page
+        reviews_data: List[Dict] = list(page_props["reviews"])
+
+        # Récupère le nombre total de pages d'avis disponibles
+        total_pages = page_props["filters"]["pagination"]["totalPages"]
+
+        # Limite le nombre de pages à récupérer en fonction de 'max_pages'
+        if max_pages and max_pages < total_pages:
+            total_pages = max_pages
+        logger.info(f"Total pages à scraper : {total_pages}")
+
+        if high_water_mark is not None:
+            reviews_data, complete = await self._scrape_new_reviews(url_api, reviews_data, total_pages, high_water_mark)
+            return reviews_data, page_props, complete
+
+        # ---- Pages suivantes ----
+
+        # Crée une liste de futures pour récupérer les pages suivantes en parallèle
+        other_pages = [
+            self.request("post", url_api + f"&page={page_number}") for page_number in range(2, total_pages + 1)
+        ]
+
+        # Pour chaque page suivante, récupère et traite les avis
+        complete = True
+        for page_number, response_future in zip(range(2, total_pages + 1), asyncio.as_completed(other_pages)):
+            logger.info(f"Scraping de la page {page_number} / {total_pages}")
+            try:
+                response = await response_future
+                # Vérifie la réussite de la requête
+                response.raise_for_status()
+                data = json.loads(response.text)
+
+                # Si des avis sont trouvés, on les ajoute à la liste des avis
+                if "reviews" in data["pageProps"]:
+                    page_data = data["pageProps"]["reviews"]
+                    reviews_data.extend(page_data)
+                    logger.info(f"Page {page_number}: {len(page_data)} avis récupérés")
+                else:
+                    # Si aucun avis n'est trouvé, on log une erreur
+                    logger.error(f"Pas de 'reviews' trouvées pour la page {page_number}")
+                    complete = False
+
+            except Exception as e:
+                # Log l'erreur si une page échoue
+                logger.error(f"[scrape_reviews] Erreur page {page_number}: {e}")
+                complete = False
+
+        logger.info(f"Extraction terminée : {len(reviews_data)} avis récupérés")
+        return reviews_data, page_props, complete
+
+    async def _scrape_new_reviews(
+        self,
+        url_api: str,
+        first_reviews: List[Dict],
+        total_pages: int,
+        high_water_mark: Dict[str, str]
+    ) -> Tuple[List[Dict], bool]:
+        """
+        Récupère les avis publiés depuis le repère, page par page, à partir des avis de la première page.
+
+        Parameters
+        ----------
+        url_api : str
+            L'URL de l'API des avis de l'entreprise.
+
+        first_reviews : List[Dict]
+            Les avis de la première page.
+
+        total_pages : int
+            Le nombre maximal de pages à parcourir.
+
+        high_water_mark : Dict[str, str]
+            Avis le plus récent déjà ingéré ('review_id', 'published_date').
+
+        Returns
+        -------
+        Tuple[List[Dict], bool]
+            Les avis non encore ingérés et 'False' si la pagination a été interrompue par une
+            page en erreur (avis plus anciens non extraits).
+        """
+        new_reviews: List[Dict] = []
+        complete = True
+        page_reviews, page_number = first_reviews, 1
+        while True:
+            page_new = [review for review in page_reviews if not is_seen_review(review, high_water_mark)]
+            new_reviews.extend(page_new)
+            # Tri par date décroissante : une page d'avis déjà vus termine la pagination
+            if page_reviews and not page_new:
+                logger.info(f"Page {page_number} déjà ingérée : fin de la pagination")
+                break
+            page_number += 1
+            if page_number > total_pages:
+                break
+            try:
+                response = await self.request("post", url_api + f"&page={page_number}")
+                response.raise_for_status()
+                page_reviews = json.loads(response.text)["pageProps"].get("reviews") or []
+            except Exception as e:
+                # Page perdue : les pages suivantes ne permettraient pas de combler le trou
+                logger.error(f"[scrape_reviews] Erreur page {page_number}, pagination interrompue : {e}")
+                complete = False
+                break
+
+        logger.info(f"Extraction incrémentale terminée : {len(new_reviews)} nouveaux avis ({min(page_number, total_pages)} pages)")
+        return new_reviews, complete
+
+
 async def scrape_reviews(url_base: str, max_pages: int = 1) -> List[Dict]:
     """
-    Récupère et agrège les avis depuis l'API avec gestion de la pagination.
+    Récupère et agrège les avis d'une entreprise depuis l'API avec gestion de la pagination.
 
-    Cette fonction effectue un scraping des avis d'une entreprise en plusieurs pages si nécessaire.
-    Les résultats sont retournés sous forme de liste d'objets JSON contenant les avis.
+    Raccourci de 'ScrapeSession.scrape_reviews' pour une entreprise isolée.
 
     Parameters
     ----------
@@ -94,161 +407,280 @@ async def scrape_reviews(url_base: str, max_pages: int = 1) -> List[Dict]:
     Returns
     -------
     List[Dict]
-        Une liste de dictionnaires représentant les avis récupérés. Chaque dictionnaire contient les informations sur un avis (note, date, etc.).
-
-    Raises
-    -----
-    Exception
-        Si un problème survient lors de la récupération des avis ou de la gestion de la pagination.
+        Une liste de dictionnaires représentant les avis récupérés, vide si la première page
+        ne peut être récupérée.
     """
     try:
-        # Génére l'URL de l'API pour récupérer les avis
-        url_api = await get_reviews_url_api(url_base)
-    except Exception:
+        reviews_data, _, _ = await ScrapeSession().scrape_reviews(url_base, max_pages)
+        return reviews_data
+    except Exception as e:
         # En cas d'erreur, log l'exception et retourne une liste vide
-        logger.error(f"[scrape_reviews] Erreur génération URL API {url_base}")
+        logger.error(f"[scrape_reviews] Erreur première page {url_base}: {e}")
         return []
 
-    # ---- Première page ----
 
-    try:
-        # Envoie une requête pour récupérer la première page des avis
-        first_page = await client.post(url_api)
-        # Vérifie si la requête a réussi
-        first_page.raise_for_status()
-        data = json.loads(first_page.text)["pageProps"]
+def get_enterprise_info(page_props: Dict[str, Any], enterprise_url: str) -> Dict[str, Any]:
+    """
+    Extrait les informations statiques d'une entreprise (note moyenne, nombre d'avis, répartition des notes).
 
-        # Récupère les avis de la première page
-        reviews_data: List[Dict] = data["reviews"]
+    Parameters
+    ----------
+    page_props : Dict[str, Any]
+        Champ 'pageProps' d'une page d'avis de l'API.
 
-        # Récupère le nombre total de pages d'avis disponibles
-        total_pages = data["filters"]["pagination"]["totalPages"]
+    enterprise_url : str
+        URL de l'entreprise (nom par défaut).
 
-        # Limite le nombre de pages à récupérer en fonction de 'max_pages'
-        if max_pages and max_pages < total_pages:
-            total_pages = max_pages
-        logger.info(f"Total pages à scraper : {total_pages}")
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionnaire contenant 'enterprise_rating', 'enterprise_review_number', 'ratings' et 'name'.
+    """
+    review_stats = page_props.get("filters", {}).get("reviewStatistics", {})
+    ratings = review_stats.get("ratings", {})
+    return {
+        "enterprise_rating": page_props.get("businessUnit", {}).get("trustScore"),
+        "enterprise_review_number": page_props.get("businessUnit", {}).get("numberOfReviews"),
+        "ratings": ratings,
+        "name": page_props.get("businessUnit", {}).get("displayName") or enterprise_url
+    }
+
+
+async def iter_review_pages(
+    max_pages: int,
+    prefetch: int = STREAM_PREFETCH_PAGES,
+    session: Optional[ScrapeSession] = None,
+    high_water_marks: Optional[Dict[str, Dict[str, str]]] = None
+) -> AsyncIterator[Dict]:
+    """
+    Produit les avis de toutes les entreprises configurées, page par page, dès leur récupération.
 
-    except Exception as e:
-        # Log l'erreur si l'extraction des avis de la première page échoue
-        logger.error(f"[scrape_reviews] Erreur première page {url_base}: {e}")
-        return []
+    Chaque élément a la forme d'une extraction de 'get_reviews_from_trustpilot' limitée à une
+    page ('enterprise_url', 'enterprise', 'reviews' et 'error') et peut donc être transformé
+    directement. Une entreprise dont une page est perdue est suivie d'un élément sans avis
+    avec 'error' à 'True' (son repère ne doit pas avancer).
+    Au plus 'prefetch' pages sont demandées à l'avance : la mémoire utilisée ne dépend pas du
+    nombre de pages, et un consommateur lent ralentit l'extraction (contre-pression).
 
-    # ---- Pages suivantes ----
+    Pour une entreprise ayant un repère (extraction incrémentale), les pages sont demandées une
+    à une, seuls les nouveaux avis sont produits et la pagination s'arrête à la première page
+    ne contenant que des avis déjà vus, ou à la première page en erreur.
 
-    # Crée une liste de futures pour récupérer les pages suivantes en parallèle
-    other_pages = [client.post(url_api + f"&page={page_number}") for page_number in range(2, total_pages + 1)]
+    Parameters
+    ----------
+    max_pages : int
+        Le nombre maximal de pages à récupérer pour chaque entreprise.
 
-    # Pour chaque page suivante, récupère et traite les avis
-    for page_number, response_future in zip(range(2, total_pages + 1), asyncio.as_completed(other_pages)):
-        logger.info(f"Scraping de la page {page_number} / {total_pages}")
-        try:
-            response = await response_future
-            # Vérifie la réussite de la requête
-            response.raise_for_status()
-            data = json.loads(response.text)
-
-             # Si des avis sont trouvés, on les ajoute à la liste des avis
-            if "reviews" in data["pageProps"]:
-                page_data = data["pageProps"]["reviews"]
-                reviews_data.extend(page_data)
-                logger.info(f"Page {page_number}: {len(page_data)} avis récupérés")
-            else:
-                # Si aucun avis n'est trouvé, on log une erreur
-                logger.error(f"Pas de 'reviews' trouvées pour la page {page_number}")
+    prefetch : int, optionnel
+        Nombre maximal de pages demandées à l'avance. Par défaut, 'STREAM_PREFETCH_PAGES'.
+
+    session : ScrapeSession, optionnel
+        Session de scraping à utiliser. Par défaut, une nouvelle session.
 
+    high_water_marks : Dict[str, Dict[str, str]], optionnel
+        Avis le plus récent déjà ingéré par 'enterprise_url'. Par défaut, 'None' (extraction complète).
+
+    Yields
+    ------
+    Dict
+        Les avis d'une page et les informations de l'entreprise, dans l'ordre des pages.
+    """
+    if not ENTERPRISES:
+        logger.warning("Aucune entreprise configurée pour le scraping")
+        return
+
+    session = session or ScrapeSession()
+    for enterprise in ENTERPRISES:
+        enterprise_url = enterprise.get("enterprise_url")
+        if not enterprise_url:
+            logger.warning("Enterprise sans 'enterprise_url' ignorée")
+            continue
+
+        url_base = f"https://www.trustpilot.com/review/{enterprise_url}"
+        high_water_mark = (high_water_marks or {}).get(enterprise_url)
+        # Extraction incrémentale : aucune page demandée au-delà de la première page déjà vue
+        window = max(1, prefetch) if high_water_mark is None else 1
+
+        # ---- Première page (avis et informations de l'entreprise) ----
+        try:
+            url_api, page_props = await session.get_first_page(url_base)
+            enterprise_info = get_enterprise_info(page_props, enterprise_url)
+            total_pages = page_props["filters"]["pagination"]["totalPages"]
+            if max_pages and max_pages < total_pages:
+                total_pages = max_pages
         except Exception as e:
-            # Log l'erreur si une page échoue
-            logger.error(f"[scrape_reviews] Erreur page {page_number}: {e}")
+            logger.error(f"[iter_review_pages] Erreur première page {url_base}: {e}")
+            yield {"enterprise_url": enterprise_url, "enterprise": {}, "reviews": [], "error": True}
+            continue
+
+        logger.info(f"{enterprise_url} : {total_pages} pages à scraper")
+        first_reviews = [review for review in page_props["reviews"] if not is_seen_review(review, high_water_mark)]
+        if first_reviews or high_water_mark is None:
+            yield {"enterprise_url": enterprise_url, "enterprise": enterprise_info, "reviews": first_reviews, "error": False}
+        if page_props["reviews"] and not first_reviews:
+            logger.info(f"{enterprise_url} : aucun nouvel avis")
+            continue
+
+        # ---- Pages suivantes : au plus 'prefetch' requêtes en cours, pages produites dans l'ordre ----
+        pending: List[asyncio.Task] = []
+        next_page = 2
+        complete = True
+        try:
+            while pending or next_page <= total_pages:
+                while next_page <= total_pages and len(pending) < window:
+                    pending.append(asyncio.ensure_future(session.request("post", url_api + f"&page={next_page}")))
+                    next_page += 1
+
+                page_number = next_page - len(pending)
+                try:
+                    response = await pending.pop(0)
+                    response.raise_for_status()
+                    page_data = json.loads(response.text)["pageProps"].get("reviews")
+                except Exception as e:
+                    logger.error(f"[iter_review_pages] Erreur page {page_number}: {e}")
+                    page_data = None
+
+                if page_data is None:
+                    logger.error(f"Pas de 'reviews' trouvées pour la page {page_number}")
+                    complete = False
+                    # Extraction incrémentale : les pages suivantes ne combleraient pas le trou
+                    if high_water_mark is not None:
+                        break
+                    continue
+                new_data = [review for review in page_data if not is_seen_review(review, high_water_mark)]
+                if page_data and not new_data:
+                    logger.info(f"{enterprise_url} page {page_number} déjà ingérée : fin de la pagination")
+                    break
+                logger.info(f"{enterprise_url} page {page_number}/{total_pages} : {len(new_data)} avis récupérés")
+                yield {"enterprise_url": enterprise_url, "enterprise": enterprise_info, "reviews": new_data, "error": False}
+        finally:
+            # Arrêt anticipé du consommateur : requêtes restantes annulées
+            for task in pending:
+                task.cancel()
+
+        if not complete:
+            yield {"enterprise_url": enterprise_url, "enterprise": enterprise_info, "reviews": [], "error": True}
+
+    logger.info(f"Extraction en flux : {session.request_count} requêtes HTTP")
+
+
+async def scrape_enterprise(
+    enterprise_url: str,
+    max_pages: int,
+    session: Optional[ScrapeSession] = None,
+    high_water_mark: Optional[Dict[str, str]] = None
+) -> Dict:
+    """
+    Récupère les avis et les informations statiques d'une entreprise.
+
+    Une erreur est isolée : elle est loguée et l'entreprise est retournée sans avis ni
+    informations, avec 'error' à 'True', sans interrompre l'extraction des autres entreprises.
+    Une extraction incomplète (page perdue) est aussi signalée par 'error' : les avis récupérés
+    sont conservés mais le repère de l'entreprise ne doit pas avancer.
+
+    Parameters
+    ----------
+    enterprise_url : str
+        URL de l'entreprise (ex : 'www.showroomprive.com').
+
+    max_pages : int
+        Le nombre maximal de pages à récupérer.
+
+    session : ScrapeSession, optionnel
+        Session de scraping partagée entre les entreprises. Par défaut, une nouvelle session.
+
+    high_water_mark : Dict[str, str], optionnel
+        Avis le plus récent déjà ingéré : seuls les avis plus récents sont extraits. Par défaut,
+        'None' (extraction complète).
+
+    Returns
+    -------
+    Dict
+        Dictionnaire contenant 'enterprise_url', 'enterprise', 'reviews' et 'error'.
+    """
+    url_base = f"https://www.trustpilot.com/review/{enterprise_url}"
 
-    logger.info(f"Extraction terminée : {len(reviews_data)} avis récupérés")
-    return reviews_data
+    session = session or ScrapeSession()
 
+    try:
+        # Récupère les avis et la première page de cette entreprise
+        reviews_data, page_props, complete = await session.scrape_reviews(url_base, max_pages, high_water_mark)
+
+        # Informations statiques sur l'entreprise (note moyenne, nombre d'avis), issues de la première page
+        enterprise_info = get_enterprise_info(page_props, enterprise_url)
+
+        return {
+            "enterprise_url": enterprise_url,
+            "enterprise": enterprise_info,
+            "reviews": reviews_data,
+            "error": not complete
+        }
 
-async def get_reviews_from_trustpilot(max_pages: int) -> List[Dict]:
+    except Exception as e:
+        # Si une erreur survient pendant le scraping pour cette entreprise, log l'erreur
+        logger.error(f"[scrape_enterprise] Erreur scraping {url_base}: {e}")
+        # Résultat vide pour cette entreprise en cas d'échec
+        return {
+            "enterprise_url": enterprise_url,
+            "enterprise": {},  # Aucun info sur l'entreprise
+            "reviews": [],  # Aucun avis récupéré
+            "error": True
+        }
+
+
+async def get_reviews_from_trustpilot(
+    max_pages: int,
+    high_water_marks: Optional[Dict[str, Dict[str, str]]] = None
+) -> List[Dict]:
     """
     Récupère les avis et les informations statiques pour toutes les entreprises configurées.
 
-    Cette fonction itère sur les entreprises configurées dans le fichier 'config.py' et récupère les avis
-    pour chacune d'elles en utilisant la fonction 'scrape_reviews'. Elle récupère également les statistiques
-    globales des avis (note moyenne, nombre d'avis, etc.) pour chaque entreprise.
+    Les entreprises configurées dans le fichier 'config.py' sont extraites en parallèle avec
+    'scrape_enterprise' : la durée totale tend vers celle de l'entreprise la plus longue au lieu
+    de la somme des durées. Le nombre de requêtes simultanées reste borné globalement et par
+    hôte ('SCRAPE_MAX_CONCURRENCY', 'SCRAPE_MAX_CONCURRENCY_PER_HOST'). Les entreprises partagent
+    une 'ScrapeSession' : le 'buildId' n'est récupéré qu'une fois.
 
     Parameters
     ----------
     max_pages : int, optionnel
         Le nombre maximal de pages à récupérer pour chaque entreprise. Par défaut, 1.
 
+    high_water_marks : Dict[str, Dict[str, str]], optionnel
+        Avis le plus récent déjà ingéré par 'enterprise_url' (extraction incrémentale, voir
+        'HighWaterMarkStore'). Par défaut, 'None' : toutes les pages demandées sont extraites.
+
     Returns
     -------
     List[Dict]
-        Une liste de dictionnaires contenant les résultats du scraping pour chaque entreprise. 
-        Chaque dictionnaire contient :
+        Une liste de dictionnaires contenant les résultats du scraping pour chaque entreprise,
+        dans l'ordre de la configuration. Chaque dictionnaire contient :
         - 'enterprise_url': URL de l'entreprise.
         - 'enterprise': Informations générales sur l'entreprise (note moyenne, nombre d'avis, etc.).
         - 'reviews': Liste des avis récupérés sous forme de dictionnaires.
-
-    Raises
-    -----
-    Exception
-        Si un problème survient lors du scraping pour une entreprise spécifique.
+        - 'error': 'True' si l'extraction de l'entreprise a échoué ou est incomplète.
+        En cas d'échec pour une entreprise, 'enterprise' et 'reviews' sont vides.
     """
-
-    # Liste pour stocker les résultats du scraping
-    results = []
-
     if not ENTERPRISES:
         # Si aucune entreprise n'est configurée, on log un avertissement et retourne une liste vide
         logger.warning("Aucune entreprise configurée pour le scraping")
-        return results
+        return []
 
-    # Boucle sur les entreprises (dans notre cas : une seule entreprise)
+    enterprise_urls = []
     for enterprise in ENTERPRISES:
         enterprise_url = enterprise.get("enterprise_url")
         if not enterprise_url:
             # Si l'URL de l'entreprise est manquante, on l'ignore
             logger.warning("Enterprise sans 'enterprise_url' ignorée")
             continue
-
-        url_base = f"https://www.trustpilot.com/review/{enterprise_url}"
-
-        try:
-            # Récupère les avis pour cette entreprise
-            reviews_data = await scrape_reviews(url_base, max_pages)
-
-            # Récupère les informations statiques sur l'entreprise (note moyenne, nombre d'avis)
-            url_api = await get_reviews_url_api(url_base)
-            first_page = await client.post(url_api)
-
-            # Vérifie si la requête a réussi
-            first_page.raise_for_status()
-            page_props = json.loads(first_page.text)["pageProps"]
-
-            # Extraction des statistiques de l'entreprise
-            review_stats = page_props.get("filters", {}).get("reviewStatistics", {})
-            ratings = review_stats.get("ratings", {})
-            enterprise_info = {
-                "enterprise_rating": page_props.get("businessUnit", {}).get("trustScore"),
-                "enterprise_review_number": page_props.get("businessUnit", {}).get("numberOfReviews"),
-                "ratings": ratings,
-                "name": page_props.get("businessUnit", {}).get("displayName") or enterprise_url
-            }
-
-            # Ajoute le résultat dans la liste 'results'
-            results.append({
-                "enterprise_url": enterprise_url,
-                "enterprise": enterprise_info,
-                "reviews": reviews_data
-            })
-
-        except Exception as e:
-            # Si une erreur survient pendant le scraping pour cette entreprise, log l'erreur
-            logger.error(f"[get_reviews_from_trustpilot] Erreur scraping {url_base}: {e}")
-            # Ajoute un résultat vide pour cette entreprise en cas d'échec
-            results.append({
-                "enterprise_url": enterprise_url,
-                "enterprise": {},  # Aucun info sur l'entreprise
-                "reviews": []  # Aucun avis récupéré
-            })
-
-    # Retourne la liste complète des résultats pour toutes les entreprises
+        enterprise_urls.append(enterprise_url)
+
+    # Extraction parallèle avec une session commune ; 'gather' conserve l'ordre de la configuration
+    session = ScrapeSession()
+    results = list(await asyncio.gather(
+        *(
+            scrape_enterprise(enterprise_url, max_pages, session, (high_water_marks or {}).get(enterprise_url))
+            for enterprise_url in enterprise_urls
+        )))
+    logger.info(f"Extraction terminée : {session.request_count} requêtes HTTP pour {len(enterprise_urls)} entreprises")
     return results
@@ -22,7 +22,7 @@ def create_index_if_not_exists(es: Elasticsearch, index: str = "reviews") -> Non
     """
     Crée l'index Elasticsearch s'il n'existe pas déjà.
 
-    - Si l'index existe : aucune action n'est effectuée
+    - Si l'index existe : les nouveaux champs du mapping y sont ajoutés
     - Si l'index n'existe pas : il est créé avec le mapping défini
 
     :param es: Instance du client Elasticsearch
@@ -36,7 +36,10 @@ def create_index_if_not_exists(es: Elasticsearch, index: str = "reviews") -> Non
             es.indices.create(index=index, body={"mappings": MAPPING_REVIEWS})
             logger.success(f"Index '{index}' créé avec succès")
         else:
-            logger.info(f"Index '{index}' existe déjà, création ignorée")
+            # Mapping strict : les champs ajoutés depuis la création de l'index sont déclarés
+            # (l'ajout de champs est compatible avec les documents existants)
+            es.indices.put_mapping(index=index, properties=MAPPING_REVIEWS["properties"])
+            logger.info(f"Index '{index}' existe déjà, mapping mis à jour")
 
     except RequestError as error:
         logger.exception(
@@ -18,32 +18,19 @@ Fonctionnalités principales :
 from datetime import datetime, timezone
 from elasticsearch import Elasticsearch, helpers
 from elasticsearch.exceptions import ConnectionError as ElasticConnectionError
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 from loguru import logger
 from etl.load.create_index_elasticsearch import create_index_if_not_exists
 
 
-def load_reviews_to_elasticsearch_bulk(
-    documents: List[Dict[str, Any]],
-    es_host: Optional[str] = "http://elasticsearch:9200",
-    index: str = "reviews",
-    use_id: bool = True
-) -> None:
+def connect_elasticsearch(es_host: Optional[str] = "http://elasticsearch:9200") -> Elasticsearch:
     """
-    Insère ou met à jour des documents dans Elasticsearch via l'API Bulk (upsert).
+    Se connecte au cluster Elasticsearch et vérifie sa disponibilité.
 
-    Chaque document sera soit :
-    - mis à jour si `id_review` existe déjà dans l'index
-    - inséré sinon
-
-    Les champs `created_at` et `updated_at` sont automatiquement gérés :
-    - `created_at` ajouté uniquement si le document n'existait pas
-    - `updated_at` mis à jour à chaque opération
-
-    :param documents: Liste des documents à insérer ou mettre à jour
     :param es_host: URL du cluster Elasticsearch
-    :param index: Nom de l'index Elasticsearch
-    :param use_id: Si True, utilise le champ `id_review` comme identifiant
+    :return: Client Elasticsearch connecté
+    :raises ValueError: si l'URL du cluster n'est pas définie
+    :raises ElasticConnectionError: si le cluster est injoignable
     """
     if not es_host:
         raise ValueError("ES_HOST n'est pas défini")
@@ -56,20 +43,26 @@ def load_reviews_to_elasticsearch_bulk(
     except ElasticConnectionError as error:
         logger.exception(f"Impossible de se connecter à Elasticsearch: {error}")
         raise ElasticConnectionError(f"Impossible de se connecter à Elasticsearch: {error}")
+    return es
 
-    # Création de l'index si celui-ci n'existe pas déjà
-    create_index_if_not_exists(es=es, index=index)
 
-    if not documents:
-        logger.warning(
-            "Aucun document à insérer ou mettre à jour dans Elasticsearch")
-        return
-
-    actions = []
+def _bulk_actions(
+    documents: Iterable[Dict[str, Any]],
+    index: str,
+    use_id: bool
+) -> List[Dict[str, Any]]:
+    """
+    Construit les actions bulk (upsert) des documents.
 
+    :param documents: Documents à insérer ou mettre à jour
+    :param index: Nom de l'index Elasticsearch
+    :param use_id: Si True, utilise le champ `id_review` comme identifiant
+    :return: Liste des actions bulk
+    """
     # Timestamp au format ISO 8601 UTC pour created_at / updated_at
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+    actions = []
     for document in documents:
         # Ignorer les documents sans identifiant métier si use_id=True
         if use_id and not document.get("id_review"):
@@ -93,18 +86,74 @@ def load_reviews_to_elasticsearch_bulk(
         }
 
         actions.append(action)
+    return actions
+
+
+def bulk_upsert_documents(
+    es: Elasticsearch,
+    documents: Iterable[Dict[str, Any]],
+    index: str = "reviews",
+    use_id: bool = True
+) -> int:
+    """
+    Insère ou met à jour des documents via l'API Bulk, sur un client déjà connecté.
+
+    Utilisé par l'ETL en flux pour charger chaque page transformée sur la même connexion
+    (sans reconnexion ni vérification de l'index à chaque page).
 
+    :param es: Client Elasticsearch connecté
+    :param documents: Documents à insérer ou mettre à jour
+    :param index: Nom de l'index Elasticsearch
+    :param use_id: Si True, utilise le champ `id_review` comme identifiant
+    :return: Nombre de documents insérés ou mis à jour
+    """
     # Exécution du bulk upsert avec gestion des erreurs
     try:
-        success, errors = helpers.bulk(es, actions, raise_on_error=False)
+        success, errors = helpers.bulk(es, _bulk_actions(documents, index, use_id), raise_on_error=False)
         logger.success(
             f"{success} documents insérés ou mis à jour dans Elasticsearch")
 
         if errors:
             logger.warning(
                 f"Erreurs rencontrées lors de l'upsert bulk : {errors}")
+        return success
 
     except Exception as error:
         logger.exception(
             f"Erreur critique lors de l'upsert bulk : {error}")
         raise
+
+
+def load_reviews_to_elasticsearch_bulk(
+    documents: List[Dict[str, Any]],
+    es_host: Optional[str] = "http://elasticsearch:9200",
+    index: str = "reviews",
+    use_id: bool = True
+) -> None:
+    """
+    Insère ou met à jour des documents dans Elasticsearch via l'API Bulk (upsert).
+
+    Chaque document sera soit :
+    - mis à jour si `id_review` existe déjà dans l'index
+    - inséré sinon
+
+    Les champs `created_at` et `updated_at` sont automatiquement gérés :
+    - `created_at` ajouté uniquement si le document n'existait pas
+    - `updated_at` mis à jour à chaque opération
+
+    :param documents: Liste des documents à insérer ou mettre à jour
+    :param es_host: URL du cluster Elasticsearch
+    :param index: Nom de l'index Elasticsearch
+    :param use_id: Si True, utilise le champ `id_review` comme identifiant
+    """
+    es = connect_elasticsearch(es_host)
+
+    # Création de l'index si celui-ci n'existe pas déjà
+    create_index_if_not_exists(es=es, index=index)
+
+    if not documents:
+        logger.warning(
+            "Aucun document à insérer ou mettre à jour dans Elasticsearch")
+        return
+
+    bulk_upsert_documents(es, documents, index=index, use_id=use_id)
@@ -30,6 +30,12 @@ MAPPING_REVIEWS = {
         "user_review_length": {"type": "integer"},
         "user_rating": {"type": "float"},
         "user_sentiment": {"type": "keyword", "fields": {"raw": {"type": "keyword"}}},
+        # Probabilités de 1 à 5 étoiles prédites par le modèle (re-calcul du sentiment sans inférence)
+        "user_sentiment_probability_one_star": {"type": "float"},
+        "user_sentiment_probability_two_star": {"type": "float"},
+        "user_sentiment_probability_three_star": {"type": "float"},
+        "user_sentiment_probability_four_star": {"type": "float"},
+        "user_sentiment_probability_five_star": {"type": "float"},
         # Entreprise
         "enterprise_name": {"type": "text", "fields": {"raw": {"type": "keyword"}}},
         "enterprise_response": {"type": "text", "fields": {"raw": {"type": "keyword"}}},
@@ -17,7 +17,7 @@ Le pipeline ETL inclut les étapes suivantes :
 
 Usage :
 ------
-python main.py --pages <nombre_de_pages>
+python main.py --pages <nombre_de_pages> [--streaming] [--full-rescan]
 """
 
 import argparse
@@ -29,7 +29,7 @@ from etl.pipeline.reviews_etl import run_reviews_etl
 MAX_PAGES = 10
 
 
-def run_pipeline(pages: int) -> None:
+def run_pipeline(pages: int, streaming: bool = False, full_rescan: bool = False) -> None:
     """
     Lance le pipeline ETL pour récupérer les avis et effectuer les étapes
     d'extraction, transformation, sauvegarde et chargement.
@@ -38,6 +38,14 @@ def run_pipeline(pages: int) -> None:
     ----------
     pages : int
         Nombre de pages à récupérer par entreprise.
+
+    streaming : bool, optionnel
+        Si 'True', les étapes s'exécutent en flux, page par page. Par défaut, 'False'
+        (sauf si 'ETL_STREAMING' est activé dans la configuration).
+
+    full_rescan : bool, optionnel
+        Si 'True', toutes les pages sont extraites, y compris les avis déjà ingérés. Par défaut,
+        'False' : seuls les avis publiés depuis la dernière exécution sont extraits.
     """
     if pages > MAX_PAGES:
         logger.warning(
@@ -47,7 +55,7 @@ def run_pipeline(pages: int) -> None:
         pages = MAX_PAGES
 
     logger.info(f"Exécution du pipeline ETL (pages = {pages})")
-    run_reviews_etl(max_pages=pages)
+    run_reviews_etl(max_pages=pages, streaming=streaming or None, full_rescan=full_rescan)
 
 
 if __name__ == "__main__":
@@ -60,9 +68,21 @@ if __name__ == "__main__":
         help=f"Nombre de pages d'avis à récupérer (max {MAX_PAGES})"
     )
 
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="ETL en flux : chaque page est transformée et chargée dès son extraction"
+    )
+
+    parser.add_argument(
+        "--full-rescan",
+        action="store_true",
+        help="Extraction complète : ignore les repères d'extraction et récupère toutes les pages"
+    )
+
     # Récupération des arguments
     args = parser.parse_args()
 
     # Lancement du pipeline
-    run_pipeline(args.pages)
+    run_pipeline(args.pages, streaming=args.streaming, full_rescan=args.full_rescan)
 
@@ -0,0 +1,264 @@
+# File: src\etl\pipeline\rebucket_sentiment.py
+
+"""
+Module pour recalculer le sentiment des avis à partir des probabilités stockées.
+
+Les probabilités de 1 à 5 étoiles prédites par le modèle sont indexées avec chaque avis
+('user_sentiment_probability_*_star'). Changer les seuils Négatif / Neutre / Positif ou
+ajouter un filtre de confiance ne nécessite donc plus de relancer le modèle :
+- 'rebucket_sentiment' met à jour 'user_sentiment' dans l'index (update_by_query),
+- 'sentiment_runtime_field' fournit un champ runtime pour tester des seuils à la volée
+  dans une requête de recherche, sans modifier l'index.
+
+Règle appliquée : les étoiles de l'avis sont comparées aux seuils ; si la probabilité de
+l'étoile la plus probable est inférieure à la confiance minimale, le sentiment vaut "Indéfini".
+Les étoiles sont, selon 'SENTIMENT_BUCKET_RULE' :
+- "argmax" (par défaut) : l'étoile la plus probable. Avec les seuils par défaut, le résultat
+  est identique au sentiment calculé à l'ingestion ('convert_stars_to_sentiment') ;
+- "expected" : la note attendue (somme des étoiles pondérées par leur probabilité).
+
+Usage :
+------
+python -m etl.pipeline.rebucket_sentiment --negative-max 2.5 --positive-min 3.5 --min-confidence 0.4 [--rule expected]
+"""
+
+import argparse
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence, Tuple
+from elasticsearch import Elasticsearch
+from loguru import logger
+from etl.config.config import (
+    ES_HOST,
+    SENTIMENT_BUCKET_RULE,
+    SENTIMENT_NEGATIVE_MAX_STARS,
+    SENTIMENT_POSITIVE_MIN_STARS,
+    SENTIMENT_MIN_CONFIDENCE,
+)
+from etl.transform.transform_reviews import STAR_PROBABILITY_FIELDS
+
+
+# Règles de calcul des étoiles comparées aux seuils
+BUCKET_RULES: Tuple[str, ...] = ("argmax", "expected")
+
+# Partie commune des scripts Painless : 'best', 'best_star' et 'expected' calculés, 's' = sentiment
+_PAINLESS_BUCKET = """
+double stars = params.rule == 'expected' ? expected : best_star;
+String s;
+if (best < params.min_confidence) { s = 'Indéfini'; }
+else if (stars <= params.negative_max) { s = 'Négatif'; }
+else if (stars >= params.positive_min) { s = 'Positif'; }
+else { s = 'Neutre'; }
+"""
+
+# Script de mise à jour (update_by_query) : lit les probabilités dans '_source'
+REBUCKET_SCRIPT = """
+double best = 0; double expected = 0; int best_star = 0;
+for (int i = 0; i < params.fields.size(); i++) {
+  def value = ctx._source[params.fields[i]];
+  if (value == null) { ctx.op = 'noop'; return; }
+  // Première étoile de probabilité maximale (même départage que le modèle)
+  if (best_star == 0 || (double) value > best) { best = (double) value; best_star = i + 1; }
+  expected += (i + 1) * (double) value;
+}
+""" + _PAINLESS_BUCKET + """
+if (ctx._source.user_sentiment == s) { ctx.op = 'noop'; }
+else { ctx._source.user_sentiment = s; ctx._source.updated_at = params.now; }
+"""
+
+# Script de champ runtime : lit les probabilités dans les doc values
+RUNTIME_SCRIPT = """
+double best = 0; double expected = 0; int best_star = 0;
+for (int i = 0; i < params.fields.size(); i++) {
+  if (doc[params.fields[i]].size() == 0) { return; }
+  double value = doc[params.fields[i]].value;
+  if (best_star == 0 || value > best) { best = value; best_star = i + 1; }
+  expected += (i + 1) * value;
+}
+""" + _PAINLESS_BUCKET + """
+emit(s);
+"""
+
+
+def bucket_sentiment(
+    probabilities: Sequence[Optional[float]],
+    negative_max: float = SENTIMENT_NEGATIVE_MAX_STARS,
+    positive_min: float = SENTIMENT_POSITIVE_MIN_STARS,
+    min_confidence: float = SENTIMENT_MIN_CONFIDENCE,
+    rule: str = SENTIMENT_BUCKET_RULE
+) -> Optional[str]:
+    """
+    Calcule le sentiment à partir des probabilités de 1 à 5 étoiles (même règle que les scripts).
+
+    Parameters
+    ----------
+    probabilities : Sequence[float]
+        Probabilités de 1 à 5 étoiles.
+
+    negative_max : float, optionnel
+        Nombre d'étoiles maximal d'un avis "Négatif".
+
+    positive_min : float, optionnel
+        Nombre d'étoiles minimal d'un avis "Positif".
+
+    min_confidence : float, optionnel
+        Probabilité minimale de l'étoile la plus probable ; en dessous : "Indéfini".
+
+    rule : str, optionnel
+        "argmax" (étoile la plus probable, règle de l'ingestion) ou "expected" (note attendue).
+        Par défaut, 'SENTIMENT_BUCKET_RULE'.
+
+    Returns
+    -------
+    str, optionnel
+        "Négatif", "Neutre", "Positif" ou "Indéfini" ; 'None' si une probabilité manque.
+
+    Raises
+    ------
+    ValueError
+        Si la règle est inconnue.
+    """
+    _check_rule(rule)
+    if len(probabilities) != len(STAR_PROBABILITY_FIELDS) or any(p is None for p in probabilities):
+        return None
+
+    best = max(probabilities)
+    if rule == "expected":
+        stars = sum((star + 1) * p for star, p in enumerate(probabilities))
+    else:
+        # Première étoile de probabilité maximale (même départage que le modèle)
+        stars = probabilities.index(best) + 1
+
+    if best < min_confidence:
+        return "Indéfini"
+    if stars <= negative_max:
+        return "Négatif"
+    if stars >= positive_min:
+        return "Positif"
+    return "Neutre"
+
+
+def _check_rule(rule: str) -> None:
+    """Lève une 'ValueError' si la règle de calcul des étoiles est inconnue."""
+    if rule not in BUCKET_RULES:
+        raise ValueError(f"Règle de recalcul du sentiment inconnue : {rule} (attendu : {', '.join(BUCKET_RULES)})")
+
+
+def _script_params(negative_max: float, positive_min: float, min_confidence: float, rule: str) -> Dict[str, Any]:
+    """Paramètres communs aux scripts Painless."""
+    _check_rule(rule)
+    return {
+        "fields": STAR_PROBABILITY_FIELDS,
+        "rule": rule,
+        "negative_max": negative_max,
+        "positive_min": positive_min,
+        "min_confidence": min_confidence,
+    }
+
+
+def sentiment_runtime_field(
+    negative_max: float = SENTIMENT_NEGATIVE_MAX_STARS,
+    positive_min: float = SENTIMENT_POSITIVE_MIN_STARS,
+    min_confidence: float = SENTIMENT_MIN_CONFIDENCE,
+    name: str = "user_sentiment_rebucketed",
+    rule: str = SENTIMENT_BUCKET_RULE
+) -> Dict[str, Any]:
+    """
+    Retourne un champ runtime Elasticsearch calculant le sentiment avec d'autres seuils.
+
+    À passer dans 'runtime_mappings' d'une recherche ou d'une agrégation.
+
+    Parameters
+    ----------
+    negative_max, positive_min, min_confidence : float, optionnel
+        Seuils appliqués (voir 'bucket_sentiment').
+
+    name : str, optionnel
+        Nom du champ runtime. Par défaut, "user_sentiment_rebucketed".
+
+    rule : str, optionnel
+        Règle de calcul des étoiles (voir 'bucket_sentiment'). Par défaut, 'SENTIMENT_BUCKET_RULE'.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Définition du champ runtime ('keyword').
+    """
+    return {
+        name: {
+            "type": "keyword",
+            "script": {
+                "source": RUNTIME_SCRIPT,
+                "params": _script_params(negative_max, positive_min, min_confidence, rule),
+            },
+        }
+    }
+
+
+def rebucket_sentiment(
+    es: Elasticsearch,
+    index: str = "reviews",
+    negative_max: float = SENTIMENT_NEGATIVE_MAX_STARS,
+    positive_min: float = SENTIMENT_POSITIVE_MIN_STARS,
+    min_confidence: float = SENTIMENT_MIN_CONFIDENCE,
+    rule: str = SENTIMENT_BUCKET_RULE
+) -> Dict[str, Any]:
+    """
+    Recalcule 'user_sentiment' dans l'index à partir des probabilités stockées (sans inférence).
+
+    Seuls les avis disposant des probabilités sont traités ; les avis dont le sentiment
+    ne change pas ne sont pas réécrits.
+
+    Parameters
+    ----------
+    es : Elasticsearch
+        Client Elasticsearch.
+
+    index : str, optionnel
+        Nom de l'index. Par défaut, "reviews".
+
+    negative_max, positive_min, min_confidence : float, optionnel
+        Seuils appliqués (voir 'bucket_sentiment').
+
+    rule : str, optionnel
+        Règle de calcul des étoiles (voir 'bucket_sentiment'). Par défaut, 'SENTIMENT_BUCKET_RULE'.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Réponse de l'API update_by_query ('updated', 'noops', 'failures', ...).
+    """
+    params = _script_params(negative_max, positive_min, min_confidence, rule)
+    params["now"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    response = es.update_by_query(
+        index=index,
+        query={"exists": {"field": STAR_PROBABILITY_FIELDS[-1]}},
+        script={"source": REBUCKET_SCRIPT, "lang": "painless", "params": params},
+        conflicts="proceed",
+        refresh=True,
+    )
+    logger.success(
+        f"Sentiment recalculé : {response.get('updated', 0)} avis mis à jour, "
+        f"{response.get('noops', 0)} inchangés")
+    return response
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recalcul du sentiment à partir des probabilités stockées")
+    parser.add_argument("--index", type=str, default="reviews", help="Index Elasticsearch")
+    parser.add_argument("--negative-max", type=float, default=SENTIMENT_NEGATIVE_MAX_STARS)
+    parser.add_argument("--positive-min", type=float, default=SENTIMENT_POSITIVE_MIN_STARS)
+    parser.add_argument("--min-confidence", type=float, default=SENTIMENT_MIN_CONFIDENCE)
+    parser.add_argument(
+        "--rule", choices=BUCKET_RULES, default=SENTIMENT_BUCKET_RULE,
+        help="Étoiles comparées aux seuils : étoile la plus probable (argmax) ou note attendue (expected)")
+    args = parser.parse_args()
+
+    rebucket_sentiment(
+        Elasticsearch(ES_HOST),
+        index=args.index,
+        negative_max=args.negative_max,
+        positive_min=args.positive_min,
+        min_confidence=args.min_confidence,
+        rule=args.rule,
+    )
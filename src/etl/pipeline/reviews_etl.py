@@ -10,15 +10,249 @@ Ce module orchestre l'ensemble du processus ETL pour les avis :
 4. Chargement des données dans Elasticsearch via une insertion en bulk.
 
 Le processus peut être configuré pour exécuter uniquement certaines étapes selon les besoins.
+En mode flux ('streaming'), les étapes s'exécutent en parallèle, page par page.
+
+L'extraction est incrémentale ('SCRAPE_INCREMENTAL') : seuls les avis publiés depuis la
+dernière exécution réussie sont extraits, transformés et chargés ('full_rescan' force une
+extraction complète).
 """
 
 import asyncio
-from typing import List, Dict
+import sqlite3
+from typing import Any, AsyncIterator, List, Dict, Optional, Set, Tuple
 from loguru import logger
-from etl.extract.reviews_scraper import get_reviews_from_trustpilot
-from etl.transform.transform_reviews import transform_reviews_for_elasticsearch
-from etl.load.elasticsearch_bulk_loader import load_reviews_to_elasticsearch_bulk
+from etl.extract.reviews_scraper import get_reviews_from_trustpilot, iter_review_pages
+from etl.transform.transform_reviews import sentiment_model_version, transform_reviews_for_elasticsearch
+from etl.load.create_index_elasticsearch import create_index_if_not_exists
+from etl.load.elasticsearch_bulk_loader import (
+    bulk_upsert_documents,
+    connect_elasticsearch,
+    load_reviews_to_elasticsearch_bulk,
+)
+from etl.pipeline.streaming_etl import run_streaming_pipeline
 from etl.utils.files_utils import FileUtils
+from etl.utils.high_water_marks import HighWaterMarkStore, newest_review_mark, open_high_water_mark_store
+from etl.utils.sentiment_store import open_sentiment_store
+from etl.config.config import (
+    ES_HOST,
+    ETL_STREAMING,
+    SCRAPE_INCREMENTAL,
+    SCRAPE_STATE_PATH,
+    SENTIMENT_STORE_ENABLED,
+    SENTIMENT_STORE_MAX_AGE_DAYS,
+    SENTIMENT_STORE_MAX_ENTRIES,
+    SENTIMENT_STORE_PATH,
+    SENTIMENT_STORE_VACUUM_MIN_DELETED,
+)
+
+
+def _compact_sentiment_store() -> None:
+    """
+    Compacte le store des sentiments (versions de modèle obsolètes, entrées anciennes).
+
+    Le store est une optimisation : une erreur SQLite (fichier verrouillé, disque plein)
+    est journalisée sans faire échouer le pipeline.
+    """
+    if not SENTIMENT_STORE_ENABLED:
+        return
+    # Version du modèle inconnue : aucune entrée ne peut être jugée obsolète
+    model_version = sentiment_model_version()
+    if model_version is None:
+        return
+    store = open_sentiment_store(SENTIMENT_STORE_PATH, model_version)
+    if store is None:
+        return
+    try:
+        store.compact(SENTIMENT_STORE_MAX_AGE_DAYS, SENTIMENT_STORE_MAX_ENTRIES, SENTIMENT_STORE_VACUUM_MIN_DELETED)
+    except sqlite3.Error as error:
+        logger.warning(f"Compaction du store des sentiments impossible : {error}")
+    finally:
+        try:
+            store.close()
+        except sqlite3.Error as error:
+            logger.warning(f"Fermeture du store des sentiments impossible : {error}")
+
+
+def _open_high_water_marks(
+    full_rescan: bool
+) -> Tuple[Optional[HighWaterMarkStore], Optional[Dict[str, Dict[str, str]]]]:
+    """
+    Ouvre le store des repères d'extraction et retourne les repères à appliquer.
+
+    Parameters
+    ----------
+    full_rescan : bool
+        Si 'True', les repères ne sont pas appliqués (extraction complète) mais seront mis à jour.
+
+    Returns
+    -------
+    Tuple[HighWaterMarkStore, Dict[str, Dict[str, str]]]
+        Le store (ou 'None' si l'extraction incrémentale est désactivée ou le store indisponible)
+        et les repères par entreprise (ou 'None' pour une extraction complète).
+    """
+    if not SCRAPE_INCREMENTAL:
+        return None, None
+    store = open_high_water_mark_store(SCRAPE_STATE_PATH)
+    if store is None:
+        return None, None
+    if full_rescan:
+        logger.info("Extraction complète demandée : repères d'extraction ignorés")
+        return store, None
+    return store, store.get_all()
+
+
+def _merge_newest_mark(marks: Dict[str, Dict[str, str]], enterprise_url: str, reviews: List[Dict]) -> None:
+    """Conserve dans 'marks' l'avis le plus récent de 'reviews' s'il est plus récent que le repère de l'entreprise."""
+    mark = newest_review_mark(reviews)
+    current = marks.get(enterprise_url)
+    if mark and (current is None or mark["published_date"] > current["published_date"]):
+        marks[enterprise_url] = mark
+
+
+async def _track_newest_reviews(
+    pages: AsyncIterator[Dict[str, Any]],
+    marks: Dict[str, Dict[str, str]],
+    errors: Dict[str, bool],
+    review_counts: Dict[str, int]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Transmet les pages extraites en relevant, pour chaque entreprise, l'avis le plus récent
+    ('marks'), l'échec ou l'extraction incomplète ('errors') et le nombre d'avis extraits.
+    """
+    async for page in pages:
+        enterprise_url = page["enterprise_url"]
+        errors[enterprise_url] = errors.get(enterprise_url, False) or page.get("error", False)
+        review_counts[enterprise_url] = review_counts.get(enterprise_url, 0) + len(page["reviews"])
+        _merge_newest_mark(marks, enterprise_url, page["reviews"])
+        yield page
+
+
+def _check_extraction(errors: Dict[str, bool], review_count: int) -> None:
+    """
+    Vérifie que l'extraction a abouti pour au moins une entreprise.
+
+    Parameters
+    ----------
+    errors : Dict[str, bool]
+        Pour chaque 'enterprise_url' extraite, 'True' si son extraction a échoué ou est incomplète.
+
+    review_count : int
+        Nombre total d'avis extraits.
+
+    Raises
+    ------
+    RuntimeError
+        Si l'extraction a échoué pour toutes les entreprises sans produire d'avis (site
+        indisponible, 'buildId' introuvable...) : l'absence d'avis ne signifie pas alors qu'il
+        n'y a rien de nouveau.
+    """
+    if errors and all(errors.values()) and not review_count:
+        raise RuntimeError(f"Extraction en échec pour toutes les entreprises ({len(errors)})")
+
+
+def _save_marks(
+    mark_store: HighWaterMarkStore,
+    marks: Dict[str, Dict[str, str]],
+    failed: Set[str]
+) -> None:
+    """
+    Enregistre les repères des entreprises, sauf celles de 'failed' (extraction en échec ou
+    incomplète, avis non scorés) dont le repère n'avance pas.
+    """
+    marks = {enterprise_url: mark for enterprise_url, mark in marks.items() if enterprise_url not in failed}
+    if failed:
+        logger.warning(f"Repères d'extraction conservés (échec ou avis non scorés) : {sorted(failed)}")
+    if marks:
+        mark_store.update_many(marks)
+
+
+def run_reviews_etl_streaming(
+    max_pages: int,
+    do_save: bool = True,
+    do_load: bool = True,
+    es_host: str = ES_HOST,
+    full_rescan: bool = False
+) -> int:
+    """
+    Lance le pipeline ETL des avis en flux : chaque page est transformée et chargée dès son extraction.
+
+    Les pages circulent entre l'extraction, la transformation et le chargement via des files
+    bornées ('STREAM_QUEUE_SIZE') : la mémoire utilisée ne dépend pas du nombre de pages. Le
+    fichier d'audit JSONL est écrit au fil des pages et aucune extraction brute n'est écrite
+    sur disque.
+
+    Parameters
+    -----------
+    max_pages : int
+        Le nombre maximal de pages d'avis à extraire par entreprise.
+
+    do_save : bool, optionnel
+        Si 'True', les documents transformés sont ajoutés au fichier d'audit JSONL. Par défaut, 'True'.
+
+    do_load : bool, optionnel
+        Si 'True', les documents transformés sont chargés dans Elasticsearch. Par défaut, 'True'.
+        Sans chargement, les repères d'extraction ne sont pas mis à jour.
+
+    es_host : str, optionnel
+        URL du cluster Elasticsearch. Par défaut, 'ES_HOST'.
+
+    full_rescan : bool, optionnel
+        Si 'True', toutes les pages demandées sont extraites, même les avis déjà ingérés. Par défaut, 'False'.
+
+    Returns
+    --------
+    int
+        Nombre de documents transformés et chargés.
+
+    Raises
+    -----
+    Exception
+        Si une étape échoue (les autres étapes sont alors interrompues).
+    """
+    logger.info(f"Démarrage du pipeline ETL Reviews en flux (pages={max_pages})")
+
+    sinks = []
+    if do_save:
+        jsonl_path = FileUtils.new_jsonl_path("reviews")
+        sinks.append(lambda documents: FileUtils.append_to_jsonl(documents, jsonl_path))
+        logger.info(f"Fichier d'audit JSONL : {jsonl_path}")
+    if do_load:
+        # Connexion et vérification de l'index une seule fois pour toutes les pages
+        es = connect_elasticsearch(es_host)
+        create_index_if_not_exists(es=es, index="reviews")
+        sinks.append(lambda documents: bulk_upsert_documents(es, documents, index="reviews"))
+
+    # Entreprises dont au moins un avis n'a pu être scoré : leur repère n'avance pas
+    unscored_enterprises: Set[str] = set()
+
+    def transform_page(page: Dict[str, Any]) -> List[Dict[str, Any]]:
+        unscored: List[str] = []
+        documents = transform_reviews_for_elasticsearch([page], unscored=unscored)
+        if unscored:
+            unscored_enterprises.add(page["enterprise_url"])
+        return documents
+
+    mark_store, high_water_marks = _open_high_water_marks(full_rescan)
+    new_marks: Dict[str, Dict[str, str]] = {}
+    errors: Dict[str, bool] = {}
+    review_counts: Dict[str, int] = {}
+    pages = _track_newest_reviews(
+        iter_review_pages(max_pages, high_water_marks=high_water_marks), new_marks, errors, review_counts)
+    try:
+        total = asyncio.run(run_streaming_pipeline(pages, transform_page, sinks))
+        _check_extraction(errors, sum(review_counts.values()))
+        # Repères enregistrés uniquement après le chargement de toutes les pages dans Elasticsearch
+        if mark_store is not None and not do_load:
+            logger.info("Chargement Elasticsearch non effectué : repères d'extraction inchangés")
+        elif mark_store is not None:
+            _save_marks(
+                mark_store, new_marks, {url for url, error in errors.items() if error} | unscored_enterprises)
+    finally:
+        if mark_store is not None:
+            mark_store.close()
+    _compact_sentiment_store()
+    logger.success(f"Pipeline ETL en flux terminé : {total} documents traités")
+    return total
 
 
 def run_reviews_etl(
@@ -26,7 +260,9 @@ def run_reviews_etl(
     do_extract: bool = True,
     do_transform: bool = True,
     do_save: bool = True,
-    do_load: bool = True
+    do_load: bool = True,
+    streaming: Optional[bool] = None,
+    full_rescan: bool = False
 ) -> None:
     """
     Lance le pipeline ETL complet des avis avec des options pour exécuter chaque étape.
@@ -51,23 +287,55 @@ def run_reviews_etl(
 
     do_load : bool, optionnel
         Si 'True', les documents transformés sont chargés dans Elasticsearch via l'API 'bulk'. Par défaut, 'False'.
+        Les repères d'extraction ne sont mis à jour que si la transformation et le chargement ont été effectués.
+
+    streaming : bool, optionnel
+        Si 'True', l'extraction et la transformation s'exécutent en flux avec la sauvegarde et le
+        chargement (voir 'run_reviews_etl_streaming'). Par défaut, 'ETL_STREAMING' (configuration).
+
+    full_rescan : bool, optionnel
+        Si 'True', toutes les pages demandées sont extraites, même les avis déjà ingérés lors
+        d'une exécution précédente. Par défaut, 'False' (extraction incrémentale).
 
     Raises
     -----
     Exception
         Si une erreur se produit à n'importe quelle étape du pipeline (extraction, transformation, sauvegarde, chargement).
     """
+    # Le mode flux enchaîne l'extraction et la transformation : il ne s'applique qu'au pipeline complet
+    if (ETL_STREAMING if streaming is None else streaming) and do_extract and do_transform:
+        try:
+            run_reviews_etl_streaming(max_pages, do_save=do_save, do_load=do_load, full_rescan=full_rescan)
+        except Exception as e:
+            logger.exception(f"✖ Erreur lors du pipeline ETL en flux : {e}")
+        return
+
     logger.info(f"Démarrage du pipeline ETL Reviews (pages={max_pages})")
 
     extract_raw: List[Dict] = []
     transform_docs: List[Dict] = []
+    # 'id_review' des avis dont le sentiment n'a pu être prédit
+    unscored: List[str] = []
+    # Les repères d'extraction ne sont mis à jour que si toutes les étapes ont réussi, et si les
+    # avis ont été transformés et chargés dans Elasticsearch lors de cette exécution
+    succeeded = True
+    mark_store, high_water_marks = _open_high_water_marks(full_rescan) if do_extract else (None, None)
 
     # ---- Extraction ----
     if do_extract:
         try:
             logger.info("[1/4] Extraction des avis...")
             extract_raw = asyncio.run(
-                get_reviews_from_trustpilot(max_pages=max_pages))
+                get_reviews_from_trustpilot(max_pages=max_pages, high_water_marks=high_water_marks))
+            _check_extraction(
+                {raw["enterprise_url"]: raw.get("error", False) for raw in extract_raw},
+                sum(len(raw["reviews"]) for raw in extract_raw))
+
+            if high_water_marks is not None and extract_raw and not any(raw["reviews"] for raw in extract_raw):
+                # Extraction incrémentale sans nouvel avis : rien à transformer ni à charger
+                logger.success("Aucun nouvel avis depuis la dernière exécution")
+                mark_store.close()
+                return
 
             # Sauvegarde via FileUtils
             FileUtils.save_to_json(extract_raw, "extract_raw")
@@ -76,6 +344,7 @@ def run_reviews_etl(
                 f"Extraction terminée : {len(extract_raw)} reviews récupérées")
         except Exception as e:
             logger.exception(f"✖ Erreur lors de l'extraction : {e}")
+            succeeded = False
 
     # ---- Transformation ----
     if do_transform:
@@ -89,7 +358,7 @@ def run_reviews_etl(
                     raise ValueError("Aucune donnée à transformer")
 
             logger.info("[2/4] Transformation des avis...")
-            transform_docs = transform_reviews_for_elasticsearch(extract_raw)
+            transform_docs = transform_reviews_for_elasticsearch(extract_raw, unscored=unscored)
             logger.success(
                 f"Transformation terminée : {len(transform_docs)} documents prêts pour Elasticsearch")
 
@@ -101,6 +370,10 @@ def run_reviews_etl(
 
         except Exception as e:
             logger.exception(f"✖ Erreur lors de la transformation : {e}")
+            succeeded = False
+
+        # Compaction du store des sentiments (versions de modèle obsolètes, entrées anciennes)
+        _compact_sentiment_store()
 
     # ---- Sauvegarde JSONL ----
     if do_save:
@@ -118,6 +391,7 @@ def run_reviews_etl(
             logger.info(f"Données sauvegardées : {jsonl_path}")
         except Exception as e:
             logger.exception(f"✖ Erreur lors de la sauvegarde JSONL : {e}")
+            succeeded = False
 
     # ---- Chargement Elasticsearch ----
     if do_load:
@@ -137,3 +411,21 @@ def run_reviews_etl(
         except Exception as e:
             logger.exception(
                 f"✖ Erreur lors du chargement Elasticsearch : {e}")
+            succeeded = False
+
+    # ---- Repères d'extraction ----
+    if mark_store is not None:
+        if succeeded and not (do_transform and do_load):
+            logger.info("Transformation ou chargement non effectué : repères d'extraction inchangés")
+        elif succeeded:
+            new_marks: Dict[str, Dict[str, str]] = {}
+            for raw in extract_raw:
+                _merge_newest_mark(new_marks, raw["enterprise_url"], raw["reviews"])
+            # Entreprises en échec ou ayant des avis non scorés : repère inchangé, avis revus à l'exécution suivante
+            unscored_ids = set(unscored)
+            failed = {
+                raw["enterprise_url"] for raw in extract_raw
+                if raw.get("error") or any(review.get("id") in unscored_ids for review in raw["reviews"])
+            }
+            _save_marks(mark_store, new_marks, failed)
+        mark_store.close()
@@ -0,0 +1,116 @@
+# File: src\etl\pipeline\streaming_etl.py
+
+"""
+Module de l'ETL en flux : extraction, transformation et chargement reliés par des files bornées.
+
+Chaque page d'avis extraite est transformée puis chargée (fichier d'audit JSONL, Elasticsearch)
+sans attendre la fin de l'extraction. Les files entre les étapes sont bornées : une étape lente
+bloque l'étape précédente (contre-pression), si bien que la mémoire utilisée dépend de la taille
+des files et non du volume extrait.
+
+Les étapes bloquantes (transformation, écritures) sont exécutées dans des threads afin de ne
+pas bloquer la boucle asyncio de l'extraction.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from loguru import logger
+from etl.config.config import STREAM_QUEUE_SIZE
+
+
+# Marqueur de fin de flux transmis d'une étape à la suivante
+_END_OF_STREAM = object()
+
+
+async def _extract_stage(pages: AsyncIterator[Dict[str, Any]], raw_queue: asyncio.Queue) -> None:
+    """
+    Place les pages extraites dans la file des pages brutes (bloque si la file est pleine).
+
+    En cas d'erreur, le marqueur de fin n'est pas transmis : 'run_streaming_pipeline' annule
+    alors les autres étapes.
+    """
+    async for page in pages:
+        await raw_queue.put(page)
+    await raw_queue.put(_END_OF_STREAM)
+
+
+async def _transform_stage(
+    transform: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+    raw_queue: asyncio.Queue,
+    docs_queue: asyncio.Queue
+) -> None:
+    """Transforme chaque page brute et place les documents dans la file de chargement."""
+    while (page := await raw_queue.get()) is not _END_OF_STREAM:
+        documents = await asyncio.to_thread(transform, page)
+        if documents:
+            await docs_queue.put(documents)
+    await docs_queue.put(_END_OF_STREAM)
+
+
+async def _load_stage(
+    sinks: List[Callable[[List[Dict[str, Any]]], None]],
+    docs_queue: asyncio.Queue
+) -> int:
+    """Transmet chaque lot de documents aux destinations (audit, Elasticsearch), dans l'ordre."""
+    total = 0
+    while (documents := await docs_queue.get()) is not _END_OF_STREAM:
+        for sink in sinks:
+            await asyncio.to_thread(sink, documents)
+        total += len(documents)
+    return total
+
+
+async def run_streaming_pipeline(
+    pages: AsyncIterator[Dict[str, Any]],
+    transform: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+    sinks: List[Callable[[List[Dict[str, Any]]], None]],
+    queue_size: Optional[int] = None
+) -> int:
+    """
+    Exécute l'ETL en flux : extraction, transformation et chargement en parallèle.
+
+    Parameters
+    ----------
+    pages : AsyncIterator[Dict[str, Any]]
+        Pages extraites (par exemple 'iter_review_pages').
+
+    transform : Callable[[Dict[str, Any]], List[Dict[str, Any]]]
+        Transformation d'une page brute en documents (fonction bloquante, exécutée dans un thread).
+
+    sinks : List[Callable[[List[Dict[str, Any]]], None]]
+        Destinations des documents transformés, appelées dans l'ordre pour chaque lot.
+
+    queue_size : int, optionnel
+        Nombre maximal de lots en attente entre deux étapes. Par défaut, 'STREAM_QUEUE_SIZE'.
+
+    Returns
+    -------
+    int
+        Nombre de documents chargés.
+
+    Raises
+    ------
+    Exception
+        La première erreur d'une étape : les autres étapes sont alors annulées.
+    """
+    maxsize = max(1, queue_size or STREAM_QUEUE_SIZE)
+    raw_queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    docs_queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    tasks = [
+        asyncio.ensure_future(_extract_stage(pages, raw_queue)),
+        asyncio.ensure_future(_transform_stage(transform, raw_queue, docs_queue)),
+        asyncio.ensure_future(_load_stage(sinks, docs_queue)),
+    ]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # Une étape a échoué : les autres ne doivent pas rester bloquées sur une file
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    total = results[-1]
+    logger.info(f"ETL en flux terminé : {total} documents chargés")
+    return total
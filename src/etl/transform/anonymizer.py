@@ -0,0 +1,126 @@
+# File: src\etl\transform\anonymizer.py
+
+"""
+Module du moteur d'anonymisation des avis et des réponses des entreprises.
+
+Les règles (emails, téléphones, salutations, civilités, signatures) sont compilées une
+seule fois à l'import et appliquées dans l'ordre : chaque règle s'applique au résultat de
+la précédente (la normalisation des salutations alimente la règle "Bonjour + nom"), elles
+ne peuvent donc pas être fusionnées en une seule expression sans changer le résultat.
+Chaque règle est précédée d'un test rapide (recherche d'un caractère ou d'une sous-chaîne
+indispensable à une correspondance) qui évite de parcourir le texte avec l'expression
+régulière lorsqu'elle ne peut pas correspondre.
+
+Les lots volumineux sont répartis sur plusieurs processus : les expressions régulières
+gardent le GIL, des threads n'apporteraient aucun parallélisme.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Pattern, Tuple
+from etl.config.config import ANONYMIZE_PARALLEL_MIN_CHARS, ANONYMIZE_WORKERS
+
+
+def _may_contain_on(text: str) -> bool:
+    """Toutes les salutations ciblées contiennent "on" (Bonjour, Bonsoir, Bonour, ...)."""
+    return "on" in text or "ON" in text or "On" in text or "oN" in text
+
+
+# Règles : (expression compilée, remplacement, test rapide ou None)
+# Le test rapide retourne False uniquement si l'expression ne peut pas correspondre.
+ANONYMIZATION_RULES: List[Tuple[Pattern, str, Optional[Callable[[str], bool]]]] = [
+    # 1. Emails
+    (
+        re.compile(r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b"),
+        "[EMAIL_SUPPRIMÉ]",
+        lambda text: "@" in text,
+    ),
+    # 2. Téléphones FR (inclut +33(0)6...)
+    (
+        re.compile(r"(?:\+33\s*\(?0?\)?|0)[1-9](?:[\s.\-]?\d{2}){4}"),
+        "[TÉLÉPHONE_SUPPRIMÉ]",
+        lambda text: "0" in text or "+33" in text,
+    ),
+    # 3. Normaliser fautes courantes de salutation (multiligne)
+    (
+        re.compile(r"(?im)^(Bonour|Bonnour|Bonjouir|Bonsoir|Bonoir)"),
+        "Bonjour",
+        _may_contain_on,
+    ),
+    # 4. Bonjour + TOUT ce qui suit (prénom, nom, civilité, composé) règle atomique pour éviter les doublons
+    (
+        re.compile(r"(?im)^Bonjour\s+[^\n,]+(?:\s*,)?\s*$"),
+        "Bonjour [NOM_ANONYMISÉ],",
+        _may_contain_on,
+    ),
+    # 5. Civilité + nom/prénom ailleurs dans le texte
+    (
+        re.compile(
+            r"\b(MR|M|MME|Mme|Monsieur|Madame|Melle)\s+"
+            r"[A-Za-zÀ-ÖØ-öø-ÿ-]+(?:\s+[A-Za-zÀ-ÖØ-öø-ÿ-]+)*\b",
+            flags=re.IGNORECASE,
+        ),
+        "[NOM_ANONYMISÉ]",
+        lambda text: "m" in text or "M" in text,
+    ),
+    # 6. Signature : ligne contenant uniquement un prénom ou prénom + nom
+    (
+        re.compile(
+            r"(?m)^(?:[A-ZÀ-ÖØ-Þ][a-zà-öø-ÿ-]+)"
+            r"(?:\s+[A-ZÀ-ÖØ-Þ][a-zà-öø-ÿ-]+)*[.,]?$"
+        ),
+        "[NOM_ANONYMISÉ]",
+        None,
+    ),
+]
+
+
+def anonymize_text(text: str) -> str:
+    """
+    Anonymise un texte en remplaçant les fautes de salutation, prénoms et noms par des valeurs génériques.
+    Vérifier à l'aide de https://regex101.com/
+
+    Parameters
+    ----------
+    text : str
+        Texte à anonymiser.
+
+    Returns
+    ---------
+    str
+        Texte anonymisé.
+    """
+    for pattern, replacement, may_match in ANONYMIZATION_RULES:
+        if may_match is None or may_match(text):
+            text = pattern.sub(replacement, text)
+    return text
+
+
+def anonymize_texts(texts: List[str], workers: int = ANONYMIZE_WORKERS) -> List[str]:
+    """
+    Anonymise une liste de textes, en parallèle sur plusieurs processus pour les gros lots.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Textes à anonymiser.
+
+    workers : int, optionnel
+        Nombre de processus ('0' : nombre de cœurs). Par défaut, 'ANONYMIZE_WORKERS'.
+
+    Returns
+    -------
+    List[str]
+        Textes anonymisés, dans le même ordre.
+    """
+    workers = workers or os.cpu_count() or 1
+    total_chars = sum(len(text) for text in texts)
+
+    # Petits lots : le démarrage des processus coûterait plus que l'anonymisation
+    if workers <= 1 or total_chars < ANONYMIZE_PARALLEL_MIN_CHARS:
+        return [anonymize_text(text) for text in texts]
+
+    chunksize = max(1, len(texts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(anonymize_text, texts, chunksize=chunksize))
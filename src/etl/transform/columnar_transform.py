@@ -0,0 +1,269 @@
+# File: src\etl\transform\columnar_transform.py
+
+"""
+Module du moteur de transformation par colonnes (NumPy) des avis.
+
+Variante du moteur par lignes de 'transform_reviews' ('TRANSFORM_ENGINE="columnar"') : les
+champs des avis sont extraits en colonnes, convertis par des opérations vectorisées (notes,
+badge "vérifié", dates, pourcentages des entreprises), et les documents Elasticsearch ne sont
+construits qu'à la fin, à partir des colonnes. Le résultat est identique au moteur par lignes :
+toute valeur qui sort du format attendu est convertie par la fonction de 'DataUtils'
+correspondante.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from etl.transform.anonymizer import anonymize_texts
+from etl.transform.transform_reviews import STAR_PROBABILITY_FIELDS, _enterprise_fields
+from etl.utils.data_utils import DataUtils
+
+
+# Formats de date de l'API validés par colonnes : "2024-03-01T10:00:00.000Z" (24 caractères)
+# et "2024-03-01" (10 caractères). Pour ces formats, 'datetime.fromisoformat' retourne la date
+# du préfixe 'YYYY-MM-DD' ; les autres formats passent par 'DataUtils.format_date'.
+_TIMESTAMP_LENGTH = 24
+_TIMESTAMP_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18, 20, 21, 22]
+_TIMESTAMP_SEPARATORS = {4: "-", 7: "-", 10: "T", 13: ":", 16: ":", 19: ".", 23: "Z"}
+_DATE_LENGTH = 10
+_DATE_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9]
+_DATE_SEPARATORS = {4: "-", 7: "-"}
+# Nombre de jours de chaque mois (index 1 à 12) d'une année non bissextile
+_DAYS_IN_MONTH = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+# Champs de notes des entreprises, dans l'ordre des pourcentages
+_RATING_KEYS: List[str] = ["one", "two", "three", "four", "five"]
+_PERCENTAGE_FIELDS: List[str] = [
+    "enterprise_percentage_one_star",
+    "enterprise_percentage_two_star",
+    "enterprise_percentage_three_star",
+    "enterprise_percentage_four_star",
+    "enterprise_percentage_five_star",
+]
+
+
+# Types convertis à l'identique par NumPy et par 'float' (bool exclu)
+_NUMBER_TYPES = {int, float}
+
+
+def _are_numbers(values: List[Any]) -> bool:
+    """Vrai si toutes les valeurs sont des int ou des float (hors bool)."""
+    return set(map(type, values)) <= _NUMBER_TYPES
+
+
+def _two_digits(codes: np.ndarray, position: int) -> np.ndarray:
+    """Valeur du nombre à deux chiffres écrit à 'position' (codes Unicode des caractères)."""
+    return (codes[:, position].astype(np.int64) - 48) * 10 + codes[:, position + 1].astype(np.int64) - 48
+
+
+def _matches_layout(codes: np.ndarray, digits: List[int], separators: Dict[int, str]) -> np.ndarray:
+    """Masque des lignes dont les caractères sont des chiffres / séparateurs aux positions attendues."""
+    # Codes non signés : un caractère inférieur à "0" donne une grande valeur après soustraction
+    mask = ((codes[:, digits] - np.uint32(48)) < 10).all(axis=1)
+    positions = list(separators)
+    expected = np.array([ord(separators[position]) for position in positions], dtype=np.uint32)
+    return mask & (codes[:, positions] == expected).all(axis=1)
+
+
+def format_dates(values: List[Optional[str]]) -> List[Optional[str]]:
+    """
+    Convertit une colonne de dates ISO en dates 'YYYY-MM-DD' (identique à 'DataUtils.format_date').
+
+    Les dates au format de l'API sont validées par opérations vectorisées sur la matrice des
+    codes de caractères (disposition, heures, minutes, secondes, mois, jour du mois) ; les
+    autres valeurs sont converties une à une par 'DataUtils.format_date'.
+
+    Parameters
+    ----------
+    values : List[str, optionnel]
+        Dates brutes de l'API.
+
+    Returns
+    -------
+    List[str, optionnel]
+        Dates formatées, ou 'None' pour une date absente ou invalide.
+    """
+    count = len(values)
+    if not count:
+        return []
+
+    strings = [value if type(value) is str else "" for value in values]
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=count)
+    # Matrice (dates x 24) des codes Unicode (UCS-4) des caractères, complétée par des zéros
+    codes = np.array(strings, dtype=f"U{_TIMESTAMP_LENGTH}").view(np.uint32).reshape(count, _TIMESTAMP_LENGTH)
+
+    timestamps = (lengths == _TIMESTAMP_LENGTH) & _matches_layout(codes, _TIMESTAMP_DIGITS, _TIMESTAMP_SEPARATORS)
+    timestamps &= (_two_digits(codes, 11) < 24) & (_two_digits(codes, 14) < 60) & (_two_digits(codes, 17) < 60)
+    dates_only = (lengths == _DATE_LENGTH) & _matches_layout(codes, _DATE_DIGITS, _DATE_SEPARATORS)
+    fast = timestamps | dates_only
+
+    # Validité de la date : année 0001 à 9999, mois 1 à 12, jour dans le mois (années bissextiles)
+    year = _two_digits(codes, 0) * 100 + _two_digits(codes, 2)
+    month = _two_digits(codes, 5)
+    day = _two_digits(codes, 8)
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    fast &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+    fast &= day <= _DAYS_IN_MONTH[np.clip(month, 1, 12)] + ((month == 2) & leap)
+
+    result = np.full(count, None, dtype=object)
+    if fast.any():
+        # Préfixe 'YYYY-MM-DD' des dates retenues, reconstruit à partir des codes
+        result[fast] = np.ascontiguousarray(codes[fast, :_DATE_LENGTH]).view(f"U{_DATE_LENGTH}").ravel().tolist()
+
+    for index in np.flatnonzero(~fast):
+        result[index] = DataUtils.format_date(values[index])
+    return result.tolist()
+
+
+def to_floats(values: List[Any]) -> List[float]:
+    """
+    Convertit une colonne de valeurs en floats (identique à 'DataUtils.to_float').
+
+    Parameters
+    ----------
+    values : List[Any]
+        Valeurs brutes (notes).
+
+    Returns
+    -------
+    List[float]
+        Valeurs converties ('0.0' si la conversion échoue).
+    """
+    if _are_numbers(values):
+        return np.asarray(values, dtype=np.float64).tolist()
+    return [DataUtils.to_float(value) for value in values]
+
+
+def enterprise_percentages(raw_list: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+    """
+    Calcule les pourcentages de chaque note pour toutes les entreprises en une opération.
+
+    Parameters
+    ----------
+    raw_list : List[Dict[str, Any]]
+        Extractions brutes des entreprises.
+
+    Returns
+    -------
+    np.ndarray, optionnel
+        Matrice (entreprises x 5) des pourcentages arrondis au supérieur, ou 'None' si une
+        note n'est pas numérique ou finie (calcul entreprise par entreprise dans ce cas).
+    """
+    ratings = [raw.get("enterprise", {}).get("ratings", {}) for raw in raw_list]
+    counts = [[rating.get(key, 0) for key in _RATING_KEYS] for rating in ratings]
+    totals = [rating.get("total", 0) for rating in ratings]
+    if not _are_numbers(totals) or not all(_are_numbers(row) for row in counts):
+        return None
+
+    # Mêmes opérations flottantes que 'math.ceil(count / total * 100)', total ramené à 1 au minimum
+    totals_array = np.maximum(np.asarray(totals, dtype=np.float64), 1).reshape(-1, 1)
+    percentages = np.ceil(np.asarray(counts, dtype=np.float64).reshape(-1, 5) / totals_array * 100)
+    if not np.isfinite(percentages).all():
+        return None
+    return percentages.astype(np.int64)
+
+
+def enterprise_fields_columnar(raw_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Calcule les champs entreprise de toutes les entreprises (pourcentages vectorisés).
+
+    Parameters
+    ----------
+    raw_list : List[Dict[str, Any]]
+        Extractions brutes des entreprises.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Les champs entreprise, dans l'ordre de 'raw_list' (calculés entreprise par entreprise
+        par le moteur par lignes si une note n'est pas numérique).
+    """
+    percentages = enterprise_percentages(raw_list)
+    if percentages is None:
+        return [_enterprise_fields(raw) for raw in raw_list]
+
+    fields_list = []
+    for raw, row in zip(raw_list, percentages.tolist()):
+        enterprise_url: str = raw.get("enterprise_url", "")
+        enterprise_info: Dict[str, Any] = raw.get("enterprise", {})
+        fields_list.append({
+            "enterprise_name": DataUtils.clean_text(enterprise_info.get("name") or enterprise_url),
+            "enterprise_url": enterprise_url,
+            "enterprise_rating": DataUtils.to_float(enterprise_info.get("enterprise_rating")),
+            "enterprise_review_number": DataUtils.to_int(enterprise_info.get("enterprise_review_number")),
+            **dict(zip(_PERCENTAGE_FIELDS, row)),
+        })
+    return fields_list
+
+
+def transform_chunk_columnar(
+    items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    anonymize_workers: int = 1
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Transforme un lot d'avis par colonnes (même contrat que '_transform_chunk' du moteur par lignes).
+
+    Parameters
+    ----------
+    items : List[Tuple[Dict[str, Any], Dict[str, Any]]]
+        Couples (champs de l'entreprise, avis brut), dans l'ordre des documents à produire.
+
+    anonymize_workers : int, optionnel
+        Nombre de processus de l'anonymisation du lot. Par défaut, 1 (dans le processus courant).
+
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], List[int]]
+        Les documents du lot, dans l'ordre de 'items', et les positions (dans le lot) des
+        documents dont l'avis est renseigné (sentiment à prédire).
+    """
+    reviews = [review for _, review in items]
+    replies = [review.get("reply", {}) for review in reviews]
+
+    # ---- Extraction des colonnes ----
+    ids = [review.get("id") for review in reviews]
+    verified = np.array(
+        [review.get("labels", {}).get("verification", {}).get("isVerified", False) for review in reviews],
+        dtype=object).astype(bool)
+    ratings = to_floats([review.get("rating") for review in reviews])
+    dates_review = format_dates([review.get("dates", {}).get("publishedDate") for review in reviews])
+    dates_response = format_dates([reply.get("publishedDate") if reply else None for reply in replies])
+    user_ids = DataUtils.clean_texts([review.get("consumer", {}).get("id") for review in reviews])
+    texts = DataUtils.clean_texts([review.get("text") for review in reviews])
+    reply_texts = DataUtils.clean_texts([reply.get("message") if reply else None for reply in replies])
+
+    # ---- Anonymisation des avis et des réponses renseignés, en un lot ----
+    has_text = np.fromiter((bool(text) for text in texts), dtype=bool, count=len(texts))
+    has_reply = np.fromiter((bool(text) for text in reply_texts), dtype=bool, count=len(reply_texts))
+    anonymized = anonymize_texts(
+        [text for text in texts if text] + [text for text in reply_texts if text], workers=anonymize_workers)
+
+    user_reviews = np.full(len(items), "indisponible", dtype=object)
+    user_reviews[has_text] = anonymized[:int(has_text.sum())]
+    responses = np.full(len(items), "indisponible", dtype=object)
+    responses[has_reply] = anonymized[int(has_text.sum()):]
+    user_reviews = user_reviews.tolist()
+    lengths = [len(text) for text in user_reviews]
+
+    # ---- Construction des documents, en fin de transformation ----
+    star_defaults = dict.fromkeys(STAR_PROBABILITY_FIELDS)
+    documents = [
+        {
+            "id_review": id_review,
+            "is_verified": is_verified,
+            "date_review": date_review,
+            "id_user": id_user,
+            "user_review": user_review,
+            "user_review_length": length,
+            "user_rating": rating,
+            "user_sentiment": "Indéfini",
+            **star_defaults,
+            "date_response": date_response,
+            "enterprise_response": response,
+            **enterprise_fields,
+        }
+        for id_review, is_verified, date_review, id_user, user_review, length, rating, date_response, response,
+        (enterprise_fields, _) in zip(
+            ids, verified.tolist(), dates_review, user_ids, user_reviews, lengths, ratings,
+            dates_response, responses.tolist(), items)
+    ]
+    return documents, np.flatnonzero(has_text).tolist()
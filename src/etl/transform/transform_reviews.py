@@ -9,68 +9,44 @@ les informations sont nettoyées et formatées pour une insertion efficace dans
 """
 
 import math
-import re
+import os
+import sqlite3
 import requests
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
+from etl.config.config import (
+    ANONYMIZE_WORKERS,
+    PREDICT_API_URL,
+    PREDICT_BATCH_API_URL,
+    PREDICT_MODEL_API_URL,
+    SENTIMENT_CHUNK_SIZE,
+    SENTIMENT_MAX_CONCURRENCY,
+    SENTIMENT_MODE,
+    SENTIMENT_MODEL_VERSION,
+    SENTIMENT_STORE_ENABLED,
+    SENTIMENT_STORE_PATH,
+    SENTIMENT_TIMEOUT_SECONDS,
+    TRANSFORM_CHUNK_SIZE,
+    TRANSFORM_ENGINE,
+    TRANSFORM_PARALLEL_MIN_REVIEWS,
+    TRANSFORM_WORKERS,
+)
+from etl.transform.anonymizer import anonymize_text, anonymize_texts  # noqa: F401 (anonymize_text ré-exporté)
 from etl.utils.data_utils import DataUtils
+from etl.utils.sentiment_session import SentimentApiSession
+from etl.utils.sentiment_store import SentimentStore, open_sentiment_store
 
 
-def anonymize_text(text: str) -> str:
-    """
-    Anonymise un texte en remplaçant les fautes de salutation, prénoms et noms par des valeurs génériques.
-    Vérifier à l'aide de https://regex101.com/
-
-    Parameters
-    ----------
-    text : str
-        Texte à anonymiser.
+# Champs des probabilités de 1 à 5 étoiles (même ordre que la sortie du modèle)
+STAR_PROBABILITY_FIELDS: List[str] = [
+    "user_sentiment_probability_one_star",
+    "user_sentiment_probability_two_star",
+    "user_sentiment_probability_three_star",
+    "user_sentiment_probability_four_star",
+    "user_sentiment_probability_five_star",
+]
 
-    Returns
-    ---------
-    str
-        Texte anonymisé.
-    """
-    # 1. Emails
-    text = re.sub(
-        r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b",
-        "[EMAIL_SUPPRIMÉ]",
-        text,
-    )
-    # 2. Téléphones FR (inclut +33(0)6...)
-    text = re.sub(
-        r"(?:\+33\s*\(?0?\)?|0)[1-9](?:[\s.\-]?\d{2}){4}",
-        "[TÉLÉPHONE_SUPPRIMÉ]",
-        text,
-    )
-    # 3. Normaliser fautes courantes de salutation (multiligne)
-    text = re.sub(
-        r"(?im)^(Bonour|Bonnour|Bonjouir|Bonsoir|Bonoir)",
-        "Bonjour",
-        text,
-    )
-    # 4. Bonjour + TOUT ce qui suit (prénom, nom, civilité, composé) règle atomique pour éviter les doublons
-    text = re.sub(
-        r"(?im)^Bonjour\s+[^\n,]+(?:\s*,)?\s*$",
-        "Bonjour [NOM_ANONYMISÉ],",
-        text,
-    )
-    # 5. Civilité + nom/prénom ailleurs dans le texte
-    text = re.sub(
-        r"\b(MR|M|MME|Mme|Monsieur|Madame|Melle)\s+"
-        r"[A-Za-zÀ-ÖØ-öø-ÿ-]+(?:\s+[A-Za-zÀ-ÖØ-öø-ÿ-]+)*\b",
-        "[NOM_ANONYMISÉ]",
-        text,
-        flags=re.IGNORECASE,
-    )
-    # 6. Signature : ligne contenant uniquement un prénom ou prénom + nom
-    text = re.sub(
-        r"(?m)^(?:[A-ZÀ-ÖØ-Þ][a-zà-öø-ÿ-]+)"
-        r"(?:\s+[A-ZÀ-ÖØ-Þ][a-zà-öø-ÿ-]+)*[.,]?$",
-        "[NOM_ANONYMISÉ]",
-        text,
-    )
-    return text
 
 def predict_sentiment_from_api(text: str) -> Dict[str, Any]:
     """
@@ -84,13 +60,13 @@ def predict_sentiment_from_api(text: str) -> Dict[str, Any]:
     Returns
     -------
     Dict[str, Any]
-        Dictionnaire contenant le sentiment prédit.
+        Dictionnaire contenant le sentiment prédit et les probabilités de 1 à 5 étoiles.
     """
-    PREDICT_API_URL = "http://fastapi:8000/predict"
     payload = {"text": text}
     
     try:
-        response = requests.post(PREDICT_API_URL, json=payload)
+        response = SentimentApiSession.get_session().post(
+            PREDICT_API_URL, json=payload, timeout=SENTIMENT_TIMEOUT_SECONDS)
         # Lève une exception pour un code d'erreur HTTP
         response.raise_for_status()
         sentiment_info = response.json()
@@ -100,7 +76,427 @@ def predict_sentiment_from_api(text: str) -> Dict[str, Any]:
         print(f"Erreur lors de l'appel à FastAPI: {e}")
         return {"sentiment": "Indéfini"}
 
-def transform_reviews_for_elasticsearch(raw_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+def _predict_chunk_from_api(texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Appelle la route FastAPI '/predict/batch' pour un lot de textes.
+
+    Les nouvelles tentatives (erreurs réseau, 429, 502, 503, 504) sont gérées par la session ;
+    si le lot échoue malgré tout, chaque texte reçoit le sentiment "Indéfini".
+
+    Parameters
+    ----------
+    texts : List[str]
+        Textes des avis du lot.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Un résultat par texte, dans le même ordre, avec la version du modèle ('model_version').
+    """
+    try:
+        response = SentimentApiSession.get_session().post(
+            PREDICT_BATCH_API_URL, json={"texts": texts}, timeout=SENTIMENT_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        payload = response.json()
+        results: List[Dict[str, Any]] = [{"sentiment": "Indéfini"}] * len(texts)
+        # Résultats replacés par position (champ 'index' de la réponse)
+        for item in payload["results"]:
+            if not item.get("error"):
+                results[item["index"]] = {**item, "model_version": payload.get("model_version")}
+        return results
+    except (requests.exceptions.RequestException, ValueError, KeyError, IndexError) as e:
+        logger.error(f"Erreur lors de l'appel à FastAPI pour un lot de {len(texts)} avis : {e}")
+        return [{"sentiment": "Indéfini"} for _ in texts]
+
+
+def predict_sentiments_from_api(texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Prédit le sentiment d'une liste de textes via '/predict/batch', par lots envoyés en parallèle.
+
+    Les textes sont découpés en lots de 'SENTIMENT_CHUNK_SIZE', envoyés par au plus
+    'SENTIMENT_MAX_CONCURRENCY' appels simultanés sur des connexions keep-alive, puis
+    les résultats sont réassemblés dans l'ordre des textes.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Textes des avis à analyser.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Un dictionnaire par texte (sentiment et probabilités), dans le même ordre que 'texts'.
+    """
+    if not texts:
+        return []
+
+    chunk_size = max(1, SENTIMENT_CHUNK_SIZE)
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(SENTIMENT_MAX_CONCURRENCY, len(chunks)))) as executor:
+        chunk_results = list(executor.map(_predict_chunk_from_api, chunks))
+
+    return [result for results in chunk_results for result in results]
+
+
+def predict_sentiments_in_process(texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Prédit le sentiment d'une liste de textes avec le modèle chargé dans le processus courant.
+
+    Évite l'aller-retour HTTP et la double sérialisation JSON : adapté aux rattrapages
+    volumineux sur une machine disposant du modèle. Le modèle est chargé au premier appel.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Textes des avis à analyser.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Un dictionnaire par texte (sentiment, probabilités et version du modèle), dans le même ordre que 'texts'.
+    """
+    # Import local : le modèle (et torch) ne sont nécessaires qu'en mode "local"
+    from machine_learning.predict import model_version, predict_sentiment_batch
+
+    version = model_version()
+    return [
+        {**result, "model_version": version} if not result["error"] else {"sentiment": "Indéfini"}
+        for result in predict_sentiment_batch(texts)
+    ]
+
+
+def sentiment_model_version(mode: Optional[str] = None) -> Optional[str]:
+    """
+    Retourne la version du modèle de sentiment réellement appelé (clé du store des sentiments).
+
+    La version ("<modèle>|<backend>|<quantification>") est lue auprès de l'API
+    ('PREDICT_MODEL_API_URL') ou du modèle local, selon le mode ; 'SENTIMENT_MODEL_VERSION',
+    s'il est renseigné, la force.
+
+    Parameters
+    ----------
+    mode : str, optionnel
+        "http" (API FastAPI) ou "local" (modèle dans le processus). Par défaut, 'SENTIMENT_MODE'.
+
+    Returns
+    -------
+    str, optionnel
+        La version du modèle, ou 'None' si elle est indisponible (API injoignable, mode inconnu).
+    """
+    if SENTIMENT_MODEL_VERSION:
+        return SENTIMENT_MODEL_VERSION
+
+    mode = mode or SENTIMENT_MODE
+    if mode == "local":
+        # Import local : le modèle (et torch) ne sont nécessaires qu'en mode "local"
+        from machine_learning.predict import model_version
+        return model_version()
+    if mode != "http":
+        return None
+    try:
+        response = SentimentApiSession.get_session().get(PREDICT_MODEL_API_URL, timeout=SENTIMENT_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        return response.json()["model_version"]
+    except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+        logger.warning(f"Version du modèle de sentiment indisponible : {e}")
+        return None
+
+
+def predict_sentiments(texts: List[str], mode: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Prédit le sentiment d'une liste de textes selon le mode configuré.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Textes des avis à analyser.
+
+    mode : str, optionnel
+        "http" (API FastAPI) ou "local" (modèle dans le processus). Par défaut, 'SENTIMENT_MODE'.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Un dictionnaire par texte (sentiment et probabilités), dans le même ordre que 'texts'.
+
+    Raises
+    ------
+    ValueError
+        Si le mode est inconnu.
+    """
+    mode = mode or SENTIMENT_MODE
+    if mode == "http":
+        return predict_sentiments_from_api(texts)
+    if mode == "local":
+        return predict_sentiments_in_process(texts)
+    raise ValueError(f"Mode de prédiction du sentiment inconnu : {mode}")
+
+
+def _apply_sentiment(document: Dict[str, Any], sentiment_info: Dict[str, Any]) -> None:
+    """
+    Renseigne le sentiment et les probabilités d'étoiles d'un document transformé.
+
+    Parameters
+    ----------
+    document : Dict[str, Any]
+        Document Elasticsearch en cours de construction.
+
+    sentiment_info : Dict[str, Any]
+        Résultat de prédiction ('sentiment' et 'star_probabilities').
+    """
+    # On récupère le sentiment ou 'Indéfini' si absent
+    document["user_sentiment"] = sentiment_info.get("sentiment") or "Indéfini"
+    # Probabilités de 1 à 5 étoiles (None si indisponibles)
+    document.update(zip(STAR_PROBABILITY_FIELDS, sentiment_info.get("star_probabilities") or []))
+
+
+def _enterprise_fields(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Calcule, une seule fois par entreprise, les champs entreprise communs à tous ses avis.
+
+    Parameters
+    ----------
+    raw : Dict[str, Any]
+        Extraction brute d'une entreprise ('enterprise_url', 'enterprise' et 'reviews').
+
+    Returns
+    -------
+    Dict[str, Any]
+        Nom, URL, note et nombre d'avis de l'entreprise, ainsi que les pourcentages de chaque note.
+    """
+    enterprise_url: str = raw.get("enterprise_url", "")
+    enterprise_info: Dict[str, Any] = raw.get("enterprise", {})
+
+    # Récupération des ratings bruts
+    ratings = enterprise_info.get("ratings", {})
+    total = ratings.get("total", 0)
+    total = max(total, 1)  # évite la division par zéro
+
+    one_star = ratings.get("one", 0)
+    two_star = ratings.get("two", 0)
+    three_star = ratings.get("three", 0)
+    four_star = ratings.get("four", 0)
+    five_star = ratings.get("five", 0)
+
+    return {
+        # Infos entreprise
+        "enterprise_name": DataUtils.clean_text(enterprise_info.get("name") or enterprise_url),
+        "enterprise_url": enterprise_url,
+        "enterprise_rating": DataUtils.to_float(enterprise_info.get("enterprise_rating")),
+        "enterprise_review_number": DataUtils.to_int(enterprise_info.get("enterprise_review_number")),
+
+        # Pourcentages calculés
+        "enterprise_percentage_one_star": math.ceil(one_star / total * 100),
+        "enterprise_percentage_two_star": math.ceil(two_star / total * 100),
+        "enterprise_percentage_three_star": math.ceil(three_star / total * 100),
+        "enterprise_percentage_four_star": math.ceil(four_star / total * 100),
+        "enterprise_percentage_five_star": math.ceil(five_star / total * 100),
+    }
+
+
+def _transform_chunk(
+    items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    anonymize_workers: int = 1
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Transforme un lot d'avis en documents Elasticsearch (sans le sentiment).
+
+    Nettoie et anonymise les textes, formate les dates et les valeurs numériques. Exécutée
+    dans le processus courant ou dans un processus du pool de la transformation parallèle.
+
+    Parameters
+    ----------
+    items : List[Tuple[Dict[str, Any], Dict[str, Any]]]
+        Couples (champs de l'entreprise, avis brut), dans l'ordre des documents à produire.
+
+    anonymize_workers : int, optionnel
+        Nombre de processus de l'anonymisation du lot. Par défaut, 1 (dans le processus courant).
+
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], List[int]]
+        Les documents du lot, dans l'ordre de 'items', et les positions (dans le lot) des
+        documents dont l'avis est renseigné (sentiment à prédire).
+    """
+    documents: List[Dict[str, Any]] = []
+    # (position du document, champ, texte nettoyé) des textes à anonymiser
+    pending_anonymization: List[Tuple[int, str, str]] = []
+
+    # Nettoyage par colonnes : avis utilisateur, réponses entreprise et identifiants
+    # (avis et réponses anonymisés après la boucle, par lots)
+    texts_clean = DataUtils.clean_texts([review.get("text") for _, review in items])
+    replies_clean = DataUtils.clean_texts([(review.get("reply") or {}).get("message") for _, review in items])
+    user_ids_clean = DataUtils.clean_texts([review.get("consumer", {}).get("id") for _, review in items])
+
+    for (enterprise_fields, review), text_clean, reply_clean, user_id_clean in zip(
+            items, texts_clean, replies_clean, user_ids_clean):
+        reply = review.get("reply", {})
+        dates = review.get("dates", {})
+        verification = review.get("labels", {}).get("verification", {})
+
+        position = len(documents)
+        if text_clean:
+            pending_anonymization.append((position, "user_review", text_clean))
+        if reply_clean:
+            pending_anonymization.append((position, "enterprise_response", reply_clean))
+
+        documents.append({
+            "id_review": review.get("id"),
+            "is_verified": bool(verification.get("isVerified", False)),
+            "date_review": DataUtils.format_date(dates.get("publishedDate")),
+            "id_user": user_id_clean,
+            "user_review": "indisponible",
+            "user_review_length": len("indisponible"),
+            "user_rating": DataUtils.to_float(review.get("rating")),
+            "user_sentiment": "Indéfini",
+            **dict.fromkeys(STAR_PROBABILITY_FIELDS),
+            "date_response": DataUtils.format_date(reply.get("publishedDate") if reply else None),
+            "enterprise_response": "indisponible",
+            **enterprise_fields,
+        })
+
+    # Anonymisation des avis et des réponses par lots
+    reviewed_positions: List[int] = []
+    anonymized = anonymize_texts([text for _, _, text in pending_anonymization], workers=anonymize_workers)
+    for (position, field, _), text in zip(pending_anonymization, anonymized):
+        documents[position][field] = text
+        if field == "user_review":
+            documents[position]["user_review_length"] = len(text)
+            reviewed_positions.append(position)
+
+    return documents, reviewed_positions
+
+
+def _transform_documents(
+    items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    workers: int,
+    engine: str = "rows"
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    Transforme tous les avis, en parallèle sur un pool de processus pour les gros volumes.
+
+    Les avis sont découpés en lots de 'TRANSFORM_CHUNK_SIZE' ; les champs de l'entreprise,
+    calculés une fois, accompagnent chaque lot (sérialisés une seule fois par lot). Les
+    lots sont réassemblés dans l'ordre d'origine : le résultat ne dépend pas du nombre
+    de processus.
+
+    Parameters
+    ----------
+    items : List[Tuple[Dict[str, Any], Dict[str, Any]]]
+        Couples (champs de l'entreprise, avis brut).
+
+    workers : int
+        Nombre de processus ('1' : transformation séquentielle, '0' : nombre de cœurs).
+
+    engine : str, optionnel
+        Moteur de transformation des lots : "rows" (un document à la fois) ou "columnar"
+        (opérations vectorisées par colonnes). Par défaut, "rows".
+
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], List[int]]
+        Les documents, dans l'ordre de 'items', et les positions des documents dont
+        l'avis est renseigné.
+    """
+    transform_chunk = _transform_chunk
+    if engine == "columnar":
+        # Import local : NumPy n'est nécessaire qu'avec le moteur par colonnes
+        from etl.transform.columnar_transform import transform_chunk_columnar as transform_chunk
+    elif engine != "rows":
+        raise ValueError(f"Moteur de transformation inconnu : {engine}")
+
+    workers = workers or os.cpu_count() or 1
+
+    # Petits volumes : le démarrage des processus coûterait plus que la transformation
+    if workers <= 1 or len(items) < TRANSFORM_PARALLEL_MIN_REVIEWS:
+        # Anonymisation répartie sur plusieurs processus si le lot est volumineux
+        return transform_chunk(items, anonymize_workers=ANONYMIZE_WORKERS)
+
+    chunk_size = max(1, TRANSFORM_CHUNK_SIZE)
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+    logger.info(f"Transformation de {len(items)} avis en {len(chunks)} lots sur {workers} processus")
+
+    documents: List[Dict[str, Any]] = []
+    reviewed_positions: List[int] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        # 'map' restitue les lots dans l'ordre de soumission
+        for chunk_documents, chunk_positions in executor.map(transform_chunk, chunks):
+            reviewed_positions.extend(len(documents) + position for position in chunk_positions)
+            documents.extend(chunk_documents)
+    return documents, reviewed_positions
+
+
+def _read_sentiment_store(
+    store: Optional[SentimentStore],
+    items: List[Tuple[str, str]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Retourne les sentiments déjà connus du store, ou aucun si le store est absent ou en erreur.
+
+    Le store est une optimisation : en cas d'erreur SQLite (fichier verrouillé, corrompu,
+    disque plein), tous les avis sont scorés à nouveau.
+
+    Parameters
+    ----------
+    store : SentimentStore, optionnel
+        Le store des sentiments, ou 'None'.
+
+    items : List[Tuple[str, str]]
+        Couples (id_review, texte nettoyé).
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        Les sentiments connus par 'id_review'.
+    """
+    if store is None:
+        return {}
+    try:
+        return store.get_many(items)
+    except sqlite3.Error as error:
+        logger.warning(f"Lecture du store des sentiments impossible, tous les avis sont scorés : {error}")
+        return {}
+
+
+def _write_sentiment_store(store: Optional[SentimentStore], items: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+    """
+    Enregistre les sentiments prédits dans le store ; une erreur SQLite est journalisée et ignorée.
+
+    Parameters
+    ----------
+    store : SentimentStore, optionnel
+        Le store des sentiments, ou 'None'.
+
+    items : List[Tuple[str, str, Dict[str, Any]]]
+        Triplets (id_review, texte nettoyé, résultat de la prédiction).
+    """
+    if store is None:
+        return
+    try:
+        store.put_many(items)
+    except sqlite3.Error as error:
+        logger.warning(f"Écriture dans le store des sentiments impossible ({len(items)} avis non conservés) : {error}")
+
+
+def _close_sentiment_store(store: Optional[SentimentStore]) -> None:
+    """Ferme le store des sentiments ; une erreur SQLite est journalisée et ignorée."""
+    if store is None:
+        return
+    try:
+        store.close()
+    except sqlite3.Error as error:
+        logger.warning(f"Fermeture du store des sentiments impossible : {error}")
+
+
+def transform_reviews_for_elasticsearch(
+    raw_list: List[Dict[str, Any]],
+    sentiment_mode: Optional[str] = None,
+    workers: Optional[int] = None,
+    engine: Optional[str] = None,
+    unscored: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """
     Transforme tous les avis de toutes les entreprises en documents prêts pour Elasticsearch,
     en nettoyant les avis et en remplaçant les champs vides par des valeurs par défaut.
@@ -116,6 +512,25 @@ def transform_reviews_for_elasticsearch(raw_list: List[Dict[str, Any]]) -> List[
         Une liste de dictionnaires représentant les avis bruts extraits. Chaque dictionnaire
         contient des informations sur les avis ainsi que sur l'entreprise associée.
 
+    sentiment_mode : str, optionnel
+        Mode de prédiction du sentiment : "http" (API FastAPI) ou "local" (modèle dans le
+        processus). Par défaut, 'SENTIMENT_MODE' (configuration).
+
+    workers : int, optionnel
+        Nombre de processus de la transformation (nettoyage, anonymisation, dates) : '1' pour
+        une transformation séquentielle, '0' pour le nombre de cœurs. Par défaut,
+        'TRANSFORM_WORKERS' (configuration). Le résultat est identique quel que soit ce nombre.
+
+    engine : str, optionnel
+        Moteur de transformation : "rows" (un document à la fois) ou "columnar" (opérations
+        vectorisées par colonnes, NumPy). Par défaut, 'TRANSFORM_ENGINE' (configuration).
+        Le résultat est identique quel que soit le moteur.
+
+    unscored : List[str], optionnel
+        Si fournie, liste complétée par les 'id_review' des avis dont le sentiment n'a pu être
+        prédit (API ou modèle en échec : sentiment "Indéfini"). Ces avis ne doivent pas être
+        considérés comme ingérés (repères d'extraction).
+
     Returns
     --------
     List[Dict[str, Any]]
@@ -130,95 +545,88 @@ def transform_reviews_for_elasticsearch(raw_list: List[Dict[str, Any]]) -> List[
         Si une erreur survient lors du nettoyage des données ou de l'accès aux clés dans les dictionnaires,
         une exception sera levée.
     """
-    all_transformed_reviews: List[Dict[str, Any]] = []
-    total_reviews = 0  # compteur
-
-    for raw in raw_list:
-        reviews = raw.get("reviews", [])
-        total_reviews += len(reviews)
-        enterprise_url: str = raw.get("enterprise_url", "")
-        enterprise_info: Dict[str, Any] = raw.get("enterprise", {})
-
-        # Récupération des ratings bruts
-        ratings = enterprise_info.get("ratings", {})
-        total = ratings.get("total", 0)
-        total = max(total, 1)  # évite la division par zéro
-
-        one_star = ratings.get("one", 0)
-        two_star = ratings.get("two", 0)
-        three_star = ratings.get("three", 0)
-        four_star = ratings.get("four", 0)
-        five_star = ratings.get("five", 0)
-
-        # Calcul des pourcentages
-        pct_one = math.ceil(one_star / total * 100)
-        pct_two = math.ceil(two_star / total * 100)
-        pct_three = math.ceil(three_star / total * 100)
-        pct_four = math.ceil(four_star / total * 100)
-        pct_five = math.ceil(five_star / total * 100)
-
-        for review in reviews:
-            user = review.get("consumer", {})
-            reply = review.get("reply", {})
-            dates = review.get("dates", {})
-            verification = review.get("labels", {}).get("verification", {})
-
-            # Nettoyage de l'avis utilisateur
-            text_clean = DataUtils.clean_text(review.get("text"))
-            if not text_clean:
-                text_clean = "indisponible"
-            else:
-                text_clean = anonymize_text(text_clean)
-
-            review_length = len(text_clean)
-
-            # Nettoyage de la réponse entreprise
-            reply_clean = DataUtils.clean_text(reply.get("message") if reply else None)
-            if not reply_clean:
-                reply_clean = "indisponible"
-            else:
-                reply_clean = anonymize_text(reply_clean)
-
-            # Prédiction du sentiment via l'API FastAPI
-            try:
-                if text_clean != "indisponible":
-                    # Appel API FastAPI
-                    sentiment_info = predict_sentiment_from_api(text_clean)
-                    # On récupère le sentiment ou 'Indéfini' si absent
-                    user_sentiment = sentiment_info.get("sentiment", "Indéfini")
-                else:
-                    # Si le texte est indisponible, on met "Indéfini"
-                    user_sentiment = "Indéfini"
-            except Exception as e:
-                print(f"Erreur dans l'appel API FastAPI: {e}")
-                # Si l'API échoue, on met "Indéfini"
-                user_sentiment = "Indéfini"
-
-            all_transformed_reviews.append({
-                "id_review": review.get("id"),
-                "is_verified": bool(verification.get("isVerified", False)),
-                "date_review": DataUtils.format_date(dates.get("publishedDate")),
-                "id_user": DataUtils.clean_text(user.get("id")),
-                "user_review": text_clean,
-                "user_review_length": review_length,
-                "user_rating": DataUtils.to_float(review.get("rating")),
-                "user_sentiment": user_sentiment,
-                "date_response": DataUtils.format_date(reply.get("publishedDate") if reply else None),
-                "enterprise_response": reply_clean,
-
-                # Infos entreprise
-                "enterprise_name": DataUtils.clean_text(enterprise_info.get("name") or enterprise_url),
-                "enterprise_url": enterprise_url,
-                "enterprise_rating": DataUtils.to_float(enterprise_info.get("enterprise_rating")),
-                "enterprise_review_number": DataUtils.to_int(enterprise_info.get("enterprise_review_number")),
-
-                # Pourcentages calculés
-                "enterprise_percentage_one_star": pct_one,
-                "enterprise_percentage_two_star": pct_two,
-                "enterprise_percentage_three_star": pct_three,
-                "enterprise_percentage_four_star": pct_four,
-                "enterprise_percentage_five_star": pct_five,
-            })
-
-    logger.info(f"[INFO] Total reviews traitées : {total_reviews}")
+    engine = engine or TRANSFORM_ENGINE
+
+    # Champs entreprise calculés une fois par entreprise (toutes les entreprises à la fois
+    # avec le moteur par colonnes)
+    if engine == "columnar":
+        from etl.transform.columnar_transform import enterprise_fields_columnar
+        enterprise_fields_list = enterprise_fields_columnar(raw_list)
+    else:
+        enterprise_fields_list = [_enterprise_fields(raw) for raw in raw_list]
+
+    # (champs de l'entreprise, avis brut)
+    items: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    for raw, enterprise_fields in zip(raw_list, enterprise_fields_list):
+        items.extend((enterprise_fields, review) for review in raw.get("reviews", []))
+
+    all_transformed_reviews, reviewed_positions = _transform_documents(
+        items, TRANSFORM_WORKERS if workers is None else workers, engine)
+
+    # (position du document, texte) des avis dont le sentiment reste à prédire ("Indéfini" par défaut)
+    pending_sentiments: List[Tuple[int, str]] = [
+        (position, all_transformed_reviews[position]["user_review"]) for position in reviewed_positions
+    ]
+
+    # Avis déjà scorés lors d'une exécution précédente (texte inchangé et même version du modèle) :
+    # servis par le store
+    store = None
+    model_version = None
+    if SENTIMENT_STORE_ENABLED and pending_sentiments:
+        model_version = sentiment_model_version(sentiment_mode)
+        if model_version is None:
+            logger.warning("Store des sentiments non utilisé : tous les avis sont scorés")
+        else:
+            store = open_sentiment_store(SENTIMENT_STORE_PATH, model_version)
+    try:
+        known = _read_sentiment_store(store, [
+            (all_transformed_reviews[position]["id_review"], text) for position, text in pending_sentiments])
+        for position, _ in pending_sentiments:
+            stored = known.get(all_transformed_reviews[position]["id_review"])
+            if stored:
+                _apply_sentiment(all_transformed_reviews[position], stored)
+        if store is not None and pending_sentiments:
+            logger.info(
+                f"Store des sentiments : {len(known)}/{len(pending_sentiments)} avis déjà scorés "
+                f"(taux de succès {len(known) / len(pending_sentiments):.1%})")
+
+        to_score = [
+            (position, text) for position, text in pending_sentiments
+            if all_transformed_reviews[position]["id_review"] not in known
+        ]
+
+        # Prédiction du sentiment par lots (API FastAPI ou modèle local),
+        # résultats replacés dans les documents par position
+        try:
+            sentiments = predict_sentiments([text for _, text in to_score], mode=sentiment_mode)
+        except Exception as e:
+            logger.error(f"Erreur lors de la prédiction du sentiment : {e}")
+            # Si l'API échoue, le sentiment reste "Indéfini"
+            sentiments = []
+
+        for (position, _), sentiment_info in zip(to_score, sentiments):
+            _apply_sentiment(all_transformed_reviews[position], sentiment_info)
+
+        # Seules les prédictions abouties sont conservées, et uniquement si elles proviennent
+        # de la version lue (modèle redéployé en cours d'exécution : prédictions non conservées)
+        _write_sentiment_store(store, [
+            (all_transformed_reviews[position]["id_review"], text, sentiment_info)
+            for (position, text), sentiment_info in zip(to_score, sentiments)
+            if sentiment_info.get("sentiment") not in (None, "Indéfini")
+            and (SENTIMENT_MODEL_VERSION or sentiment_info.get("model_version") == model_version)
+        ])
+    finally:
+        _close_sentiment_store(store)
+
+    # Avis renseignés restés sans sentiment (prédiction en échec)
+    unscored_ids = [
+        all_transformed_reviews[position]["id_review"] for position, _ in pending_sentiments
+        if all_transformed_reviews[position]["user_sentiment"] == "Indéfini"
+    ]
+    if unscored_ids:
+        logger.warning(f"{len(unscored_ids)} avis sans sentiment (prédiction en échec)")
+    if unscored is not None:
+        unscored.extend(unscored_ids)
+
+    logger.info(f"[INFO] Total reviews traitées : {len(items)}")
     return all_transformed_reviews
@@ -0,0 +1,81 @@
+# File: src\etl\utils\concurrency_limiter.py
+
+"""
+Module pour limiter le nombre de requêtes HTTP simultanées de l'extraction.
+
+Deux limites s'appliquent à chaque requête : une limite globale (toutes destinations confondues)
+et une limite par hôte, afin de paralléliser le scraping de plusieurs entreprises sans
+surcharger un même site. Les sémaphores asyncio étant liés à une boucle d'événements, un
+limiteur est créé par boucle (chaque exécution de 'asyncio.run' dispose du sien).
+"""
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from urllib.parse import urlsplit
+from etl.config.config import SCRAPE_MAX_CONCURRENCY, SCRAPE_MAX_CONCURRENCY_PER_HOST
+
+
+class ConcurrencyLimiter:
+    """Limiteur de requêtes simultanées, global et par hôte."""
+
+    _limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ConcurrencyLimiter]" = \
+        weakref.WeakKeyDictionary()
+
+    def __init__(self, max_concurrency: int, max_per_host: int):
+        """
+        Parameters
+        ----------
+        max_concurrency : int
+            Nombre maximal de requêtes simultanées, tous hôtes confondus.
+
+        max_per_host : int
+            Nombre maximal de requêtes simultanées vers un même hôte.
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(1, max_per_host)
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        # Requêtes en cours et maximum observé, par hôte (suivi et tests)
+        self.in_flight: Dict[str, int] = {}
+        self.peak_in_flight: Dict[str, int] = {}
+
+    @classmethod
+    def get_limiter(cls) -> "ConcurrencyLimiter":
+        """
+        Retourne le limiteur de la boucle d'événements courante (créé au premier appel).
+
+        Returns
+        -------
+        ConcurrencyLimiter
+            Le limiteur configuré par 'SCRAPE_MAX_CONCURRENCY' et 'SCRAPE_MAX_CONCURRENCY_PER_HOST'.
+        """
+        loop = asyncio.get_running_loop()
+        limiter = cls._limiters.get(loop)
+        if limiter is None:
+            limiter = cls(SCRAPE_MAX_CONCURRENCY, SCRAPE_MAX_CONCURRENCY_PER_HOST)
+            cls._limiters[loop] = limiter
+        return limiter
+
+    @asynccontextmanager
+    async def limit(self, url: str) -> AsyncIterator[None]:
+        """
+        Attend une place libre (globale et pour l'hôte de 'url') le temps d'une requête.
+
+        Parameters
+        ----------
+        url : str
+            URL de la requête (l'hôte détermine la limite appliquée).
+        """
+        host = urlsplit(url).netloc
+        host_semaphore = self._hosts.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        # Place de l'hôte d'abord : une requête en attente sur un hôte saturé ne bloque pas
+        # une place globale utilisable par un autre hôte
+        async with host_semaphore, self._global:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.peak_in_flight[host] = max(self.peak_in_flight.get(host, 0), self.in_flight[host])
+            try:
+                yield
+            finally:
+                self.in_flight[host] -= 1
@@ -11,10 +11,15 @@ aux avis des utilisateurs.
 
 import re
 import unicodedata
-from typing import Any, Optional
+from typing import Any, Iterable, List, Optional
 from datetime import datetime
 
 
+# Expressions précompilées du nettoyage des textes
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_ALPHANUMERIC_PATTERN = re.compile(r'[a-zA-Z0-9]')
+
+
 class DataUtils:
     """Classe utilitaire pour nettoyer, convertir et formater des données."""
 
@@ -51,11 +56,50 @@ class DataUtils:
         # Normalise les caractères Unicode pour uniformiser le texte
         text = unicodedata.normalize("NFKC", text)
         text = text.strip()
-        text = re.sub(r'\s+', ' ', text)
-        if not re.search(r'[a-zA-Z0-9]', text):
+        text = _WHITESPACE_PATTERN.sub(' ', text)
+        if not _ALPHANUMERIC_PATTERN.search(text):
             return None
         return text[:max_length]
 
+    @staticmethod
+    def clean_texts(texts: Iterable[Optional[str]], max_length: int = 5000) -> List[Optional[str]]:
+        """
+        Nettoie une colonne de textes en une passe, avec un résultat identique à 'clean_text' pour chaque texte.
+
+        Optimisations par rapport à des appels successifs à 'clean_text' :
+        - les textes ASCII (cas le plus courant) ne sont pas normalisés : NFKC ne modifie aucun caractère ASCII,
+        - 'str.split' / 'str.join' remplacent 'strip' + 're.sub' : ils découpent sur les mêmes espaces Unicode,
+        - les méthodes et expressions utilisées sont résolues une seule fois pour toute la colonne.
+
+        Parameters
+        -----------
+        texts : Iterable[str, optionnel]
+            Les textes à nettoyer ('None' ou chaîne vide acceptés).
+
+        max_length : int, optionnel
+            La longueur maximale de chaque texte après nettoyage. Par défaut, 5000 caractères.
+
+        Returns
+        --------
+        List[str, optionnel]
+            Les textes nettoyés, dans le même ordre ('None' pour un texte vide ou sans caractère alphanumérique).
+        """
+        normalize = unicodedata.normalize
+        has_alphanumeric = _ALPHANUMERIC_PATTERN.search
+        join = ' '.join
+
+        cleaned: List[Optional[str]] = []
+        append = cleaned.append
+        for text in texts:
+            if not text:
+                append(None)
+                continue
+            if not text.isascii():
+                text = normalize("NFKC", text)
+            text = join(text.split())
+            append(text[:max_length] if has_alphanumeric(text) else None)
+        return cleaned
+
     @staticmethod
     def to_float(value: Any, default: float = 0.0) -> float:
         """
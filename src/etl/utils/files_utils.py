@@ -184,16 +184,56 @@ class FileUtils:
             Si une erreur se produit lors de la création ou de l'écriture du fichier JSONL.
         """
         try:
-            Path("/opt/airflow/etl/data").mkdir(parents=True,exist_ok=True)
-            filepath = Path("/opt/airflow/etl/data") / f"{filename}_{FileUtils.get_timestamp()}.jsonl"
-            with open(filepath, "w", encoding="utf-8") as f:
-                for doc in docs:
-                    f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+            filepath = FileUtils.new_jsonl_path(filename)
+            FileUtils.append_to_jsonl(docs, filepath)
             return filepath
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde JSONL {filename} : {e}")
             raise
 
+    @staticmethod
+    def new_jsonl_path(filename: str) -> Path:
+        """
+        Retourne le chemin d'un nouveau fichier JSONL horodaté dans le dossier 'data' (créé si besoin).
+
+        Paramètres:
+        -----------
+        filename : str
+            Le nom de fichier de base, auquel sera ajouté un timestamp.
+
+        Retourne:
+        --------
+        Path
+            Le chemin du fichier JSONL (le fichier n'est pas créé).
+        """
+        Path("/opt/airflow/etl/data").mkdir(parents=True,exist_ok=True)
+        return Path("/opt/airflow/etl/data") / f"{filename}_{FileUtils.get_timestamp()}.jsonl"
+
+    @staticmethod
+    def append_to_jsonl(docs: List[Dict], filepath: Path) -> None:
+        """
+        Ajoute une liste de dictionnaires à la fin d'un fichier JSONL (créé s'il n'existe pas).
+
+        Utilisé par l'ETL en flux pour écrire le fichier d'audit au fil des pages, sans
+        conserver tous les documents en mémoire.
+
+        Paramètres:
+        -----------
+        docs : List[Dict]
+            La liste de dictionnaires à ajouter, un par ligne.
+
+        filepath : Path
+            Le chemin du fichier JSONL.
+
+        Lève:
+        -----
+        Exception
+            Si une erreur se produit lors de l'écriture du fichier JSONL.
+        """
+        with open(filepath, "a", encoding="utf-8") as f:
+            for doc in docs:
+                f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+
     @staticmethod
     def delete_all_json_files(folder: str) -> None:
         """
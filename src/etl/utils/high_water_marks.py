@@ -0,0 +1,185 @@
+# File: src\etl\utils\high_water_marks.py
+
+"""
+Module pour le suivi des avis déjà extraits par entreprise ("high-water mark", SQLite).
+
+L'API trie les avis du plus récent au plus ancien : pour chaque entreprise, il suffit de
+conserver l'avis le plus récent déjà ingéré (identifiant et date de publication). Lors des
+exécutions suivantes, la pagination s'arrête dès qu'une page ne contient que des avis déjà
+vus ; seuls les nouveaux avis sont transformés et scorés.
+
+Le store est un fichier SQLite (et non un fichier .json, supprimés après chaque
+transformation) ; il ne contient aucune donnée personnelle.
+"""
+
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+
+def review_published_date(review: Dict[str, Any]) -> str:
+    """
+    Retourne la date de publication brute (ISO 8601) d'un avis extrait, ou une chaîne vide.
+
+    Parameters
+    ----------
+    review : Dict[str, Any]
+        Avis brut de l'API.
+
+    Returns
+    -------
+    str
+        La date de publication de l'avis.
+    """
+    return (review.get("dates") or {}).get("publishedDate") or ""
+
+
+def is_seen_review(review: Dict[str, Any], high_water_mark: Optional[Dict[str, str]]) -> bool:
+    """
+    Indique si un avis a déjà été ingéré lors d'une exécution précédente.
+
+    Un avis est déjà vu s'il s'agit de l'avis le plus récent enregistré ou s'il a été publié
+    avant lui. Un avis publié au même instant mais d'identifiant différent est considéré
+    comme nouveau.
+
+    Parameters
+    ----------
+    review : Dict[str, Any]
+        Avis brut de l'API.
+
+    high_water_mark : Dict[str, str], optionnel
+        Avis le plus récent déjà ingéré ('review_id' et 'published_date'), ou 'None'.
+
+    Returns
+    -------
+    bool
+        'True' si l'avis a déjà été ingéré.
+    """
+    if not high_water_mark:
+        return False
+    if review.get("id") == high_water_mark["review_id"]:
+        return True
+    published_date = review_published_date(review)
+    # Dates ISO 8601 au même format : l'ordre lexicographique est l'ordre chronologique
+    return bool(published_date) and published_date < high_water_mark["published_date"]
+
+
+def newest_review_mark(reviews: List[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """
+    Retourne le repère de l'avis le plus récent d'une liste ('review_id', 'published_date').
+
+    Parameters
+    ----------
+    reviews : List[Dict[str, Any]]
+        Avis bruts de l'API.
+
+    Returns
+    -------
+    Dict[str, str], optionnel
+        Le repère de l'avis le plus récent, ou 'None' si aucun avis n'est daté.
+    """
+    dated = [review for review in reviews if review.get("id") and review_published_date(review)]
+    if not dated:
+        return None
+    newest = max(dated, key=review_published_date)
+    return {"review_id": newest["id"], "published_date": review_published_date(newest)}
+
+
+class HighWaterMarkStore:
+    """Classe de store SQLite des avis les plus récents déjà ingérés, par entreprise."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Ouvre (et crée si besoin) le store.
+
+        Parameters
+        ----------
+        path : str
+            Chemin du fichier SQLite.
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS high_water_marks (
+                enterprise_url TEXT PRIMARY KEY,
+                review_id TEXT NOT NULL,
+                published_date TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    def get_all(self) -> Dict[str, Dict[str, str]]:
+        """
+        Retourne les repères de toutes les entreprises.
+
+        Returns
+        -------
+        Dict[str, Dict[str, str]]
+            Pour chaque 'enterprise_url' : {'review_id': ..., 'published_date': ...}.
+        """
+        rows = self._connection.execute(
+            "SELECT enterprise_url, review_id, published_date FROM high_water_marks").fetchall()
+        return {
+            enterprise_url: {"review_id": review_id, "published_date": published_date}
+            for enterprise_url, review_id, published_date in rows
+        }
+
+    def update_many(self, marks: Dict[str, Dict[str, str]]) -> None:
+        """
+        Enregistre les repères des entreprises, sans jamais revenir à un avis plus ancien.
+
+        Parameters
+        ----------
+        marks : Dict[str, Dict[str, str]]
+            Pour chaque 'enterprise_url' : {'review_id': ..., 'published_date': ...}.
+        """
+        now = time.time()
+        self._connection.executemany(
+            """
+            INSERT INTO high_water_marks VALUES (?, ?, ?, ?)
+            ON CONFLICT (enterprise_url) DO UPDATE SET
+                review_id = excluded.review_id,
+                published_date = excluded.published_date,
+                updated_at = excluded.updated_at
+            WHERE excluded.published_date >= high_water_marks.published_date
+            """,
+            [
+                (enterprise_url, mark["review_id"], mark["published_date"], now)
+                for enterprise_url, mark in marks.items()
+            ],
+        )
+        self._connection.commit()
+        logger.info(f"Repères d'extraction mis à jour : {len(marks)} entreprise(s)")
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        self._connection.close()
+
+
+def open_high_water_mark_store(path: str) -> Optional[HighWaterMarkStore]:
+    """
+    Ouvre le store des repères d'extraction, ou retourne 'None' s'il est inutilisable.
+
+    Sans store, l'extraction parcourt toutes les pages demandées (comportement historique).
+
+    Parameters
+    ----------
+    path : str
+        Chemin du fichier SQLite.
+
+    Returns
+    -------
+    HighWaterMarkStore, optionnel
+        Le store ouvert, ou 'None'.
+    """
+    try:
+        return HighWaterMarkStore(path)
+    except (OSError, sqlite3.Error) as error:
+        logger.warning(f"Store des repères d'extraction indisponible ({path}) : {error}")
+        return None
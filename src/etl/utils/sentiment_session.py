@@ -0,0 +1,72 @@
+# File: src\etl\utils\sentiment_session.py
+
+"""
+Module pour la gestion d'une session HTTP unique vers l'API de prédiction de sentiment.
+
+La session 'requests.Session' (Singleton) conserve un pool de connexions keep-alive
+dimensionné pour les appels simultanés de la transformation, et réessaie automatiquement
+les appels en échec (erreurs réseau, HTTP 429 en respectant 'Retry-After', HTTP 502, 503 et 504).
+Une erreur HTTP 500 (erreur de l'API, non transitoire) n'est pas réessayée.
+"""
+
+import threading
+from typing import Optional
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from etl.config.config import (
+    REQUEST_CLASS_BULK,
+    REQUEST_CLASS_HEADER,
+    SENTIMENT_MAX_CONCURRENCY,
+    SENTIMENT_MAX_RETRIES,
+)
+
+
+class SentimentApiSession:
+    """Classe pour gérer une session HTTP unique (Singleton) vers l'API de prédiction."""
+
+    _session: Optional[requests.Session] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Retourne la session HTTP unique (Singleton). Si la session n'existe pas, elle est créée.
+
+        Returns
+        -------
+        requests.Session
+            Session avec pool de connexions et nouvelles tentatives automatiques.
+        """
+        with cls._lock:
+            if cls._session is None:
+                retry = Retry(
+                    total=SENTIMENT_MAX_RETRIES,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=["POST"],
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=max(1, SENTIMENT_MAX_CONCURRENCY),
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                # Trafic de l'ETL : classe 'bulk', servie après les requêtes interactives du frontend
+                session.headers.update({REQUEST_CLASS_HEADER: REQUEST_CLASS_BULK})
+                cls._session = session
+                logger.info("Session HTTP vers l'API de prédiction créée")
+            return cls._session
+
+    @classmethod
+    def close(cls) -> None:
+        """Ferme la session HTTP unique et libère ses connexions."""
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
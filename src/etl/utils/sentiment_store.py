@@ -0,0 +1,222 @@
+# File: src\etl\utils\sentiment_store.py
+
+"""
+Module pour le store persistant des sentiments prédits (SQLite).
+
+Chaque exécution de l'ETL re-scrape des pages qui se recouvrent : la plupart des avis
+ont déjà été scorés lors d'une exécution précédente. Le store associe
+(id_review, empreinte du texte nettoyé, version du modèle) au sentiment et aux
+probabilités prédites ; la transformation ne renvoie au modèle que les avis nouveaux
+ou modifiés. Le texte lui-même n'est jamais stocké (RGPD), seule son empreinte SHA-256.
+
+La compaction supprime les entrées d'une autre version du modèle, celles qui n'ont
+pas été relues depuis 'max_age_days' jours, puis les plus anciennes au-delà de
+'max_entries' entrées ('0' : sans limite pour l'un comme pour l'autre). L'espace disque
+n'est récupéré ('VACUUM', qui réécrit tout le fichier) qu'au-delà de 'vacuum_min_deleted'
+entrées supprimées.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+
+
+class SentimentStore:
+    """Classe de store SQLite des sentiments, indexé par avis, texte et version du modèle."""
+
+    def __init__(self, path: str, model_version: str) -> None:
+        """
+        Ouvre (et crée si besoin) le store.
+
+        Parameters
+        ----------
+        path : str
+            Chemin du fichier SQLite.
+
+        model_version : str
+            Version du modèle de sentiment ; seules les entrées de cette version sont servies.
+        """
+        self.path = path
+        self.model_version = model_version
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sentiments (
+                id_review TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                sentiment TEXT NOT NULL,
+                star_probabilities TEXT,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (id_review, model_version)
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON sentiments (last_used)")
+        self._connection.commit()
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """
+        Calcule l'empreinte d'un texte nettoyé.
+
+        Parameters
+        ----------
+        text : str
+            Texte nettoyé de l'avis.
+
+        Returns
+        -------
+        str
+            Empreinte SHA-256 du texte.
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, items: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retourne les sentiments connus pour des avis dont le texte n'a pas changé.
+
+        Parameters
+        ----------
+        items : List[Tuple[str, str]]
+            Couples (id_review, texte nettoyé).
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            Pour chaque 'id_review' trouvé avec la même empreinte de texte :
+            {'sentiment': ..., 'star_probabilities': ...}.
+        """
+        hashes = {id_review: self.text_hash(text) for id_review, text in items if id_review}
+        found: Dict[str, Dict[str, Any]] = {}
+        ids = list(hashes)
+
+        # Requêtes par paquets (limite du nombre de paramètres SQLite)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self._connection.execute(
+                f"SELECT id_review, text_hash, sentiment, star_probabilities FROM sentiments "
+                f"WHERE model_version = ? AND id_review IN ({','.join('?' * len(chunk))})",
+                [self.model_version, *chunk],
+            ).fetchall()
+            for id_review, text_hash, sentiment, star_probabilities in rows:
+                if hashes[id_review] == text_hash:
+                    found[id_review] = {
+                        "sentiment": sentiment,
+                        "star_probabilities": json.loads(star_probabilities) if star_probabilities else None,
+                    }
+
+        # Date de dernière utilisation mise à jour (politique d'éviction)
+        if found:
+            now = time.time()
+            self._connection.executemany(
+                "UPDATE sentiments SET last_used = ? WHERE id_review = ? AND model_version = ?",
+                [(now, id_review, self.model_version) for id_review in found],
+            )
+            self._connection.commit()
+        return found
+
+    def put_many(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """
+        Enregistre (ou remplace) les sentiments prédits.
+
+        Parameters
+        ----------
+        items : List[Tuple[str, str, Dict[str, Any]]]
+            Triplets (id_review, texte nettoyé, résultat avec 'sentiment' et 'star_probabilities').
+        """
+        now = time.time()
+        rows = [
+            (
+                id_review,
+                self.model_version,
+                self.text_hash(text),
+                result["sentiment"],
+                json.dumps(result.get("star_probabilities")) if result.get("star_probabilities") else None,
+                now,
+            )
+            for id_review, text, result in items
+            if id_review
+        ]
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO sentiments VALUES (?, ?, ?, ?, ?, ?)", rows)
+        self._connection.commit()
+
+    def compact(self, max_age_days: int = 90, max_entries: int = 500000, vacuum_min_deleted: int = 10000) -> int:
+        """
+        Supprime les entrées obsolètes puis, si elles sont nombreuses, récupère l'espace disque.
+
+        Parameters
+        ----------
+        max_age_days : int, optionnel
+            Entrées non relues depuis plus de 'max_age_days' jours supprimées ('0' : sans limite).
+
+        max_entries : int, optionnel
+            Nombre maximal d'entrées conservées, les moins récemment utilisées étant supprimées
+            ('0' : sans limite).
+
+        vacuum_min_deleted : int, optionnel
+            Nombre minimal d'entrées supprimées pour récupérer l'espace disque ('VACUUM') ; en
+            dessous, les pages libérées sont réutilisées par les écritures suivantes.
+
+        Returns
+        -------
+        int
+            Nombre d'entrées supprimées.
+        """
+        cursor = self._connection.cursor()
+        deleted = cursor.execute(
+            "DELETE FROM sentiments WHERE model_version != ?", (self.model_version,)).rowcount
+        if max_age_days:
+            deleted += cursor.execute(
+                "DELETE FROM sentiments WHERE last_used < ?", (time.time() - max_age_days * 86400,)).rowcount
+        if max_entries > 0:
+            deleted += cursor.execute(
+                "DELETE FROM sentiments WHERE rowid IN ("
+                "SELECT rowid FROM sentiments ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (max_entries,),
+            ).rowcount
+        self._connection.commit()
+        if deleted and deleted >= vacuum_min_deleted:
+            self._connection.execute("VACUUM")
+        logger.info(f"Store des sentiments compacté : {deleted} entrées supprimées, {len(self)} conservées")
+        return deleted
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM sentiments").fetchone()[0]
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        self._connection.close()
+
+
+def open_sentiment_store(path: str, model_version: str) -> Optional[SentimentStore]:
+    """
+    Ouvre le store des sentiments, ou retourne 'None' s'il est inutilisable.
+
+    Le store est une optimisation : une erreur d'ouverture (dossier absent, droits,
+    fichier corrompu) est journalisée et la transformation score alors tous les avis.
+
+    Parameters
+    ----------
+    path : str
+        Chemin du fichier SQLite.
+
+    model_version : str
+        Version du modèle de sentiment.
+
+    Returns
+    -------
+    SentimentStore, optionnel
+        Le store ouvert, ou 'None'.
+    """
+    try:
+        return SentimentStore(path, model_version)
+    except (OSError, sqlite3.Error) as error:
+        logger.warning(f"Store des sentiments indisponible ({path}) : {error}")
+        return None
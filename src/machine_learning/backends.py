@@ -0,0 +1,288 @@
+# File: src\machine_learning\backends.py
+
+"""
+Module des backends d'inférence du modèle de sentiment.
+
+'machine_learning.predict' ne dépend que de l'interface 'InferenceBackend' : un objet
+appelable sur un ou plusieurs textes, qui retourne par texte le label le plus probable
+("1 star" ... "5 stars"), son score et la probabilité de chacune des cinq étoiles. Le backend est choisi par configuration ('INFERENCE_BACKEND') :
+- "torch" : pipeline 'transformers' (PyTorch), optionnellement quantifié INT8,
+- "onnx"  : session ONNX Runtime CPU ('onnx_backend.OnnxSentimentPipeline'),
+- "stub"  : backend factice déterministe, sans modèle ni dépendance lourde, avec une
+  latence simulée configurable. Il permet de démarrer l'API, l'ETL ou un test de charge
+  en quelques millisecondes et de mesurer ces composants indépendamment du modèle.
+"""
+
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Union
+
+
+# Labels retournés par tous les backends (configuration du modèle Hugging Face)
+STAR_LABELS: List[str] = ["1 star", "2 stars", "3 stars", "4 stars", "5 stars"]
+
+
+def star_output(probabilities: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Construit la sortie d'un texte à partir des probabilités de chaque label.
+
+    Parameters
+    ----------
+    probabilities : Dict[str, float]
+        Probabilité de chaque label du modèle ("1 star" ... "5 stars").
+
+    Returns
+    -------
+    Dict[str, Any]
+        {'label': label le plus probable, 'score': sa probabilité,
+         'scores': probabilités de 1 à 5 étoiles, dans l'ordre de 'STAR_LABELS'}.
+    """
+    label = max(probabilities, key=probabilities.get)
+    return {
+        "label": label,
+        "score": float(probabilities[label]),
+        "scores": [float(probabilities.get(star, 0.0)) for star in STAR_LABELS],
+    }
+
+
+class InferenceBackend(ABC):
+    """Interface commune des backends d'inférence du modèle de sentiment."""
+
+    # Nom du backend (valeur de 'INFERENCE_BACKEND')
+    name: str = ""
+
+    def __init__(self) -> None:
+        # Durée (en secondes) des phases de chargement du backend (model_build, quantization)
+        self.load_timings: Dict[str, float] = {}
+
+    @abstractmethod
+    def __call__(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: int = 0,
+        max_length: int = 512,
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Prédit le label (étoiles) et son score pour un ou plusieurs textes.
+
+        Parameters
+        ----------
+        texts : str ou List[str]
+            Texte(s) nettoyé(s) à classer.
+
+        batch_size : int, optionnel
+            Nombre de textes par passage du modèle. '0' traite tous les textes en un lot.
+
+        max_length : int, optionnel
+            Longueur maximale en tokens (troncature). Par défaut, 512.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Une sortie par texte : {'label': '5 stars', 'score': 0.87, 'scores': [p1, ..., p5]}.
+        """
+
+    def token_lengths(self, texts: List[str], max_length: int = 512) -> List[int]:
+        """
+        Retourne la longueur de chaque texte, utilisée pour regrouper les lots par longueur.
+
+        Sans tokenizer, la longueur en caractères sert d'approximation.
+
+        Parameters
+        ----------
+        texts : List[str]
+            Textes nettoyés.
+
+        max_length : int, optionnel
+            Longueur maximale en tokens (troncature). Par défaut, 512.
+
+        Returns
+        -------
+        List[int]
+            Longueur de chaque texte, dans le même ordre.
+        """
+        return [len(text) for text in texts]
+
+
+class TokenizerLengthsMixin:
+    """Calcul des longueurs en tokens pour les backends disposant d'un tokenizer 'transformers'."""
+
+    tokenizer: Any
+
+    def token_lengths(self, texts: List[str], max_length: int = 512) -> List[int]:
+        encoded = self.tokenizer(texts, truncation=True, max_length=max_length)["input_ids"]
+        return [len(ids) for ids in encoded]
+
+
+class TorchPipelineBackend(TokenizerLengthsMixin, InferenceBackend):
+    """Classe de backend PyTorch reposant sur le pipeline 'sentiment-analysis' de 'transformers'."""
+
+    name = "torch"
+
+    def __init__(self, model_name: str, quantized: bool = False) -> None:
+        """
+        Construit le pipeline et, optionnellement, quantifie ses couches linéaires en INT8.
+
+        Parameters
+        ----------
+        model_name : str
+            Nom du modèle Hugging Face ou chemin local (par exemple l'artefact de 'model_artifact.py').
+
+        quantized : bool, optionnel
+            Si 'True', applique la quantification dynamique INT8. Par défaut, 'False'.
+        """
+        super().__init__()
+        # Import local : 'transformers' (et torch) coûtent plusieurs secondes à importer
+        from transformers import pipeline, logging
+
+        # Désactive les messages info de Transformers
+        logging.set_verbosity_error()
+
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        start = time.perf_counter()
+        # Modèle et tokenizer (rapide) chargés explicitement : depuis l'artefact de
+        # 'model_artifact.py', les poids safetensors sont projetés en mémoire (mmap)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        self.pipeline = pipeline(
+            task="sentiment-analysis",
+            model=model,
+            tokenizer=tokenizer,
+            truncation=True,
+        )
+        self.load_timings["model_build"] = time.perf_counter() - start
+
+        if quantized:
+            from machine_learning.quantization import quantize_pipeline_int8
+            start = time.perf_counter()
+            self.pipeline = quantize_pipeline_int8(self.pipeline)
+            self.load_timings["quantization"] = time.perf_counter() - start
+
+        self.tokenizer = self.pipeline.tokenizer
+
+    def __call__(self, texts, batch_size=0, max_length=512, **kwargs):
+        if isinstance(texts, str):
+            texts = [texts]
+        if batch_size:
+            kwargs["batch_size"] = batch_size
+        # top_k=None : probabilités de tous les labels, pas seulement du plus probable
+        outputs = self.pipeline(texts, max_length=max_length, top_k=None, **kwargs)
+        return [star_output({item["label"]: item["score"] for item in output}) for output in outputs]
+
+
+class StubBackend(InferenceBackend):
+    """Classe de backend factice : prédictions déterministes et latence simulée, sans modèle."""
+
+    name = "stub"
+
+    def __init__(self, latency_ms: float = 0.0, latency_per_text_ms: float = 0.0) -> None:
+        """
+        Initialise le backend factice.
+
+        Parameters
+        ----------
+        latency_ms : float, optionnel
+            Latence simulée de chaque passage du "modèle", en millisecondes. Par défaut, 0.
+
+        latency_per_text_ms : float, optionnel
+            Latence simulée supplémentaire par texte d'un lot, en millisecondes. Par défaut, 0.
+        """
+        super().__init__()
+        self.latency_ms = max(0.0, latency_ms)
+        self.latency_per_text_ms = max(0.0, latency_per_text_ms)
+        self.load_timings["model_build"] = 0.0
+
+    @staticmethod
+    def predict_one(text: str) -> Dict[str, Any]:
+        """
+        Retourne la prédiction factice d'un texte, dérivée de son empreinte SHA-256.
+
+        Parameters
+        ----------
+        text : str
+            Texte nettoyé.
+
+        Returns
+        -------
+        Dict[str, Any]
+            {'label': 'n stars', 'score': ..., 'scores': [...]}, toujours identique pour un même texte.
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        # Label dominant tiré de l'empreinte, le reste de la probabilité réparti sur les autres
+        best = digest[0] % len(STAR_LABELS)
+        top = 0.5 + digest[1] / 510
+        probabilities = {
+            star: top if index == best else (1 - top) / (len(STAR_LABELS) - 1)
+            for index, star in enumerate(STAR_LABELS)
+        }
+        return star_output(probabilities)
+
+    def __call__(self, texts, batch_size=0, max_length=512, **kwargs):
+        if isinstance(texts, str):
+            texts = [texts]
+        batch_size = batch_size or len(texts) or 1
+
+        nb_passes = -(-len(texts) // batch_size)
+        delay = nb_passes * self.latency_ms + len(texts) * self.latency_per_text_ms
+        if delay:
+            time.sleep(delay / 1000)
+        return [self.predict_one(text) for text in texts]
+
+
+def create_backend(
+    name: str,
+    model_name: str,
+    quantization: str = "none",
+    onnx_model_dir: str = "",
+    num_threads: int = 0,
+    stub_latency_ms: float = 0.0,
+    stub_latency_per_text_ms: float = 0.0,
+) -> InferenceBackend:
+    """
+    Construit le backend d'inférence demandé.
+
+    Parameters
+    ----------
+    name : str
+        Nom du backend : "torch", "onnx" ou "stub".
+
+    model_name : str
+        Nom du modèle Hugging Face (backend torch).
+
+    quantization : str, optionnel
+        "none" (fp32) ou "int8". Par défaut, "none".
+
+    onnx_model_dir : str, optionnel
+        Dossier de l'export ONNX (backend onnx).
+
+    num_threads : int, optionnel
+        Nombre de threads de la session ONNX Runtime ('0' : choix d'onnxruntime).
+
+    stub_latency_ms, stub_latency_per_text_ms : float, optionnel
+        Latences simulées du backend factice, en millisecondes.
+
+    Returns
+    -------
+    InferenceBackend
+        Le backend construit.
+
+    Raises
+    ------
+    ValueError
+        Si le backend ou le mode de quantification est inconnu.
+    """
+    if quantization not in ("none", "int8"):
+        raise ValueError(f"Mode de quantification inconnu : {quantization}")
+    quantized = quantization == "int8"
+
+    if name == "torch":
+        return TorchPipelineBackend(model_name, quantized=quantized)
+    if name == "onnx":
+        from machine_learning.onnx_backend import OnnxSentimentPipeline
+        return OnnxSentimentPipeline(onnx_model_dir, num_threads=num_threads, quantized=quantized)
+    if name == "stub":
+        return StubBackend(latency_ms=stub_latency_ms, latency_per_text_ms=stub_latency_per_text_ms)
+    raise ValueError(f"Backend d'inférence inconnu : {name}")
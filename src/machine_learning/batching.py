@@ -0,0 +1,174 @@
+# File: src\machine_learning\batching.py
+
+"""
+Module pour le regroupement dynamique (micro-batching) des prédictions concurrentes.
+
+Lorsque plusieurs requêtes '/predict' arrivent en même temps (frontend Streamlit et ETL),
+chaque requête exécute habituellement son propre passage du modèle et elles se disputent
+les mêmes cœurs CPU. Le 'MicroBatcher' regroupe les textes soumis pendant une courte
+fenêtre d'attente (ou jusqu'à une taille maximale de lot) en un seul passage du modèle,
+puis renvoie à chaque appelant le résultat qui le concerne.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+from loguru import logger
+
+
+class MicroBatcher:
+    """Classe pour regrouper des prédictions unitaires concurrentes en lots."""
+
+    def __init__(
+        self,
+        predict_fn: Callable[[List[str]], List[Any]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0
+    ) -> None:
+        """
+        Initialise le micro-batcher.
+
+        Parameters
+        ----------
+        predict_fn : Callable[[List[str]], List[Any]]
+            Fonction appliquée à un lot de textes, qui retourne un résultat par texte
+            (dans le même ordre).
+
+        max_batch_size : int, optionnel
+            Nombre maximal de textes regroupés dans un même lot. Par défaut, 16.
+
+        max_wait_ms : float, optionnel
+            Durée maximale (en millisecondes) d'attente d'autres requêtes après la
+            première requête d'un lot. Par défaut, 10 ms.
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def submit(self, text: str) -> Future:
+        """
+        Soumet un texte au prochain lot et retourne un 'Future' sur son résultat.
+
+        Parameters
+        ----------
+        text : str
+            Texte (déjà nettoyé) à envoyer au modèle.
+
+        Returns
+        -------
+        Future
+            Futur résolu avec le résultat de 'predict_fn' pour ce texte, ou avec
+            l'exception levée lors de sa prédiction.
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def predict(self, text: str, timeout: Optional[float] = None) -> Any:
+        """
+        Soumet un texte et attend son résultat (appel bloquant).
+
+        Parameters
+        ----------
+        text : str
+            Texte (déjà nettoyé) à envoyer au modèle.
+
+        timeout : float, optionnel
+            Durée maximale d'attente du résultat, en secondes.
+
+        Returns
+        -------
+        Any
+            Résultat de 'predict_fn' pour ce texte.
+        """
+        return self.submit(text).result(timeout=timeout)
+
+    def _ensure_worker(self) -> None:
+        """
+        Démarre le thread de traitement des lots s'il n'existe pas encore.
+
+        Le thread est démarré à la première soumission (et non à l'import) et recréé
+        après un 'fork', un thread ne survivant pas dans le processus enfant.
+        """
+        if self._worker is not None and self._worker.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive() and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                # File héritée d'un processus parent : on repart d'une file vide
+                self._queue = queue.Queue()
+            self._pid = os.getpid()
+            self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+            self._worker.start()
+
+    def _collect_batch(self) -> List[Tuple[str, Future]]:
+        """
+        Attend une première requête puis regroupe les suivantes jusqu'à la taille
+        maximale du lot ou l'expiration de la fenêtre d'attente.
+
+        Returns
+        -------
+        List[Tuple[str, Future]]
+            Les couples (texte, futur) composant le lot.
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    # Fenêtre expirée : on prend uniquement ce qui est déjà en attente
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Boucle du thread de traitement : collecte un lot, prédit, distribue les résultats."""
+        while True:
+            batch = self._collect_batch()
+            # Un appelant peut avoir abandonné son futur (timeout, annulation)
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            try:
+                outputs = self.predict_fn(texts)
+                if len(outputs) != len(texts):
+                    raise RuntimeError(
+                        f"Nombre de résultats inattendu : {len(outputs)} pour {len(texts)} textes")
+            except Exception as error:
+                logger.warning(f"[MicroBatcher] Échec du lot de {len(texts)} textes, reprise unitaire : {error}")
+                self._run_one_by_one(batch)
+                continue
+
+            for (_, future), output in zip(batch, outputs):
+                future.set_result(output)
+
+    def _run_one_by_one(self, batch: List[Tuple[str, Future]]) -> None:
+        """
+        Prédit les textes d'un lot un par un pour isoler l'erreur sur le texte fautif.
+
+        Parameters
+        ----------
+        batch : List[Tuple[str, Future]]
+            Les couples (texte, futur) du lot en échec.
+        """
+        for text, future in batch:
+            try:
+                future.set_result(self.predict_fn([text])[0])
+            except Exception as error:
+                future.set_exception(error)
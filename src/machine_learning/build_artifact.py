@@ -0,0 +1,21 @@
+# File: src\machine_learning\build_artifact.py
+
+"""
+Module pour construire l'artefact de modèle optimisé pour le chargement pour le Dockerfile_api
+
+Doit être exécuté après 'preload_model.py' : l'artefact est construit uniquement
+à partir des poids présents dans le cache local.
+"""
+
+from transformers import logging
+from machine_learning.config import MODEL_NAME, MODEL_ARTIFACT_DIR
+from machine_learning.model_artifact import build_model_artifact
+
+# Désactiver les warnings inutiles
+logging.set_verbosity_error()
+
+print(f"Construction de l'artefact du modèle de sentiment dans {MODEL_ARTIFACT_DIR}...")
+
+build_model_artifact(MODEL_NAME, MODEL_ARTIFACT_DIR)
+
+print("Artefact construit avec succès !")
@@ -0,0 +1,142 @@
+# File: src\machine_learning\cache.py
+
+"""
+Module pour la mise en cache des prédictions de sentiment.
+
+Les mêmes avis sont re-scorés à chaque exécution de l'ETL (pages qui se recouvrent)
+et le frontend renvoie le même texte à chaque rafraîchissement Streamlit. Ce module
+fournit un cache borné, indexé par une empreinte (hash) du texte nettoyé et de
+l'identifiant du modèle, avec éviction LRU et durée de vie (TTL) optionnelle.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class PredictionCache:
+    """Classe de cache LRU (avec TTL optionnel) pour les sorties du modèle."""
+
+    def __init__(self, model_id: str, max_size: int = 10000, ttl_seconds: float = 0) -> None:
+        """
+        Initialise le cache.
+
+        Parameters
+        ----------
+        model_id : str
+            Identifiant du modèle, inclus dans la clé pour ne jamais servir
+            la prédiction d'un autre modèle.
+
+        max_size : int, optionnel
+            Nombre maximal d'entrées conservées. '0' désactive le cache. Par défaut, 10000.
+
+        ttl_seconds : float, optionnel
+            Durée de vie d'une entrée en secondes. '0' signifie sans expiration. Par défaut, 0.
+        """
+        self.model_id = model_id
+        self.max_size = max(0, max_size)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Indique si le cache est actif ('max_size' > 0)."""
+        return self.max_size > 0
+
+    def make_key(self, text_clean: str) -> str:
+        """
+        Calcule la clé de cache d'un texte nettoyé pour le modèle courant.
+
+        Parameters
+        ----------
+        text_clean : str
+            Texte nettoyé envoyé au modèle.
+
+        Returns
+        -------
+        str
+            Empreinte SHA-256 de l'identifiant du modèle et du texte.
+        """
+        return hashlib.sha256(f"{self.model_id}\x00{text_clean}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retourne la valeur associée à une clé, ou 'None' si absente ou expirée.
+
+        Parameters
+        ----------
+        key : str
+            Clé calculée par 'make_key'.
+
+        Returns
+        -------
+        Any, optionnel
+            La valeur en cache, ou 'None'.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds and time.monotonic() - entry[0] > self.ttl_seconds:
+                # Entrée expirée : supprimée et comptée comme un défaut de cache
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Ajoute ou remplace une valeur, en évinçant l'entrée la moins récemment utilisée si plein.
+
+        Parameters
+        ----------
+        key : str
+            Clé calculée par 'make_key'.
+
+        value : Any
+            Valeur à mettre en cache (sortie du modèle).
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retourne les compteurs du cache (pour l'exposition Prometheus).
+
+        Returns
+        -------
+        Dict[str, int]
+            Dictionnaire contenant 'hits', 'misses', 'evictions' et 'size'.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
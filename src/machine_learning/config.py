@@ -0,0 +1,62 @@
+# File: src\machine_learning\config.py
+
+"""
+Module pour configurer les constantes du modèle de prédiction de sentiment.
+
+Les valeurs par défaut peuvent être surchargées par des variables d'environnement
+(par exemple dans le docker-compose) sans modifier le code.
+"""
+
+import os
+
+
+# Modèle Hugging Face utilisé pour la prédiction
+MODEL_NAME: str = os.getenv("SENTIMENT_MODEL_NAME", "cmarkea/distilcamembert-base-sentiment")
+MODEL_MAX_LENGTH: int = 512
+
+# Nombre de threads de calcul du modèle (0 : valeur par défaut du backend).
+# En mode multi-workers, dimensionné automatiquement à (cœurs / workers) par gunicorn_conf.py
+INFERENCE_THREADS: int = int(os.getenv("INFERENCE_THREADS", "0"))
+
+# Chargement du modèle au démarrage de l'API (sinon au premier appel, et '/health/ready'
+# répond 200 immédiatement) et préchauffage (désactivé : prêt dès le chargement)
+MODEL_LOAD_ON_STARTUP: bool = os.getenv("MODEL_LOAD_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+MODEL_WARMUP_ENABLED: bool = os.getenv("MODEL_WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Prédiction par lots (endpoint /predict/batch)
+PREDICT_BATCH_SIZE: int = int(os.getenv("PREDICT_BATCH_SIZE", "32"))
+PREDICT_BATCH_MAX_ITEMS: int = int(os.getenv("PREDICT_BATCH_MAX_ITEMS", "1000"))
+# Regroupe les textes de longueurs proches dans les mêmes lots (moins de padding)
+PREDICT_LENGTH_BUCKETING: bool = os.getenv("PREDICT_LENGTH_BUCKETING", "true").lower() in ("1", "true", "yes")
+
+# Regroupement dynamique des requêtes /predict concurrentes (micro-batching)
+MICRO_BATCH_ENABLED: bool = os.getenv("MICRO_BATCH_ENABLED", "false").lower() in ("1", "true", "yes")
+MICRO_BATCH_MAX_SIZE: int = int(os.getenv("MICRO_BATCH_MAX_SIZE", "16"))
+MICRO_BATCH_MAX_WAIT_MS: float = float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", "10"))
+
+# Cache des prédictions (0 désactive le cache / l'expiration)
+PREDICTION_CACHE_SIZE: int = int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))
+PREDICTION_CACHE_TTL_SECONDS: float = float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", "0"))
+
+# Backend d'inférence : "torch" (pipeline transformers), "onnx" (onnxruntime CPU)
+# ou "stub" (prédictions factices déterministes, pour les tests et benchmarks)
+INFERENCE_BACKEND: str = os.getenv("INFERENCE_BACKEND", "torch").lower()
+
+# Latence simulée du backend "stub" : par passage du modèle et par texte, en millisecondes
+STUB_LATENCY_MS: float = float(os.getenv("STUB_LATENCY_MS", "0"))
+STUB_LATENCY_PER_TEXT_MS: float = float(os.getenv("STUB_LATENCY_PER_TEXT_MS", "0"))
+
+# Quantification du modèle : "none" (fp32) ou "int8" (quantification dynamique des couches linéaires)
+INFERENCE_QUANTIZATION: str = os.getenv("INFERENCE_QUANTIZATION", "none").lower()
+
+# Dossier des artefacts générés à partir du modèle (export ONNX, etc.)
+MODEL_ARTIFACTS_DIR: str = os.getenv(
+    "MODEL_ARTIFACTS_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "satisfaction_client"),
+)
+# Artefact optimisé pour le démarrage à froid (safetensors en mmap + tokenizer rapide),
+# construit par 'build_artifact.py' et utilisé par le backend torch s'il est présent
+MODEL_ARTIFACT_DIR: str = os.getenv("MODEL_ARTIFACT_DIR", os.path.join(MODEL_ARTIFACTS_DIR, "model"))
+MODEL_USE_ARTIFACT: bool = os.getenv("MODEL_USE_ARTIFACT", "true").lower() in ("1", "true", "yes")
+ONNX_MODEL_DIR: str = os.getenv("ONNX_MODEL_DIR", os.path.join(MODEL_ARTIFACTS_DIR, "onnx"))
+ONNX_NUM_THREADS: int = int(os.getenv("ONNX_NUM_THREADS", "0"))
@@ -0,0 +1,24 @@
+# File: src\machine_learning\export_onnx.py
+
+"""
+Module pour exporter le modèle Hugging Face au format ONNX pour le Dockerfile_api
+
+Doit être exécuté après 'preload_model.py' : l'export utilise uniquement
+les poids présents dans le cache local.
+"""
+
+from transformers import logging
+from machine_learning.config import MODEL_NAME, ONNX_MODEL_DIR
+from machine_learning.onnx_backend import export_to_onnx, quantize_onnx_model
+
+# Désactiver les warnings inutiles
+logging.set_verbosity_error()
+
+print(f"Export ONNX du modèle de sentiment vers {ONNX_MODEL_DIR}...")
+
+export_to_onnx(MODEL_NAME, ONNX_MODEL_DIR)
+
+# Artefact pré-quantifié INT8 (INFERENCE_QUANTIZATION=int8)
+quantize_onnx_model(ONNX_MODEL_DIR)
+
+print("Modèle exporté avec succès !")
@@ -0,0 +1,88 @@
+# File: src\machine_learning\model_artifact.py
+
+"""
+Module pour l'artefact de modèle optimisé pour le chargement (démarrage à froid).
+
+Construire le pipeline depuis le cache Hugging Face impose, à chaque démarrage, la
+résolution de la configuration dans le cache du hub et la désérialisation complète
+des poids (format pickle 'pytorch_model.bin' pour ce modèle). L'artefact produit ici
+contient :
+- les poids au format 'safetensors', projetés en mémoire (mmap) au chargement,
+- le tokenizer rapide ('tokenizer.json'), sans conversion depuis SentencePiece,
+- un manifeste indiquant le modèle source, pour ne jamais charger un autre modèle.
+"""
+
+import json
+import os
+from typing import Optional
+from loguru import logger
+
+
+ARTIFACT_MANIFEST = "artifact.json"
+
+
+def build_model_artifact(model_name: str, output_dir: str, overwrite: bool = False) -> str:
+    """
+    Sauvegarde le modèle et son tokenizer rapide dans un dossier optimisé pour le chargement.
+
+    Parameters
+    ----------
+    model_name : str
+        Nom du modèle Hugging Face (ou chemin local) ; les poids doivent être dans le cache local.
+
+    output_dir : str
+        Dossier de destination de l'artefact.
+
+    overwrite : bool, optionnel
+        Si 'True', reconstruit l'artefact même s'il existe déjà. Par défaut, 'False'.
+
+    Returns
+    -------
+    str
+        Chemin du dossier de l'artefact.
+
+    Raises
+    ------
+    OSError
+        Si les poids du modèle ne sont pas présents dans le cache local.
+    """
+    if artifact_source(output_dir) == model_name and not overwrite:
+        logger.info(f"Artefact du modèle déjà présent : {output_dir}")
+        return output_dir
+
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True, local_files_only=True)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, local_files_only=True)
+    model.save_pretrained(output_dir, safe_serialization=True)
+    tokenizer.save_pretrained(output_dir, legacy_format=False)
+
+    # Manifeste écrit en dernier : un artefact incomplet n'est jamais utilisé
+    with open(os.path.join(output_dir, ARTIFACT_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump({"source_model": model_name}, f)
+
+    logger.success(f"Artefact du modèle sauvegardé : {output_dir}")
+    return output_dir
+
+
+def artifact_source(artifact_dir: str) -> Optional[str]:
+    """
+    Retourne le modèle source d'un artefact, ou 'None' si le dossier n'en contient pas.
+
+    Parameters
+    ----------
+    artifact_dir : str
+        Dossier produit par 'build_model_artifact'.
+
+    Returns
+    -------
+    str, optionnel
+        Le nom du modèle source indiqué dans le manifeste.
+    """
+    try:
+        with open(os.path.join(artifact_dir, ARTIFACT_MANIFEST), "r", encoding="utf-8") as f:
+            return json.load(f).get("source_model")
+    except (OSError, ValueError):
+        return None
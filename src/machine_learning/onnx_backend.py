@@ -0,0 +1,221 @@
+# File: src\machine_learning\onnx_backend.py
+
+"""
+Module pour l'inférence du modèle de sentiment avec ONNX Runtime (CPU).
+
+Ce module permet :
+- d'exporter une seule fois le modèle Hugging Face (poids du cache local) au format ONNX,
+- de servir les prédictions via 'onnxruntime' avec la même interface que le
+  pipeline 'transformers' (liste de dictionnaires 'label' / 'score').
+
+Les labels retournés sont ceux de la configuration du modèle ("1 star" ... "5 stars"),
+ce qui permet de réutiliser 'convert_stars_to_sentiment' sans modification ; les
+probabilités des cinq étoiles sont aussi retournées ('scores').
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Union
+import numpy as np
+from loguru import logger
+from machine_learning.backends import InferenceBackend, TokenizerLengthsMixin, star_output
+
+
+ONNX_FILE_NAME = "model.onnx"
+ONNX_INT8_FILE_NAME = "model.int8.onnx"
+
+
+def export_to_onnx(model_name: str, output_dir: str, opset: int = 17, overwrite: bool = False) -> str:
+    """
+    Exporte le modèle de classification au format ONNX à partir des poids du cache local.
+
+    Le tokenizer et la configuration du modèle sont sauvegardés à côté du fichier ONNX
+    afin que le backend ONNX puisse être chargé sans accès réseau.
+
+    Parameters
+    ----------
+    model_name : str
+        Nom du modèle Hugging Face (ou chemin local) à exporter.
+
+    output_dir : str
+        Dossier de destination de l'export.
+
+    opset : int, optionnel
+        Version de l'opset ONNX. Par défaut, 17.
+
+    overwrite : bool, optionnel
+        Si 'True', ré-exporte même si un export existe déjà. Par défaut, 'False'.
+
+    Returns
+    -------
+    str
+        Chemin du fichier ONNX exporté.
+
+    Raises
+    ------
+    OSError
+        Si les poids du modèle ne sont pas présents dans le cache local.
+    """
+    # Import local : torch n'est nécessaire que pour l'export, pas pour le service
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    onnx_path = os.path.join(output_dir, ONNX_FILE_NAME)
+    if os.path.exists(onnx_path) and not overwrite:
+        logger.info(f"Export ONNX déjà présent : {onnx_path}")
+        return onnx_path
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, local_files_only=True)
+    model.eval()
+
+    dummy = tokenizer(["Exemple d'avis client pour l'export."], return_tensors="pt")
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy["input_ids"], dummy["attention_mask"]),
+            onnx_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=opset,
+            dynamo=False,
+        )
+
+    tokenizer.save_pretrained(output_dir)
+    model.config.save_pretrained(output_dir)
+
+    logger.success(f"Modèle exporté au format ONNX : {onnx_path}")
+    return onnx_path
+
+
+def quantize_onnx_model(model_dir: str, overwrite: bool = False) -> str:
+    """
+    Produit une version pré-quantifiée INT8 (quantification dynamique) d'un export ONNX.
+
+    Parameters
+    ----------
+    model_dir : str
+        Dossier produit par 'export_to_onnx'.
+
+    overwrite : bool, optionnel
+        Si 'True', re-quantifie même si l'artefact existe déjà. Par défaut, 'False'.
+
+    Returns
+    -------
+    str
+        Chemin du fichier ONNX quantifié.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    int8_path = os.path.join(model_dir, ONNX_INT8_FILE_NAME)
+    if os.path.exists(int8_path) and not overwrite:
+        logger.info(f"Modèle ONNX INT8 déjà présent : {int8_path}")
+        return int8_path
+
+    quantize_dynamic(os.path.join(model_dir, ONNX_FILE_NAME), int8_path, weight_type=QuantType.QInt8)
+    logger.success(f"Modèle ONNX quantifié (INT8) : {int8_path}")
+    return int8_path
+
+
+class OnnxSentimentPipeline(TokenizerLengthsMixin, InferenceBackend):
+    """Classe d'inférence ONNX Runtime compatible avec l'appel du pipeline 'transformers'."""
+
+    name = "onnx"
+
+    def __init__(self, model_dir: str, num_threads: int = 0, quantized: bool = False) -> None:
+        """
+        Charge le tokenizer, la configuration et la session ONNX Runtime.
+
+        Parameters
+        ----------
+        model_dir : str
+            Dossier produit par 'export_to_onnx'.
+
+        num_threads : int, optionnel
+            Nombre de threads intra-op d'ONNX Runtime. '0' laisse onnxruntime choisir.
+
+        quantized : bool, optionnel
+            Si 'True', charge l'artefact pré-quantifié INT8 ('quantize_onnx_model').
+
+        Raises
+        ------
+        FileNotFoundError
+            Si aucun export ONNX n'est présent dans 'model_dir'.
+        """
+        super().__init__()
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+
+        start = time.perf_counter()
+        onnx_path = os.path.join(model_dir, ONNX_INT8_FILE_NAME if quantized else ONNX_FILE_NAME)
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(
+                f"Export ONNX introuvable : {onnx_path} (lancer machine_learning/export_onnx.py)")
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        config = AutoConfig.from_pretrained(model_dir)
+        self.id2label = {int(index): label for index, label in config.id2label.items()}
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(onnx_path, sess_options=options, providers=["CPUExecutionProvider"])
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+        self.load_timings["model_build"] = time.perf_counter() - start
+
+    def __call__(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: int = 0,
+        max_length: int = 512,
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Prédit le label (étoiles) et son score pour un ou plusieurs textes.
+
+        Parameters
+        ----------
+        texts : str ou List[str]
+            Texte(s) nettoyé(s) à classer.
+
+        batch_size : int, optionnel
+            Nombre de textes par passage du modèle. '0' traite tous les textes en un lot.
+
+        max_length : int, optionnel
+            Longueur maximale en tokens (troncature). Par défaut, 512.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Une sortie par texte : {'label': '5 stars', 'score': 0.87, 'scores': [p1, ..., p5]}.
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        batch_size = batch_size or len(texts) or 1
+
+        outputs: List[Dict[str, Any]] = []
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
+            encoded = self.tokenizer(
+                chunk, padding=True, truncation=True, max_length=max_length, return_tensors="np")
+            feeds = {name: encoded[name].astype(np.int64) for name in self.input_names}
+            logits = self.session.run(["logits"], feeds)[0]
+
+            # Softmax numériquement stable, comme le pipeline 'sentiment-analysis'
+            exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            probabilities = exp / exp.sum(axis=-1, keepdims=True)
+
+            for row in probabilities:
+                outputs.append(star_output({self.id2label[index]: value for index, value in enumerate(row)}))
+
+        return outputs
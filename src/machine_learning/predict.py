@@ -4,23 +4,356 @@
 Module pour la prédiction du sentiment d'avis utilisateurs.
 """
 
-from typing import Dict
-from transformers import pipeline, logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from loguru import logger
 from etl.utils.data_utils import DataUtils
+from machine_learning.backends import InferenceBackend, create_backend
+from machine_learning.batching import MicroBatcher
+from machine_learning.cache import PredictionCache
+from machine_learning.model_artifact import artifact_source
+from machine_learning.config import (
+    MODEL_NAME,
+    MODEL_MAX_LENGTH,
+    INFERENCE_BACKEND,
+    INFERENCE_QUANTIZATION,
+    MODEL_ARTIFACT_DIR,
+    MODEL_USE_ARTIFACT,
+    ONNX_MODEL_DIR,
+    ONNX_NUM_THREADS,
+    STUB_LATENCY_MS,
+    STUB_LATENCY_PER_TEXT_MS,
+    INFERENCE_THREADS,
+    PREDICT_BATCH_SIZE,
+    PREDICT_LENGTH_BUCKETING,
+    MICRO_BATCH_ENABLED,
+    MICRO_BATCH_MAX_SIZE,
+    MICRO_BATCH_MAX_WAIT_MS,
+    PREDICTION_CACHE_SIZE,
+    PREDICTION_CACHE_TTL_SECONDS,
+    MODEL_WARMUP_ENABLED,
+    MODEL_LOAD_ON_STARTUP,
+)
+
+
+# Durée (en secondes) de chaque phase de chargement : model_build, quantization, warmup
+LOAD_TIMINGS: Dict[str, float] = {}
+
+# Nombre de threads de calcul du modèle pour ce processus (0 : valeur par défaut du backend)
+_inference_threads: int = 0
+
+
+def set_inference_threads(num_threads: int) -> None:
+    """
+    Fixe le nombre de threads de calcul du modèle pour le processus courant.
+
+    Avec plusieurs workers sur la même machine, chaque worker doit se limiter à sa part
+    des cœurs pour éviter la sur-souscription (plus de threads actifs que de cœurs).
+
+    Parameters
+    ----------
+    num_threads : int
+        Nombre de threads intra-op (torch) ou de la session ONNX Runtime.
+    """
+    global _inference_threads
+    _inference_threads = max(1, num_threads)
+    if INFERENCE_BACKEND == "torch":
+        import torch
+        torch.set_num_threads(_inference_threads)
+
+
+def _model_source() -> str:
+    """
+    Retourne l'emplacement depuis lequel charger le modèle torch.
+
+    L'artefact optimisé pour le chargement ('build_artifact.py') est utilisé s'il est
+    activé et construit à partir de 'MODEL_NAME' ; sinon, le modèle est chargé depuis
+    le cache Hugging Face.
+
+    Returns
+    -------
+    str
+        Chemin de l'artefact ou nom du modèle Hugging Face.
+    """
+    if MODEL_USE_ARTIFACT and artifact_source(MODEL_ARTIFACT_DIR) == MODEL_NAME:
+        return MODEL_ARTIFACT_DIR
+    return MODEL_NAME
+
+
+def _build_model() -> InferenceBackend:
+    """
+    Construit le backend d'inférence configuré ('INFERENCE_BACKEND').
+
+    - "torch" : pipeline 'transformers' (PyTorch), chargé depuis l'artefact de
+      'build_artifact.py' s'il est présent
+    - "onnx"  : session ONNX Runtime CPU sur l'export de 'export_onnx.py'
+    - "stub"  : prédictions factices déterministes, sans modèle (tests, benchmarks)
+
+    Si 'INFERENCE_QUANTIZATION' vaut "int8", les couches linéaires du modèle torch sont
+    quantifiées au chargement, et le backend ONNX charge l'artefact pré-quantifié.
+
+    Tous les backends s'appellent de la même façon et retournent les mêmes labels
+    ("1 star" ... "5 stars").
+
+    Returns
+    -------
+    InferenceBackend
+        Objet appelable : model(texts, batch_size=..., max_length=...) -> List[Dict].
+
+    Raises
+    ------
+    ValueError
+        Si le backend ou le mode de quantification configuré est inconnu.
+    """
+    model = create_backend(
+        INFERENCE_BACKEND,
+        model_name=_model_source(),
+        quantization=INFERENCE_QUANTIZATION,
+        onnx_model_dir=ONNX_MODEL_DIR,
+        num_threads=ONNX_NUM_THREADS or _inference_threads,
+        stub_latency_ms=STUB_LATENCY_MS,
+        stub_latency_per_text_ms=STUB_LATENCY_PER_TEXT_MS,
+    )
+    LOAD_TIMINGS.update(model.load_timings)
+    return model
+
+
+# Modèle de sentiment, chargé à la demande (premier appel) ou au démarrage de l'API
+# (une seule fois par processus, pour éviter de le recharger à chaque appel dans fastAPI)
+_model: Optional[Any] = None
+_model_lock = threading.Lock()
+_model_ready = False
+_model_load_error: Optional[str] = None
+# Préchauffage exécuté une seule fois par processus, même si plusieurs threads le demandent
+_warmup_lock = threading.Lock()
+_model_warmed = False
+
+# Textes représentatifs utilisés pour le préchauffage (court, moyen, long)
+WARMUP_TEXTS: List[str] = [
+    "Très bien.",
+    "Livraison rapide et produit conforme, mais le service client met du temps à répondre.",
+    " ".join(["Commande reçue avec deux semaines de retard, colis abîmé et remboursement partiel."] * 20),
+]
 
 
-# Désactive les messages info de Transformers
-logging.set_verbosity_error()
+def get_model() -> Any:
+    """
+    Retourne le modèle de sentiment, en le chargeant au premier appel.
+
+    Une requête qui déclenche (ou attend) le chargement ne préchauffe pas le modèle : le
+    préchauffage reste à la charge du chargement au démarrage ('load_model').
+
+    Returns
+    -------
+    Any
+        Le modèle chargé (pipeline torch ou backend ONNX).
+    """
+    if _model is None:
+        load_model(warmup=False)
+    return _model
+
+
+def load_model(warmup: bool = MODEL_WARMUP_ENABLED) -> Any:
+    """
+    Charge le modèle de sentiment (une seule fois) puis, optionnellement, le préchauffe.
+
+    Le chargement est protégé par un verrou : des appels concurrents attendent le même
+    chargement au lieu de charger plusieurs fois le modèle. Les durées des phases sont
+    enregistrées dans 'LOAD_TIMINGS'. Si le préchauffage est désactivé
+    ('MODEL_WARMUP_ENABLED'), le modèle est déclaré prêt dès son chargement.
+
+    Parameters
+    ----------
+    warmup : bool, optionnel
+        Si 'True', exécute un préchauffage après le chargement. Par défaut, 'MODEL_WARMUP_ENABLED'.
+
+    Returns
+    -------
+    Any
+        Le modèle chargé.
+
+    Raises
+    ------
+    Exception
+        Si le chargement du modèle échoue (l'erreur est aussi conservée pour '/health/ready').
+    """
+    global _model, _model_load_error, _model_ready
+
+    with _model_lock:
+        if _model is None:
+            if INFERENCE_THREADS and not _inference_threads:
+                set_inference_threads(INFERENCE_THREADS)
+            try:
+                logger.info(f"Chargement du modèle de sentiment ({INFERENCE_BACKEND}, {MODEL_NAME})...")
+                _model = _build_model()
+                _model_load_error = None
+                logger.success(f"Modèle chargé en {LOAD_TIMINGS.get('model_build', 0):.2f} s")
+                # Sans préchauffage, le modèle est prêt dès qu'il est chargé
+                if not MODEL_WARMUP_ENABLED:
+                    _model_ready = True
+            except Exception as error:
+                _model_load_error = str(error)
+                logger.exception(f"Erreur lors du chargement du modèle : {error}")
+                raise
+
+    if warmup:
+        warmup_model()
+    return _model
+
+
+def warmup_model() -> None:
+    """
+    Préchauffe le modèle sur quelques textes représentatifs, puis le déclare prêt.
+
+    Le premier passage d'un modèle est nettement plus lent que les suivants (allocations,
+    initialisation des noyaux de calcul) : il est absorbé ici plutôt que par une requête.
+    Le préchauffage n'est exécuté qu'une fois : les appels concurrents attendent le premier.
+    """
+    global _model_ready, _model_warmed
+
+    with _warmup_lock:
+        if _model_warmed:
+            return
+        start = time.perf_counter()
+        model = get_model()
+        for text in WARMUP_TEXTS:
+            model(text, max_length=MODEL_MAX_LENGTH)
+        model(WARMUP_TEXTS, batch_size=len(WARMUP_TEXTS), max_length=MODEL_MAX_LENGTH)
+        LOAD_TIMINGS["warmup"] = time.perf_counter() - start
+        _model_warmed = True
+        _model_ready = True
+    logger.success(f"Modèle préchauffé en {LOAD_TIMINGS['warmup']:.2f} s")
+
+
+def is_model_ready() -> bool:
+    """
+    Indique si l'API est prête à servir des prédictions.
+
+    - Chargement au démarrage ('MODEL_LOAD_ON_STARTUP') : prête une fois le modèle chargé
+      et préchauffé (ou seulement chargé si 'MODEL_WARMUP_ENABLED' est désactivé) ;
+    - Chargement paresseux : prête immédiatement, le modèle étant chargé par la première
+      requête (qui en supporte la latence) ; une erreur de chargement la rend indisponible.
+
+    Returns
+    -------
+    bool
+        'True' si l'API est prête.
+    """
+    if not MODEL_LOAD_ON_STARTUP:
+        return _model_load_error is None
+    return _model_ready
+
 
-# Chargement du modèle de sentiment via pipeline
-# (en dehors de la fonction pour éviter de le recharger à chaque appel dans fastAPI par exemple)
-_model = pipeline(
-    task="sentiment-analysis",
-    model="cmarkea/distilcamembert-base-sentiment",
-    tokenizer="cmarkea/distilcamembert-base-sentiment",
-    truncation=True,
+def get_model_load_error() -> Optional[str]:
+    """
+    Retourne le message de la dernière erreur de chargement du modèle, le cas échéant.
+
+    Returns
+    -------
+    str, optionnel
+        Le message d'erreur, ou 'None' si aucun chargement n'a échoué.
+    """
+    return _model_load_error
+
+
+def _predict_labels(texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Exécute un passage du modèle sur un lot de textes déjà nettoyés.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Textes nettoyés à envoyer au modèle.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Une sortie du modèle par texte ('label' et 'score'), dans le même ordre.
+    """
+    return get_model()(texts, batch_size=len(texts), max_length=MODEL_MAX_LENGTH)
+
+
+def _token_lengths(texts: List[str]) -> List[int]:
+    """
+    Calcule la longueur en tokens (après troncature) de chaque texte.
+
+    Délègue au backend chargé (tokenizer du modèle) ; à défaut (backend sans tokenizer
+    ou modèle de test), la longueur en caractères sert d'approximation.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Textes nettoyés.
+
+    Returns
+    -------
+    List[int]
+        Longueur de chaque texte, dans le même ordre.
+    """
+    model = get_model()
+    if isinstance(model, InferenceBackend):
+        return model.token_lengths(texts, max_length=MODEL_MAX_LENGTH)
+    return [len(text) for text in texts]
+
+
+# Regroupement des prédictions unitaires concurrentes (désactivé par défaut)
+_batcher = MicroBatcher(
+    predict_fn=_predict_labels,
+    max_batch_size=MICRO_BATCH_MAX_SIZE,
+    max_wait_ms=MICRO_BATCH_MAX_WAIT_MS,
 )
 
+# Cache des sorties du modèle, indexé par hash du texte nettoyé et du modèle
+prediction_cache = PredictionCache(
+    model_id=MODEL_NAME,
+    max_size=PREDICTION_CACHE_SIZE,
+    ttl_seconds=PREDICTION_CACHE_TTL_SECONDS,
+)
+
+
+def _cache_entry(output: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Retourne la copie d'une sortie du modèle conservée dans le cache.
+
+    Les probabilités sont stockées en tuple : une prédiction servie depuis le cache ne
+    partage jamais de liste modifiable avec une réponse précédente.
+
+    Parameters
+    ----------
+    output : Dict[str, Any]
+        Sortie du modèle ('label' et 'scores').
+
+    Returns
+    -------
+    Dict[str, Any]
+        Copie de la sortie, avec 'scores' en tuple (ou None).
+    """
+    scores = output.get("scores")
+    return {"label": output["label"], "scores": tuple(scores) if scores is not None else None}
+
+
+def _star_probabilities(output: Dict[str, Any]) -> Optional[List[float]]:
+    """Retourne une nouvelle liste des probabilités de 1 à 5 étoiles d'une sortie du modèle (ou None)."""
+    scores = output.get("scores")
+    return list(scores) if scores is not None else None
+
+
+def model_version() -> str:
+    """
+    Retourne la version du modèle de sentiment servi par ce processus.
+
+    Les probabilités prédites dépendent du modèle, mais aussi du backend d'inférence et
+    de la quantification : la version les combine et change dès que l'un d'eux change.
+    Elle est calculée à partir de la configuration, sans charger le modèle.
+
+    Returns
+    -------
+    str
+        Version du modèle ("<modèle>|<backend>|<quantification>").
+    """
+    return f"{MODEL_NAME}|{INFERENCE_BACKEND}|{INFERENCE_QUANTIZATION}"
+
 
 def convert_stars_to_sentiment(label: str) -> str:
     """
@@ -64,7 +397,7 @@ def convert_stars_to_sentiment(label: str) -> str:
         raise ValueError(f"Label inattendu : {label}")
 
 
-def predict_sentiment(text: str) -> Dict[str, str]:
+def predict_sentiment(text: str) -> Dict[str, Any]:
     """
     Prédit le sentiment d'un avis utilisateur à partir d'un modèle
     de traitement du langage naturel (NLP).
@@ -92,10 +425,12 @@ def predict_sentiment(text: str) -> Dict[str, str]:
 
     Returns
     -------
-    Dict[str, str]
+    Dict[str, Any]
         Dictionnaire contenant :
-        - text_clean : texte nettoyé utilisé pour la prédiction
-        - sentiment  : sentiment prédit (POSITIVE, NEUTRAL ou NEGATIVE)
+        - text_clean         : texte nettoyé utilisé pour la prédiction
+        - sentiment          : sentiment prédit (POSITIVE, NEUTRAL ou NEGATIVE)
+        - star_probabilities : probabilités de 1 à 5 étoiles (permettent de changer les
+                               seuils de sentiment sans relancer le modèle)
 
     Raises
     ------
@@ -108,11 +443,115 @@ def predict_sentiment(text: str) -> Dict[str, str]:
     if not text_clean:
         raise ValueError("L'avis fourni est vide ou non valide.")
 
-    # Prédiction du sentiment
-    result = _model(text_clean, max_length=512)[0]
+    # Un texte déjà prédit est servi depuis le cache sans passage du modèle
+    cache_key = prediction_cache.make_key(text_clean)
+    result = prediction_cache.get(cache_key)
+
+    if result is None:
+        # Prédiction du sentiment (regroupée avec les requêtes concurrentes si activé)
+        if MICRO_BATCH_ENABLED:
+            result = _batcher.predict(text_clean)
+        else:
+            result = get_model()(text_clean, max_length=MODEL_MAX_LENGTH)[0]
+        prediction_cache.set(cache_key, _cache_entry(result))
+
     sentiment = convert_stars_to_sentiment(result["label"])
 
     return {
         "text_clean": text_clean,
-        "sentiment": sentiment
+        "sentiment": sentiment,
+        "star_probabilities": _star_probabilities(result),
     }
+
+
+def predict_sentiment_batch(
+    texts: List[str],
+    batch_size: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Prédit le sentiment d'une liste d'avis utilisateurs en regroupant les textes
+    par lots pour le modèle.
+
+    Les textes sont nettoyés en une passe ('DataUtils.clean_texts'), puis les textes valides
+    sont envoyés au modèle par lots de 'batch_size' (un seul passage du modèle par lot
+    au lieu d'un passage par texte). Une erreur sur un texte n'interrompt pas le lot :
+    elle est retournée dans le résultat de l'élément concerné.
+
+    Si 'PREDICT_LENGTH_BUCKETING' est actif, les textes sont d'abord triés par longueur
+    en tokens afin que chaque lot regroupe des textes de longueurs proches : un avis long
+    n'impose plus le padding de tout un lot d'avis courts. Les résultats sont toujours
+    retournés dans l'ordre d'origine.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Liste des textes bruts correspondant aux avis utilisateurs.
+
+    batch_size : int, optionnel
+        Nombre de textes envoyés au modèle à chaque passage.
+        Par défaut, 'PREDICT_BATCH_SIZE' (configuration).
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Une liste de dictionnaires, dans le même ordre que 'texts', contenant :
+        - index      : position du texte dans la liste d'entrée
+        - text_clean : texte nettoyé utilisé pour la prédiction (ou None)
+        - sentiment  : sentiment prédit (ou None en cas d'erreur)
+        - star_probabilities : probabilités de 1 à 5 étoiles (ou None)
+        - error      : message d'erreur pour cet élément (ou None)
+    """
+    batch_size = batch_size or PREDICT_BATCH_SIZE
+
+    results: List[Dict[str, Any]] = []
+    valid_indexes: List[int] = []
+    cache_keys: Dict[int, str] = {}
+
+    # Nettoyage des textes : les textes invalides sont signalés sans appeler le modèle,
+    # les textes déjà en cache sont servis directement
+    for index, text_clean in enumerate(DataUtils.clean_texts(texts)):
+        results.append({
+            "index": index, "text_clean": text_clean, "sentiment": None, "star_probabilities": None, "error": None})
+        if not text_clean:
+            results[index]["error"] = "L'avis fourni est vide ou non valide."
+            continue
+
+        cache_keys[index] = prediction_cache.make_key(text_clean)
+        cached = prediction_cache.get(cache_keys[index])
+        if cached is None:
+            valid_indexes.append(index)
+        else:
+            results[index]["sentiment"] = convert_stars_to_sentiment(cached["label"])
+            results[index]["star_probabilities"] = _star_probabilities(cached)
+
+    # Tri par longueur en tokens : lots homogènes, moins de padding
+    if PREDICT_LENGTH_BUCKETING and len(valid_indexes) > batch_size:
+        lengths = _token_lengths([results[index]["text_clean"] for index in valid_indexes])
+        valid_indexes = [index for _, index in sorted(zip(lengths, valid_indexes))]
+
+    # Prédiction par lots sur les textes valides absents du cache
+    for start in range(0, len(valid_indexes), batch_size):
+        chunk = valid_indexes[start:start + batch_size]
+        chunk_texts = [results[index]["text_clean"] for index in chunk]
+        try:
+            outputs = _predict_labels(chunk_texts)
+        except Exception:
+            # En cas d'échec du lot, on repasse texte par texte pour isoler l'erreur
+            outputs = []
+            for text_clean in chunk_texts:
+                try:
+                    outputs.append(get_model()(text_clean, max_length=MODEL_MAX_LENGTH)[0])
+                except Exception as error:
+                    outputs.append(error)
+
+        for index, output in zip(chunk, outputs):
+            try:
+                if isinstance(output, Exception):
+                    raise output
+                results[index]["sentiment"] = convert_stars_to_sentiment(output["label"])
+                results[index]["star_probabilities"] = _star_probabilities(output)
+                prediction_cache.set(cache_keys[index], _cache_entry(output))
+            except Exception as error:
+                results[index]["error"] = str(error)
+
+    return results
@@ -0,0 +1,49 @@
+# File: src\machine_learning\quantization.py
+
+"""
+Module pour la quantification INT8 dynamique du modèle de sentiment (PyTorch).
+
+La quantification dynamique convertit les poids des couches linéaires en INT8
+au chargement ; les activations sont quantifiées à la volée. Sur CPU, cela réduit
+la mémoire occupée par les poids et la latence, pour un léger écart de prédiction
+à mesurer avec 'benchmarks/quantization_report.py'.
+"""
+
+from typing import Any
+import torch
+
+
+def quantize_dynamic_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """
+    Applique la quantification dynamique INT8 aux couches 'torch.nn.Linear' d'un modèle.
+
+    Parameters
+    ----------
+    model : torch.nn.Module
+        Modèle PyTorch en précision fp32 (mode évaluation).
+
+    Returns
+    -------
+    torch.nn.Module
+        Le modèle quantifié.
+    """
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def quantize_pipeline_int8(sentiment_pipeline: Any) -> Any:
+    """
+    Remplace le modèle d'un pipeline 'transformers' par sa version quantifiée INT8.
+
+    Parameters
+    ----------
+    sentiment_pipeline : Any
+        Pipeline 'sentiment-analysis' chargé en fp32.
+
+    Returns
+    -------
+    Any
+        Le même pipeline, dont le modèle est quantifié.
+    """
+    sentiment_pipeline.model = quantize_dynamic_int8(sentiment_pipeline.model)
+    return sentiment_pipeline
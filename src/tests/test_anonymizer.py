@@ -0,0 +1,88 @@
+# File: src\tests\test_anonymizer.py
+
+"""
+Tests de non-régression du moteur d'anonymisation compilé.
+
+Le moteur doit produire exactement le même résultat que l'implémentation d'origine
+(six appels successifs à 're.sub', reproduite ci-dessous comme référence), sur des
+exemples ciblés et sur un corpus généré de plusieurs milliers de textes.
+"""
+
+import random
+import re
+from unittest.mock import patch
+from etl.transform.anonymizer import anonymize_text, anonymize_texts
+
+
+def reference_anonymize_text(text: str) -> str:
+    """Implémentation d'origine de 'anonymize_text' (référence)."""
+    text = re.sub(r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b", "[EMAIL_SUPPRIMÉ]", text)
+    text = re.sub(r"(?:\+33\s*\(?0?\)?|0)[1-9](?:[\s.\-]?\d{2}){4}", "[TÉLÉPHONE_SUPPRIMÉ]", text)
+    text = re.sub(r"(?im)^(Bonour|Bonnour|Bonjouir|Bonsoir|Bonoir)", "Bonjour", text)
+    text = re.sub(r"(?im)^Bonjour\s+[^\n,]+(?:\s*,)?\s*$", "Bonjour [NOM_ANONYMISÉ],", text)
+    text = re.sub(
+        r"\b(MR|M|MME|Mme|Monsieur|Madame|Melle)\s+"
+        r"[A-Za-zÀ-ÖØ-öø-ÿ-]+(?:\s+[A-Za-zÀ-ÖØ-öø-ÿ-]+)*\b",
+        "[NOM_ANONYMISÉ]",
+        text,
+        flags=re.IGNORECASE,
+    )
+    text = re.sub(
+        r"(?m)^(?:[A-ZÀ-ÖØ-Þ][a-zà-öø-ÿ-]+)"
+        r"(?:\s+[A-ZÀ-ÖØ-Þ][a-zà-öø-ÿ-]+)*[.,]?$",
+        "[NOM_ANONYMISÉ]",
+        text,
+    )
+    return text
+
+
+# Fragments combinés pour générer le corpus (cas positifs, négatifs et limites)
+FRAGMENTS = [
+    "Bonjour Marie,", "BONSOIR monsieur Dupont", "bonour Jean-Pierre", "Bonjouir", "Bonoir à tous,",
+    "Bonjour, merci pour votre retour.", "Bon produit", "Bonne journée", "bonnour Léa Martin ,",
+    "jean.dupont@mail.fr", "contact: service-client@showroomprive.com.", "a@b.c", "moi@localhost",
+    "06 12 34 56 78", "+33 6 12 34 56 78", "+33(0)6.12.34.56.78", "0612345678", "01-23-45-67-89",
+    "commande n°0012345", "livré en 2024", "3 colis sur 10", "+331", "00 00 00 00 00",
+    "Mme Durand", "M. Martin", "MR DUPONT a répondu", "Madame la directrice", "melle Zoé", "mr",
+    "Merci Monsieur", "ſervice", "İstanbul", "Kelvin K",
+    "Jean", "Jean Dupont.", "Marie-Claire Lefèvre,", "Élodie", "Service client", "Très déçu",
+    "Livraison rapide et produit conforme", "je recommande !", "", " ", ",", "\n", "\n\n",
+]
+
+
+def generate_corpus(n: int = 3000, seed: int = 7):
+    rng = random.Random(seed)
+    separators = [" ", "\n", ", ", ". ", "\n\n", "  "]
+    corpus = []
+    for _ in range(n):
+        parts = [rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 8))]
+        text = ""
+        for part in parts:
+            text += part + rng.choice(separators)
+        corpus.append(text.strip(" ") if rng.random() < 0.5 else text)
+    return corpus
+
+
+def test_anonymize_text_examples():
+    assert anonymize_text("Écrivez à jean.dupont@mail.fr") == "Écrivez à [EMAIL_SUPPRIMÉ]"
+    assert anonymize_text("Appelez le +33(0)6 12 34 56 78 svp") == "Appelez le [TÉLÉPHONE_SUPPRIMÉ] svp"
+    assert anonymize_text("Bonsoir Marie Dupont") == "Bonjour [NOM_ANONYMISÉ],"
+    assert anonymize_text("Merci Mme Durand, bonne journée") == "Merci [NOM_ANONYMISÉ], bonne journée"
+    assert anonymize_text("Jean Dupont.") == "[NOM_ANONYMISÉ]"
+    assert anonymize_text("livraison rapide") == "livraison rapide"
+
+
+def test_anonymize_text_matches_reference_on_golden_corpus():
+    corpus = generate_corpus()
+    mismatches = [text for text in corpus if anonymize_text(text) != reference_anonymize_text(text)]
+    assert not mismatches, f"{len(mismatches)} textes divergents, par exemple : {mismatches[:3]!r}"
+
+
+def test_anonymize_texts_parallel_matches_serial():
+    corpus = generate_corpus(n=400, seed=11)
+    expected = [reference_anonymize_text(text) for text in corpus]
+
+    assert anonymize_texts(corpus, workers=1) == expected
+    # Seuil abaissé pour forcer la répartition sur plusieurs processus
+    with patch("etl.transform.anonymizer.ANONYMIZE_PARALLEL_MIN_CHARS", 0):
+        assert anonymize_texts(corpus, workers=2) == expected
@@ -0,0 +1,57 @@
+# File: src\tests\test_backends.py
+
+"""
+Tests des backends d'inférence : backend factice ('stub') et sélection par configuration.
+"""
+
+import time
+import pytest
+from unittest import mock
+from machine_learning import predict
+from machine_learning.backends import StubBackend, STAR_LABELS, create_backend
+
+
+def test_stub_backend_is_deterministic():
+    backend = StubBackend()
+    texts = ["Livraison rapide.", "Colis perdu.", "Livraison rapide."]
+
+    outputs = backend(texts)
+
+    assert len(outputs) == 3
+    assert outputs[0] == outputs[2] == backend("Livraison rapide.")[0]
+    assert all(output["label"] in STAR_LABELS for output in outputs)
+    assert all(sum(output["scores"]) == pytest.approx(1) for output in outputs)
+    assert outputs[0]["scores"][STAR_LABELS.index(outputs[0]["label"])] == outputs[0]["score"]
+    assert backend.token_lengths(texts) == [len(text) for text in texts]
+
+
+def test_stub_backend_simulates_latency():
+    backend = StubBackend(latency_ms=20, latency_per_text_ms=5)
+
+    start = time.perf_counter()
+    backend(["a", "b", "c", "d"], batch_size=2)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    # Deux passages de 20 ms et quatre textes à 5 ms
+    assert elapsed_ms >= 60
+
+
+def test_create_backend_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        create_backend("tensorflow", model_name="modele")
+    with pytest.raises(ValueError):
+        create_backend("stub", model_name="modele", quantization="int4")
+
+
+def test_predict_sentiment_with_stub_backend():
+    with mock.patch("machine_learning.predict._model", StubBackend()):
+        predict.prediction_cache.clear()
+        single = predict.predict_sentiment("Service client très réactif.")
+        batch = predict.predict_sentiment_batch(["Service client très réactif.", "Article abîmé."])
+        predict.prediction_cache.clear()
+
+    expected = predict.convert_stars_to_sentiment(StubBackend.predict_one(single["text_clean"])["label"])
+    assert single["sentiment"] == batch[0]["sentiment"] == expected
+    assert single["star_probabilities"] == batch[0]["star_probabilities"]
+    assert len(single["star_probabilities"]) == 5
+    assert batch[1]["error"] is None
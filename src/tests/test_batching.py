@@ -0,0 +1,57 @@
+# File: src\tests\test_batching.py
+
+"""
+Tests unitaires pour le 'MicroBatcher' du module 'machine_learning.batching'.
+
+Vérifie que des prédictions unitaires soumises en même temps sont regroupées en lots,
+que chaque appelant reçoit le résultat de son propre texte, et qu'une erreur sur un
+texte n'affecte pas les autres textes du lot.
+"""
+
+import threading
+import pytest
+from machine_learning.batching import MicroBatcher
+
+
+def test_micro_batcher_groups_concurrent_requests():
+    calls = []
+
+    def fake_predict(texts):
+        calls.append(list(texts))
+        return [text.upper() for text in texts]
+
+    batcher = MicroBatcher(fake_predict, max_batch_size=8, max_wait_ms=50)
+    texts = [f"avis {i}" for i in range(8)]
+    results = {}
+    start = threading.Barrier(len(texts))
+
+    def worker(text):
+        start.wait()
+        results[text] = batcher.predict(text, timeout=5)
+
+    threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Chaque appelant reçoit le résultat de son texte
+    assert results == {text: text.upper() for text in texts}
+    # Les requêtes concurrentes ont été regroupées en moins de passages du modèle
+    assert len(calls) < len(texts)
+    assert all(len(batch) <= 8 for batch in calls)
+
+
+def test_micro_batcher_isolates_errors():
+    def fake_predict(texts):
+        if "erreur" in texts:
+            raise ValueError("texte invalide")
+        return [len(text) for text in texts]
+
+    batcher = MicroBatcher(fake_predict, max_batch_size=4, max_wait_ms=50)
+    ok_future = batcher.submit("bon avis")
+    ko_future = batcher.submit("erreur")
+
+    assert ok_future.result(timeout=5) == len("bon avis")
+    with pytest.raises(ValueError):
+        ko_future.result(timeout=5)
@@ -0,0 +1,56 @@
+# File: src\tests\test_columnar_transform.py
+
+"""
+Tests des conversions vectorisées du moteur de transformation par colonnes.
+
+Vérifie que les dates, les notes et les pourcentages des entreprises calculés par colonnes
+sont identiques aux conversions de 'DataUtils' et du moteur par lignes, y compris pour les
+valeurs hors format (dates invalides, années bissextiles, types inattendus).
+"""
+
+import random
+from etl.transform.columnar_transform import enterprise_fields_columnar, format_dates, to_floats
+from etl.transform.transform_reviews import _enterprise_fields
+from etl.utils.data_utils import DataUtils
+
+
+def _expected_date(value):
+    # 'format_date' ne reçoit que des chaînes ou None dans la transformation par lignes
+    return DataUtils.format_date(value) if isinstance(value, (str, type(None))) else None
+
+
+def test_format_dates_matches_format_date():
+    rng = random.Random(3)
+    values = []
+    for year in [1, 1900, 2000, 2023, 2024, 2100, 9999, 0]:
+        for month in range(0, 14):
+            for day in (0, 1, 28, 29, 30, 31, 32):
+                values.append(f"{year:04d}-{month:02d}-{day:02d}")
+                values.append(
+                    f"{year:04d}-{month:02d}-{day:02d}T{rng.randint(0, 25):02d}:{rng.randint(0, 61):02d}"
+                    f":{rng.randint(0, 61):02d}.{rng.randint(0, 999):03d}Z")
+    alphabet = "0123456789-T:.Z+ x"
+    values += ["".join(rng.choice(alphabet) for _ in range(rng.choice([10, 20, 24, 27]))) for _ in range(5000)]
+    values += [None, "", 3, "2024-03-01T10:00:00Z", "2024-03-01T10:00:00.000+02:00", "２０２４-03-01"]
+
+    assert format_dates(values) == [_expected_date(value) for value in values]
+    assert format_dates([]) == []
+
+
+def test_to_floats_matches_to_float():
+    for values in ([1, 2, 5, 3.5], [1, "4", None, True, "abc", 2.0]):
+        assert to_floats(values) == [DataUtils.to_float(value) for value in values]
+
+
+def test_enterprise_fields_columnar_matches_rows():
+    raw_list = [
+        {"enterprise_url": "a.com", "enterprise": {"ratings": {"total": 7, "one": 1, "two": 2, "five": 4}}},
+        {"enterprise_url": "b.com", "enterprise": {"name": "B", "ratings": {"total": 0}}},
+        {"enterprise_url": "c.com"},
+        {"enterprise_url": "d.com", "enterprise": {"ratings": {"total": 3.0, "three": 1}}},
+    ]
+    assert enterprise_fields_columnar(raw_list) == [_enterprise_fields(raw) for raw in raw_list]
+
+    # Note non numérique : calcul entreprise par entreprise
+    raw_list[0]["enterprise"]["ratings"]["one"] = True
+    assert enterprise_fields_columnar(raw_list) == [_enterprise_fields(raw) for raw in raw_list]
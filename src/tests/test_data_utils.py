@@ -0,0 +1,57 @@
+# File: src\tests\test_data_utils.py
+
+"""
+Tests du nettoyage des textes par colonnes ('DataUtils.clean_texts').
+
+Vérifie que le résultat est identique, texte par texte, à celui de 'DataUtils.clean_text'
+(textes ASCII, caractères Unicode à normaliser, tous les espaces Unicode, textes sans
+caractère alphanumérique, troncature).
+"""
+
+import random
+import sys
+from etl.utils.data_utils import DataUtils
+
+
+# Tous les caractères considérés comme des espaces par Python (str.isspace / \s)
+UNICODE_SPACES = [chr(code) for code in range(sys.maxunicode + 1) if chr(code).isspace()]
+
+SPECIAL_TEXTS = [
+    None,
+    "",
+    "   ",
+    "!!! ??? ...",
+    "Très bien !",
+    "  Livraison\trapide\n\nmerci  ",
+    "\ufb01nalement livré",  # ligature normalisée par NFKC
+    "Note : \uff11\uff10/\uff11\uff10",  # chiffres pleine chasse (alphanumériques après NFKC)
+    "ＡＢＣ",
+    "\uff34\uff52ès\u00a0bien\u2003!\u202f",  # espaces insécables et cadratin
+    "\x1c\x1d\x1e\x1fséparateurs\x85",
+    "zéro\u200blargeur",  # espace de largeur nulle : pas un espace pour Python
+    "é" * 10 + " " + "a",
+    "😀😀😀",
+    "😀 ok",
+    "x" * 6000,
+    " y" * 3000,
+]
+
+
+def _random_texts(count: int, seed: int = 7):
+    """Textes aléatoires mêlant ASCII, accents, caractères de compatibilité et espaces Unicode."""
+    rng = random.Random(seed)
+    alphabet = list("abcXYZ019 .,!?'-") + list("éèàçœ€…") + ["ﬁ", "²", "Ⅻ", "ｋ", "́"] + UNICODE_SPACES
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+
+def test_clean_texts_matches_clean_text():
+    texts = SPECIAL_TEXTS + [space * 3 + "a" + space for space in UNICODE_SPACES] + _random_texts(5000)
+
+    assert DataUtils.clean_texts(texts) == [DataUtils.clean_text(text) for text in texts]
+
+
+def test_clean_texts_max_length():
+    texts = ["  abc   def  ", "ｘ" * 50, None]
+
+    assert DataUtils.clean_texts(texts, max_length=5) == [DataUtils.clean_text(text, max_length=5) for text in texts]
+    assert DataUtils.clean_texts(texts, max_length=5) == ["abc d", "xxxxx", None]
@@ -0,0 +1,26 @@
+# File: src\tests\test_gunicorn_conf.py
+
+"""
+Tests de la configuration Gunicorn : préchargement du modèle dans le processus maître.
+"""
+
+from unittest.mock import patch
+from api import gunicorn_conf
+
+
+def test_on_starting_loads_torch_model():
+    with patch("api.gunicorn_conf.MODEL_LOAD_ON_STARTUP", True), \
+         patch("api.gunicorn_conf.INFERENCE_BACKEND", "torch"), \
+         patch("api.gunicorn_conf.set_inference_threads"), \
+         patch("api.gunicorn_conf.gc.freeze"), \
+         patch("api.gunicorn_conf.load_model") as load_model:
+        gunicorn_conf.on_starting(server=None)
+    load_model.assert_called_once_with(warmup=False)
+
+
+def test_on_starting_respects_load_on_startup_flag():
+    with patch("api.gunicorn_conf.MODEL_LOAD_ON_STARTUP", False), \
+         patch("api.gunicorn_conf.INFERENCE_BACKEND", "torch"), \
+         patch("api.gunicorn_conf.load_model") as load_model:
+        gunicorn_conf.on_starting(server=None)
+    load_model.assert_not_called()
@@ -0,0 +1,89 @@
+# File: src\tests\test_health.py
+
+"""
+Tests des sondes de santé de l'API ('/health/live' et '/health/ready').
+
+Le client de test est utilisé sans le cycle de vie de l'application : le modèle
+n'est donc pas chargé et l'état de disponibilité est simulé.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from api.main import app
+from machine_learning import predict
+
+client = TestClient(app)
+
+
+def test_health_live():
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+def test_health_ready_while_loading():
+    with patch("api.routes.health.is_model_ready", return_value=False), \
+         patch("api.routes.health.get_model_load_error", return_value=None):
+        response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "loading"}
+
+
+def test_health_ready_after_warmup():
+    with patch("api.routes.health.is_model_ready", return_value=True):
+        response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+
+def _fake_model(texts, **kwargs):
+    return [{"label": "5 stars"}]
+
+
+def test_health_ready_without_warmup():
+    with patch.object(predict, "_model", None), patch.object(predict, "_model_ready", False), \
+         patch.object(predict, "_model_warmed", False), \
+         patch.object(predict, "MODEL_LOAD_ON_STARTUP", True), \
+         patch.object(predict, "MODEL_WARMUP_ENABLED", False), \
+         patch.object(predict, "_build_model", return_value=_fake_model):
+        assert client.get("/health/ready").status_code == 503
+        predict.load_model(warmup=False)
+        response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+
+def test_health_ready_in_lazy_mode():
+    with patch.object(predict, "_model", None), patch.object(predict, "_model_ready", False), \
+         patch.object(predict, "MODEL_LOAD_ON_STARTUP", False):
+        # Modèle chargé par la première requête : l'API est prête sans l'attendre
+        assert client.get("/health/ready").status_code == 200
+        with patch.object(predict, "_model_load_error", "Modèle introuvable"):
+            assert client.get("/health/ready").status_code == 503
+
+
+def test_warmup_runs_once_with_concurrent_request():
+    calls = []
+    started = threading.Event()
+
+    def slow_build():
+        started.set()
+        time.sleep(0.1)
+        return lambda texts, **kwargs: calls.append(texts) or [{"label": "5 stars"}]
+
+    with patch.object(predict, "_model", None), patch.object(predict, "_model_ready", False), \
+         patch.object(predict, "_model_warmed", False), \
+         patch.object(predict, "_build_model", side_effect=slow_build):
+        loader = threading.Thread(target=predict.load_model, kwargs={"warmup": True})
+        loader.start()
+        started.wait()
+        # Requête arrivée pendant le chargement : attend le modèle sans le préchauffer
+        predict.get_model()
+        loader.join()
+        predict.load_model(warmup=True)
+        assert predict.is_model_ready()
+
+    # Un seul préchauffage : chaque texte puis le lot complet
+    assert len(calls) == len(predict.WARMUP_TEXTS) + 1
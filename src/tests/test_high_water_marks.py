@@ -0,0 +1,244 @@
+# File: src\tests\test_high_water_marks.py
+
+"""
+Tests de l'extraction incrémentale.
+
+Vérifie le store des repères (avis le plus récent déjà ingéré par entreprise), l'arrêt de
+la pagination à la première page d'avis déjà vus (extraction par lot et en flux), et la mise
+à jour des repères par le pipeline uniquement lorsque toutes les étapes ont réussi et que
+l'extraction de l'entreprise est complète (aucune page perdue).
+"""
+
+import json
+import pytest
+from collections import Counter
+from unittest.mock import AsyncMock, patch
+from httpx import Request, Response
+from etl.extract.reviews_scraper import ScrapeSession, iter_review_pages
+from etl.pipeline.reviews_etl import run_reviews_etl, run_reviews_etl_streaming
+from etl.utils.high_water_marks import HighWaterMarkStore, is_seen_review, newest_review_mark
+
+
+def _review(number: int) -> dict:
+    """Avis factice ; plus 'number' est petit, plus l'avis est récent."""
+    return {"id": f"r{number}", "dates": {"publishedDate": f"2024-01-{31 - number:02d}T10:00:00.000Z"}}
+
+
+class FakeClient:
+    """Client HTTP factice : 5 pages de 3 avis triés du plus récent au plus ancien."""
+
+    def __init__(self, total_pages: int = 5, failing_pages=()):
+        self.total_pages = total_pages
+        self.failing_pages = set(failing_pages)
+        self.calls = Counter()
+
+    async def get(self, url):
+        self.calls["get"] += 1
+        return Response(200, text='<script id="__NEXT_DATA__">{"buildId": "b"}</script>', request=Request("GET", url))
+
+    async def post(self, url):
+        self.calls["post"] += 1
+        page = int(url.split("&page=")[1]) if "&page=" in url else 1
+        if page in self.failing_pages:
+            return Response(503, request=Request("POST", url))
+        return Response(200, request=Request("POST", url), text=json.dumps({"pageProps": {
+            "reviews": [_review(3 * (page - 1) + index) for index in range(3)],
+            "filters": {"pagination": {"totalPages": self.total_pages}, "reviewStatistics": {"ratings": {}}},
+            "businessUnit": {"displayName": "A", "trustScore": 4.0, "numberOfReviews": 15},
+        }}))
+
+
+def test_is_seen_review_and_newest_mark():
+    mark = {"review_id": "r5", "published_date": _review(5)["dates"]["publishedDate"]}
+    assert is_seen_review(_review(5), mark)
+    assert is_seen_review(_review(6), mark)
+    assert not is_seen_review(_review(4), mark)
+    assert not is_seen_review(_review(6), None)
+    assert newest_review_mark([_review(7), _review(2), _review(4)]) == {
+        "review_id": "r2", "published_date": _review(2)["dates"]["publishedDate"]}
+    assert newest_review_mark([]) is None
+
+
+def test_store_never_moves_back(tmp_path):
+    store = HighWaterMarkStore(str(tmp_path / "scrape_state.sqlite3"))
+    store.update_many({"a.com": newest_review_mark([_review(2)])})
+    store.update_many({"a.com": newest_review_mark([_review(8)]), "b.com": newest_review_mark([_review(1)])})
+
+    assert store.get_all() == {
+        "a.com": {"review_id": "r2", "published_date": _review(2)["dates"]["publishedDate"]},
+        "b.com": {"review_id": "r1", "published_date": _review(1)["dates"]["publishedDate"]},
+    }
+    store.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mark_number, expected_new, expected_posts", [
+    (6, 6, 3),     # repère en tête de la page 3 : pages 1-2 nouvelles, page 3 déjà vue
+    (4, 4, 3),     # repère au milieu de la page 2 : page 2 partiellement nouvelle
+    (0, 0, 1),     # aucun nouvel avis : seule la première page est demandée
+])
+async def test_incremental_scrape_stops_at_seen_page(mark_number, expected_new, expected_posts):
+    client = FakeClient()
+    mark = newest_review_mark([_review(mark_number)])
+    with patch("etl.extract.reviews_scraper.client", client):
+        reviews, _, complete = await ScrapeSession().scrape_reviews(
+            "https://www.trustpilot.com/review/a.com", max_pages=5, high_water_mark=mark)
+
+    assert [review["id"] for review in reviews] == [f"r{number}" for number in range(expected_new)]
+    assert client.calls == {"get": 1, "post": expected_posts}
+    assert complete
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mark_number", [9, None])
+async def test_page_error_marks_scrape_incomplete(mark_number):
+    client = FakeClient(failing_pages={2})
+    mark = newest_review_mark([_review(mark_number)]) if mark_number is not None else None
+    with patch("etl.extract.reviews_scraper.client", client):
+        reviews, _, complete = await ScrapeSession().scrape_reviews(
+            "https://www.trustpilot.com/review/a.com", max_pages=5, high_water_mark=mark)
+
+    assert not complete
+    if mark is not None:
+        # Pagination interrompue à la page perdue : les pages suivantes ne sont pas demandées
+        assert [review["id"] for review in reviews] == ["r0", "r1", "r2"]
+        assert client.calls["post"] == 2
+    else:
+        # Extraction complète : la page perdue est ignorée, les autres sont conservées
+        assert len(reviews) == 12
+
+
+@pytest.mark.asyncio
+async def test_incremental_streaming_stops_at_seen_page():
+    client = FakeClient()
+    marks = {"a.com": newest_review_mark([_review(4)])}
+    with patch("etl.extract.reviews_scraper.client", client), \
+         patch("etl.extract.reviews_scraper.ENTERPRISES", [{"enterprise_url": "a.com"}]):
+        pages = [page async for page in iter_review_pages(max_pages=5, prefetch=4, high_water_marks=marks)]
+
+    assert [[review["id"] for review in page["reviews"]] for page in pages] == [["r0", "r1", "r2"], ["r3"]]
+    assert not any(page["error"] for page in pages)
+    # Pas de pré-chargement au-delà de la page déjà vue
+    assert client.calls == {"get": 1, "post": 3}
+
+
+@pytest.mark.asyncio
+async def test_incremental_streaming_page_error():
+    client = FakeClient(failing_pages={2})
+    marks = {"a.com": newest_review_mark([_review(9)])}
+    with patch("etl.extract.reviews_scraper.client", client), \
+         patch("etl.extract.reviews_scraper.ENTERPRISES", [{"enterprise_url": "a.com"}]):
+        pages = [page async for page in iter_review_pages(max_pages=5, prefetch=4, high_water_marks=marks)]
+
+    # Première page produite, puis arrêt à la page perdue et entreprise signalée en échec
+    assert [(len(page["reviews"]), page["error"]) for page in pages] == [(3, False), (0, True)]
+    assert client.calls["post"] == 2
+
+
+def _run_pipeline(tmp_path, reviews, full_rescan=False, load_error=None, transform=None, do_load=True):
+    """Exécute le pipeline par lot (extraction, transformation et chargement simulés)."""
+    extract = AsyncMock(return_value=[{"enterprise_url": "a.com", "enterprise": {}, "reviews": reviews}])
+    with patch("etl.pipeline.reviews_etl.SCRAPE_STATE_PATH", str(tmp_path / "scrape_state.sqlite3")), \
+         patch("etl.pipeline.reviews_etl.get_reviews_from_trustpilot", extract), \
+         patch("etl.pipeline.reviews_etl.transform_reviews_for_elasticsearch",
+               side_effect=transform, return_value=[{"id_review": "x"}]), \
+         patch("etl.pipeline.reviews_etl.FileUtils"), \
+         patch("etl.pipeline.reviews_etl._compact_sentiment_store"), \
+         patch("etl.pipeline.reviews_etl.load_reviews_to_elasticsearch_bulk", side_effect=load_error):
+        run_reviews_etl(max_pages=5, do_save=False, do_load=do_load, streaming=False, full_rescan=full_rescan)
+    return extract.call_args.kwargs["high_water_marks"]
+
+
+def _run_scraping_pipeline(tmp_path, client, streaming=False, do_load=True):
+    """Exécute le pipeline avec le scraper réel sur un client factice (transformation et chargement simulés)."""
+    with patch("etl.extract.reviews_scraper.client", client), \
+         patch("etl.extract.reviews_scraper.ENTERPRISES", [{"enterprise_url": "a.com"}]), \
+         patch("etl.pipeline.reviews_etl.SCRAPE_STATE_PATH", str(tmp_path / "scrape_state.sqlite3")), \
+         patch("etl.pipeline.reviews_etl.transform_reviews_for_elasticsearch", return_value=[{"id_review": "x"}]), \
+         patch("etl.pipeline.reviews_etl.FileUtils"), \
+         patch("etl.pipeline.reviews_etl._compact_sentiment_store"), \
+         patch("etl.pipeline.reviews_etl.load_reviews_to_elasticsearch_bulk"), \
+         patch("etl.pipeline.reviews_etl.connect_elasticsearch"), \
+         patch("etl.pipeline.reviews_etl.create_index_if_not_exists"), \
+         patch("etl.pipeline.reviews_etl.bulk_upsert_documents"):
+        if streaming:
+            run_reviews_etl_streaming(max_pages=5, do_save=False, do_load=do_load)
+        else:
+            run_reviews_etl(max_pages=5, do_save=False, do_load=do_load, streaming=False)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_pipeline_keeps_mark_before_lost_page(tmp_path, streaming):
+    store = HighWaterMarkStore(str(tmp_path / "scrape_state.sqlite3"))
+    store.update_many({"a.com": newest_review_mark([_review(9)])})
+
+    # Page 2 en erreur : le repère n'avance pas au-delà (avis r3 à r8 à extraire à nouveau)
+    _run_scraping_pipeline(tmp_path, FakeClient(failing_pages={2}), streaming)
+    assert store.get_all() == {"a.com": newest_review_mark([_review(9)])}
+
+    # Exécution suivante sans erreur : la page 2 est extraite et le repère avance
+    client = FakeClient()
+    _run_scraping_pipeline(tmp_path, client, streaming)
+    assert client.calls["post"] == 4
+    assert store.get_all() == {"a.com": newest_review_mark([_review(0)])}
+    store.close()
+
+
+def test_all_enterprises_failed_is_not_nothing_new(tmp_path):
+    client = FakeClient(failing_pages={1})
+
+    # Flux : l'échec de toutes les entreprises interrompt le pipeline
+    with pytest.raises(RuntimeError):
+        _run_scraping_pipeline(tmp_path, client, streaming=True)
+
+    # Par lot : le pipeline ne s'arrête pas sur "aucun nouvel avis" et ne crée aucun repère
+    with patch("etl.pipeline.reviews_etl.logger") as logger:
+        _run_scraping_pipeline(tmp_path, client)
+    assert not any("Aucun nouvel avis" in str(call) for call in logger.success.call_args_list)
+    assert logger.exception.called
+
+    store = HighWaterMarkStore(str(tmp_path / "scrape_state.sqlite3"))
+    assert store.get_all() == {}
+    store.close()
+
+
+def test_pipeline_updates_marks_after_success(tmp_path):
+    store_path = str(tmp_path / "scrape_state.sqlite3")
+
+    # Premier passage : pas encore de repère
+    assert _run_pipeline(tmp_path, [_review(3), _review(4)]) == {}
+    # Chargement en échec : le repère n'avance pas
+    mark = _run_pipeline(tmp_path, [_review(1)], load_error=RuntimeError("Elasticsearch indisponible"))
+    assert mark == {"a.com": newest_review_mark([_review(3)])}
+    # Extraction complète : repères ignorés à l'extraction, puis mis à jour
+    assert _run_pipeline(tmp_path, [_review(0)], full_rescan=True) is None
+
+    store = HighWaterMarkStore(store_path)
+    assert store.get_all() == {"a.com": newest_review_mark([_review(0)])}
+    store.close()
+
+
+def test_pipeline_keeps_mark_below_unscored_reviews(tmp_path):
+    def transform(raw_list, unscored=None):
+        # Prédiction en échec pour un avis de l'entreprise
+        unscored.append("r1")
+        return [{"id_review": "x"}]
+
+    _run_pipeline(tmp_path, [_review(1), _review(2)], transform=transform)
+    # Avis non scoré : le repère n'est pas créé, les avis seront extraits et scorés à nouveau
+    assert _run_pipeline(tmp_path, [_review(1), _review(2)]) == {}
+
+    store = HighWaterMarkStore(str(tmp_path / "scrape_state.sqlite3"))
+    assert store.get_all() == {"a.com": newest_review_mark([_review(1)])}
+    store.close()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_marks_unchanged_without_load(tmp_path, streaming):
+    # Avis extraits et transformés mais non chargés dans Elasticsearch : le repère n'est pas créé
+    _run_scraping_pipeline(tmp_path, FakeClient(), streaming, do_load=False)
+    assert _run_pipeline(tmp_path, [_review(0)], do_load=False) == {}
+
+    store = HighWaterMarkStore(str(tmp_path / "scrape_state.sqlite3"))
+    assert store.get_all() == {}
+    store.close()
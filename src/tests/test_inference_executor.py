@@ -0,0 +1,105 @@
+# File: src\tests\test_inference_executor.py
+
+"""
+Tests de l'exécuteur d'inférence borné et de la réponse HTTP 429 de '/predict'.
+"""
+
+import threading
+import typing
+import pytest
+from unittest import mock
+from fastapi.testclient import TestClient
+from api.config import REQUEST_CLASS_HEADER
+from api.inference_executor import InferenceExecutor, QueueFullError, BULK, INTERACTIVE, PRIORITY_CLASSES
+from api.main import app
+from api.routes.predict import RequestClass
+from etl.utils.sentiment_session import SentimentApiSession
+
+
+def test_executor_returns_results_and_exceptions():
+    executor = InferenceExecutor(max_workers=2, max_queue_size=4)
+
+    assert executor.submit(lambda x: x * 2, 21).result(timeout=5) == 42
+    with pytest.raises(ValueError):
+        executor.submit(int, "pas un nombre").result(timeout=5)
+
+
+def test_executor_rejects_when_queue_is_full():
+    executor = InferenceExecutor(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking_task():
+        started.set()
+        release.wait(timeout=5)
+        return "ok"
+
+    running = executor.submit(blocking_task)
+    assert started.wait(timeout=5)
+    queued = executor.submit(blocking_task)
+
+    # Thread occupé et file pleine : la requête suivante est refusée immédiatement
+    with pytest.raises(QueueFullError):
+        executor.submit(blocking_task)
+    assert executor.stats()["rejected"]["interactive"] == 1
+    assert executor.stats()["queue_depth"]["interactive"] == 1
+
+    release.set()
+    assert running.result(timeout=5) == "ok"
+    assert queued.result(timeout=5) == "ok"
+
+
+def test_executor_serves_interactive_first_without_starving_bulk():
+    executor = InferenceExecutor(max_workers=1, max_queue_size=20, bulk_min_share=0.25)
+    release = threading.Event()
+    started = threading.Event()
+    order = []
+
+    def blocking_task():
+        started.set()
+        release.wait(timeout=5)
+
+    # Le thread unique est occupé pendant que les deux files se remplissent
+    blocker = executor.submit(blocking_task)
+    assert started.wait(timeout=5)
+    futures = [executor.submit(order.append, f"bulk-{i}", priority=BULK) for i in range(3)]
+    futures += [executor.submit(order.append, f"interactive-{i}", priority=INTERACTIVE) for i in range(6)]
+    release.set()
+    for future in [blocker] + futures:
+        future.result(timeout=5)
+
+    # Trois tâches interactives, puis une tâche 'bulk' (part minimale de 1/4), etc.
+    assert order == [
+        "interactive-0", "interactive-1", "interactive-2", "bulk-0",
+        "interactive-3", "interactive-4", "interactive-5", "bulk-1", "bulk-2",
+    ]
+
+
+def test_predict_returns_429_when_queue_is_full():
+    client = TestClient(app)
+    with mock.patch(
+        "api.routes.predict.inference_executor.submit", side_effect=QueueFullError("File d'inférence pleine")
+    ):
+        response = client.post("/predict", json={"text": "Livraison rapide."})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_predict_runs_in_inference_executor():
+    client = TestClient(app)
+    with mock.patch("machine_learning.predict._model", return_value=[{"label": "5 stars"}]):
+        response = client.post("/predict", json={"text": "Service impeccable, je recommande."})
+
+    assert response.status_code == 200
+    assert response.json()["sentiment"] == "Positif"
+
+
+def test_etl_session_sends_bulk_request_class():
+    # L'en-tête et les classes de l'ETL sont ceux lus par l'API
+    SentimentApiSession.close()
+    try:
+        assert SentimentApiSession.get_session().headers[REQUEST_CLASS_HEADER] == BULK
+    finally:
+        SentimentApiSession.close()
+    assert set(typing.get_args(RequestClass)) == set(PRIORITY_CLASSES)
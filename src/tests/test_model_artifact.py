@@ -0,0 +1,39 @@
+# File: src\tests\test_model_artifact.py
+
+"""
+Test de l'artefact de modèle optimisé pour le chargement ('model_artifact.py').
+
+L'artefact est construit dans un dossier temporaire à partir du cache local, puis
+rechargé par le backend torch : les prédictions doivent être identiques à celles du
+modèle d'origine. Le test est ignoré si les poids ne sont pas dans le cache local.
+"""
+
+import os
+import pytest
+from machine_learning.config import MODEL_NAME
+
+
+def test_model_artifact_matches_source_model(tmp_path):
+    from transformers import AutoConfig
+    from machine_learning.backends import TorchPipelineBackend
+    from machine_learning.model_artifact import artifact_source, build_model_artifact
+
+    try:
+        AutoConfig.from_pretrained(MODEL_NAME, local_files_only=True)
+    except OSError:
+        pytest.skip(f"Modèle {MODEL_NAME} absent du cache local")
+
+    assert artifact_source(str(tmp_path)) is None
+    build_model_artifact(MODEL_NAME, str(tmp_path))
+
+    assert artifact_source(str(tmp_path)) == MODEL_NAME
+    assert os.path.exists(os.path.join(tmp_path, "model.safetensors"))
+    assert os.path.exists(os.path.join(tmp_path, "tokenizer.json"))
+
+    texts = ["Livraison rapide, produit conforme.", "Colis jamais reçu, très déçu."]
+    expected = TorchPipelineBackend(MODEL_NAME)(texts)
+    actual = TorchPipelineBackend(str(tmp_path))(texts)
+
+    assert [output["label"] for output in actual] == [output["label"] for output in expected]
+    for artifact_output, source_output in zip(actual, expected):
+        assert artifact_output["score"] == pytest.approx(source_output["score"], abs=1e-5)
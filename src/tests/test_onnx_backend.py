@@ -0,0 +1,40 @@
+# File: src\tests\test_onnx_backend.py
+
+"""
+Test de parité entre le backend ONNX Runtime et le pipeline transformers (torch).
+
+Le modèle est exporté au format ONNX dans un dossier temporaire à partir du cache
+local, puis les labels et scores des deux backends sont comparés. Le test est ignoré
+si onnxruntime n'est pas installé ou si les poids ne sont pas dans le cache local.
+"""
+
+import pytest
+from machine_learning.config import MODEL_NAME
+
+ort = pytest.importorskip("onnxruntime")
+
+
+def test_onnx_backend_parity_with_torch(tmp_path):
+    from transformers import AutoConfig, pipeline
+    from machine_learning.onnx_backend import OnnxSentimentPipeline, export_to_onnx
+
+    try:
+        AutoConfig.from_pretrained(MODEL_NAME, local_files_only=True)
+    except OSError:
+        pytest.skip(f"Modèle {MODEL_NAME} absent du cache local")
+
+    export_to_onnx(MODEL_NAME, str(tmp_path))
+    onnx_model = OnnxSentimentPipeline(str(tmp_path))
+    torch_model = pipeline(task="sentiment-analysis", model=MODEL_NAME, tokenizer=MODEL_NAME, truncation=True)
+
+    texts = [
+        "Livraison rapide, produit conforme, je recommande.",
+        "Colis jamais reçu et service client injoignable.",
+        "Correct sans plus.",
+    ]
+    expected = torch_model(texts, max_length=512)
+    actual = onnx_model(texts, batch_size=2, max_length=512)
+
+    assert [output["label"] for output in actual] == [output["label"] for output in expected]
+    for onnx_output, torch_output in zip(actual, expected):
+        assert onnx_output["score"] == pytest.approx(torch_output["score"], abs=1e-3)
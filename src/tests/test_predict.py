@@ -9,10 +9,20 @@ de texte et du modèle de prédiction.
 
 import pytest
 from unittest import mock
-from machine_learning.predict import predict_sentiment, convert_stars_to_sentiment
+from machine_learning.predict import predict_sentiment, predict_sentiment_batch, convert_stars_to_sentiment
+from machine_learning.predict import model_version
+from machine_learning.predict import prediction_cache
 from etl.utils.data_utils import DataUtils
 
 
+@pytest.fixture(autouse=True)
+def clear_prediction_cache():
+    # Chaque test part d'un cache vide pour que le modèle mocké soit bien appelé
+    prediction_cache.clear()
+    yield
+    prediction_cache.clear()
+
+
 # Test pour la fonction convert_stars_to_sentiment
 def test_convert_stars_to_sentiment():
     # Test pour chaque label possible
@@ -39,3 +49,82 @@ def test_predict_sentiment():
     
     # Vérifier que le texte nettoyé est bien celui attendu
     assert result["text_clean"] == "This is a clean review."
+
+
+# Test unitaire pour la fonction 'predict_sentiment_batch' avec un mock
+def test_predict_sentiment_batch():
+    labels = {"Super produit": "5 stars", "Service moyen": "3 stars", "Très déçu": "1 star"}
+
+    def fake_model(texts, **kwargs):
+        return [{"label": labels[text]} for text in texts]
+
+    with mock.patch('machine_learning.predict._model', side_effect=fake_model) as mock_model:
+        results = predict_sentiment_batch(
+            ["Super produit", "   ", "Service moyen", "Très déçu"], batch_size=2
+        )
+
+    # Un seul appel au modèle par lot de textes valides
+    assert mock_model.call_count == 2
+
+    # Les résultats sont retournés dans l'ordre d'entrée, avec une erreur par élément invalide
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert [r["sentiment"] for r in results] == ["Positif", None, "Neutre", "Négatif"]
+    assert results[1]["error"] is not None
+    assert all(r["error"] is None for i, r in enumerate(results) if i != 1)
+
+
+# Test unitaire : un texte déjà prédit est servi depuis le cache
+def test_predict_sentiment_uses_cache():
+    with mock.patch('machine_learning.predict._model', return_value=[{'label': '1 star'}]) as mock_model:
+        first = predict_sentiment("Colis jamais reçu.")
+        second = predict_sentiment("Colis jamais reçu.")
+
+    assert first == second
+    assert mock_model.call_count == 1
+
+
+# Test unitaire : modifier les probabilités retournées n'altère pas le cache
+def test_cached_star_probabilities_not_shared():
+    scores = [0.1, 0.1, 0.2, 0.3, 0.3]
+    with mock.patch('machine_learning.predict._model', return_value=[{'label': '5 stars', 'scores': scores}]):
+        first = predict_sentiment("Très bon produit.")
+        first["star_probabilities"][0] = 1.0
+        second = predict_sentiment("Très bon produit.")
+        batch = predict_sentiment_batch(["Très bon produit."])
+
+    assert second["star_probabilities"] == [0.1, 0.1, 0.2, 0.3, 0.3]
+    assert second["star_probabilities"] is not batch[0]["star_probabilities"]
+    assert batch[0]["star_probabilities"] == [0.1, 0.1, 0.2, 0.3, 0.3]
+
+
+# Test unitaire : les lots envoyés au modèle regroupent des textes de longueurs proches
+def test_predict_sentiment_batch_length_bucketing():
+    texts = ["Un avis nettement plus long que les autres textes", "Bien", "Avis moyen ici", "Nul"]
+    calls = []
+
+    def fake_model(batch, **kwargs):
+        calls.append(list(batch))
+        return [{"label": "4 stars" if len(text) > 4 else "2 stars"} for text in batch]
+
+    with mock.patch('machine_learning.predict.PREDICT_LENGTH_BUCKETING', True), \
+         mock.patch('machine_learning.predict._model', new=fake_model):
+        results = predict_sentiment_batch(texts, batch_size=2)
+
+    # Les textes courts puis les textes longs sont regroupés ensemble
+    assert calls == [["Nul", "Bien"], ["Avis moyen ici", texts[0]]]
+    # Les résultats restent dans l'ordre d'origine
+    assert [r["text_clean"] for r in results] == texts
+    assert [r["sentiment"] for r in results] == ["Positif", "Négatif", "Positif", "Négatif"]
+
+
+# Test unitaire : la version du modèle change avec le backend et la quantification
+def test_model_version_includes_backend_and_quantization():
+    with mock.patch('machine_learning.predict.INFERENCE_BACKEND', "onnx"), \
+         mock.patch('machine_learning.predict.INFERENCE_QUANTIZATION', "none"):
+        fp32 = model_version()
+    with mock.patch('machine_learning.predict.INFERENCE_BACKEND', "onnx"), \
+         mock.patch('machine_learning.predict.INFERENCE_QUANTIZATION', "int8"):
+        int8 = model_version()
+
+    assert fp32.endswith("|onnx|none")
+    assert int8 != fp32
@@ -0,0 +1,41 @@
+# File: src\tests\test_prediction_cache.py
+
+"""
+Tests unitaires pour le cache de prédictions 'PredictionCache'.
+
+Vérifie l'éviction LRU, l'expiration (TTL), les compteurs hits/misses et
+que la clé dépend à la fois du texte et de l'identifiant du modèle.
+"""
+
+from unittest import mock
+from machine_learning.cache import PredictionCache
+
+
+def test_prediction_cache_lru_eviction():
+    cache = PredictionCache(model_id="model", max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # 'a' devient la plus récemment utilisée, 'b' sera évincée
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {"hits": 3, "misses": 1, "evictions": 1, "size": 2}
+
+
+def test_prediction_cache_ttl_expiration():
+    cache = PredictionCache(model_id="model", max_size=10, ttl_seconds=60)
+    with mock.patch("machine_learning.cache.time.monotonic", return_value=1000.0):
+        cache.set("a", 1)
+    with mock.patch("machine_learning.cache.time.monotonic", return_value=1030.0):
+        assert cache.get("a") == 1
+    with mock.patch("machine_learning.cache.time.monotonic", return_value=1061.0):
+        assert cache.get("a") is None
+
+
+def test_prediction_cache_key_depends_on_model():
+    text = "Livraison rapide, très satisfait."
+    assert PredictionCache("model-a").make_key(text) != PredictionCache("model-b").make_key(text)
+    assert PredictionCache("model-a").make_key(text) == PredictionCache("model-a").make_key(text)
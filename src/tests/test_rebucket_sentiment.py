@@ -0,0 +1,68 @@
+# File: src\tests\test_rebucket_sentiment.py
+
+"""
+Tests du recalcul du sentiment à partir des probabilités d'étoiles stockées.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from etl.pipeline.rebucket_sentiment import bucket_sentiment, rebucket_sentiment, sentiment_runtime_field
+from etl.transform.transform_reviews import STAR_PROBABILITY_FIELDS
+from machine_learning.backends import STAR_LABELS
+from machine_learning.predict import convert_stars_to_sentiment
+
+
+def test_bucket_sentiment_thresholds():
+    assert bucket_sentiment([0.7, 0.2, 0.05, 0.03, 0.02]) == "Négatif"
+    assert bucket_sentiment([0.05, 0.15, 0.6, 0.15, 0.05]) == "Neutre"
+    assert bucket_sentiment([0.01, 0.01, 0.08, 0.3, 0.6]) == "Positif"
+
+    # Des seuils plus stricts changent le sentiment sans nouvelle inférence
+    assert bucket_sentiment([0.01, 0.01, 0.08, 0.3, 0.6], positive_min=4.6, rule="expected") == "Neutre"
+    assert bucket_sentiment([0.01, 0.1, 0.09, 0.6, 0.2], positive_min=4.5) == "Neutre"
+    assert bucket_sentiment([0.2, 0.2, 0.2, 0.2, 0.2], min_confidence=0.5) == "Indéfini"
+    assert bucket_sentiment([None] * 5) is None
+
+
+@pytest.mark.parametrize("probabilities", [
+    [0.45, 0.0, 0.0, 0.0, 0.55],
+    [0.55, 0.0, 0.0, 0.0, 0.45],
+    [0.1, 0.35, 0.05, 0.2, 0.3],
+    [0.0, 0.3, 0.4, 0.3, 0.0],
+    [0.3, 0.0, 0.0, 0.4, 0.3],
+    [0.2, 0.2, 0.2, 0.2, 0.2],      # égalité : première étoile, comme le modèle
+    [0.0, 0.0, 0.5, 0.5, 0.0],
+])
+def test_default_rebucket_matches_ingestion(probabilities):
+    # Sentiment de l'ingestion : étoile la plus probable ('star_output'), puis 'convert_stars_to_sentiment'
+    scores = dict(zip(STAR_LABELS, probabilities))
+    label = max(scores, key=scores.get)
+    assert bucket_sentiment(probabilities) == convert_stars_to_sentiment(label)
+
+
+def test_expected_rule_is_opt_in():
+    # Note attendue 3.2 : "Neutre" uniquement avec la règle "expected"
+    assert bucket_sentiment([0.45, 0.0, 0.0, 0.0, 0.55]) == "Positif"
+    assert bucket_sentiment([0.45, 0.0, 0.0, 0.0, 0.55], rule="expected") == "Neutre"
+    with pytest.raises(ValueError):
+        bucket_sentiment([0.45, 0.0, 0.0, 0.0, 0.55], rule="median")
+
+
+def test_rebucket_sentiment_runs_update_by_query():
+    es = MagicMock()
+    es.update_by_query.return_value = {"updated": 3, "noops": 7}
+
+    response = rebucket_sentiment(es, index="reviews", positive_min=4.0)
+
+    assert response["updated"] == 3
+    kwargs = es.update_by_query.call_args.kwargs
+    assert kwargs["index"] == "reviews"
+    assert kwargs["script"]["params"]["positive_min"] == 4.0
+    assert kwargs["script"]["params"]["fields"] == STAR_PROBABILITY_FIELDS
+    assert kwargs["script"]["params"]["rule"] == "argmax"
+
+
+def test_sentiment_runtime_field():
+    field = sentiment_runtime_field(min_confidence=0.4)["user_sentiment_rebucketed"]
+    assert field["type"] == "keyword"
+    assert field["script"]["params"]["min_confidence"] == 0.4
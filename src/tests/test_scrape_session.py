@@ -0,0 +1,104 @@
+# File: src\tests\test_scrape_session.py
+
+"""
+Tests de la session de scraping.
+
+Vérifie que le 'buildId' n'est récupéré qu'une fois pour toutes les entreprises (puis
+renouvelé à expiration ou sur une réponse 404), que les informations de l'entreprise
+proviennent de la première page d'avis et que les requêtes effectuées sont comptées.
+"""
+
+import json
+import pytest
+from collections import Counter
+from unittest.mock import patch
+from httpx import Request, Response
+from etl.extract.reviews_scraper import ScrapeSession, get_reviews_from_trustpilot
+
+
+class FakeClient:
+    """Client HTTP factice : compte les requêtes et simule un redéploiement (nouveau buildId)."""
+
+    def __init__(self, total_pages: int = 3):
+        self.build_id = "build-1"
+        self.total_pages = total_pages
+        self.calls = Counter()
+
+    async def get(self, url):
+        self.calls["get"] += 1
+        text = f'<script id="__NEXT_DATA__">{{"buildId": "{self.build_id}"}}</script>'
+        return Response(200, text=text, request=Request("GET", url))
+
+    async def post(self, url):
+        self.calls["post"] += 1
+        # buildId périmé : l'API Next.js répond 404
+        if f"/{self.build_id}/" not in url:
+            return Response(404, request=Request("POST", url))
+        business = url.split("businessUnit=")[1].split("&")[0]
+        page = int(url.split("&page=")[1]) if "&page=" in url else 1
+        return Response(200, request=Request("POST", url), text=json.dumps({"pageProps": {
+            "reviews": [{"id": f"{business}-{page}"}],
+            "filters": {"pagination": {"totalPages": self.total_pages}, "reviewStatistics": {"ratings": {"total": 3}}},
+            "businessUnit": {"displayName": business.upper(), "trustScore": 4.2, "numberOfReviews": 3},
+        }}))
+
+
+@pytest.mark.asyncio
+async def test_build_id_fetched_once_for_all_enterprises():
+    client = FakeClient()
+    enterprises = [{"enterprise_url": f"e{i}.com"} for i in range(3)]
+    with patch("etl.extract.reviews_scraper.client", client), \
+         patch("etl.extract.reviews_scraper.ENTERPRISES", enterprises):
+        results = await get_reviews_from_trustpilot(max_pages=3)
+
+    # Une page HTML pour la session, une requête par page d'avis (et non 4 requêtes + pages suivantes par entreprise)
+    assert client.calls == {"get": 1, "post": 9}
+    assert [len(result["reviews"]) for result in results] == [3, 3, 3]
+    assert results[1]["enterprise"] == {
+        "enterprise_rating": 4.2, "enterprise_review_number": 3, "ratings": {"total": 3}, "name": "E1.COM"}
+
+
+@pytest.mark.asyncio
+async def test_session_counts_requests_and_returns_first_page():
+    client = FakeClient()
+    session = ScrapeSession()
+    with patch("etl.extract.reviews_scraper.client", client):
+        reviews, page_props, complete = await session.scrape_reviews(
+            "https://www.trustpilot.com/review/a.com", max_pages=2)
+
+    assert sorted(review["id"] for review in reviews) == ["a.com-1", "a.com-2"]
+    assert page_props["businessUnit"]["displayName"] == "A.COM"
+    assert session.request_count == 3
+    assert complete
+
+
+@pytest.mark.asyncio
+async def test_build_id_ttl():
+    client = FakeClient()
+    url_base = "https://www.trustpilot.com/review/a.com"
+    with patch("etl.extract.reviews_scraper.client", client):
+        cached = ScrapeSession(build_id_ttl=600)
+        await cached.get_build_id(url_base)
+        await cached.get_build_id(url_base)
+        assert client.calls["get"] == 1
+
+        expired = ScrapeSession(build_id_ttl=0)
+        await expired.get_build_id(url_base)
+        await expired.get_build_id(url_base)
+        assert client.calls["get"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stale_build_id_refreshed_on_404():
+    client = FakeClient()
+    session = ScrapeSession()
+    url_base = "https://www.trustpilot.com/review/a.com"
+    with patch("etl.extract.reviews_scraper.client", client):
+        # buildId mis en cache ("build-1"), puis le site est redéployé ("build-2")
+        assert await session.get_build_id(url_base) == "build-1"
+        client.build_id = "build-2"
+        url_api, page_props = await session.get_first_page(url_base)
+
+    assert "/build-2/" in url_api
+    assert page_props["reviews"] == [{"id": "a.com-1"}]
+    assert client.calls == {"get": 2, "post": 2}
@@ -0,0 +1,115 @@
+# File: src\tests\test_scraper_concurrency.py
+
+"""
+Tests de l'extraction concurrente de plusieurs entreprises.
+
+Un client HTTP factice (latence fixe) remplace le client réel : vérifie que les entreprises
+sont extraites en parallèle (durée proche de celle d'une seule entreprise), que l'ordre et
+la forme des résultats sont conservés, qu'une entreprise en échec n'affecte pas les autres
+et que les limites de requêtes simultanées (globale et par hôte) sont respectées.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from etl.extract.reviews_scraper import get_reviews_from_trustpilot
+from etl.utils.concurrency_limiter import ConcurrencyLimiter
+
+
+class FakeClient:
+    """Client HTTP factice : pages de 3 avis, latence fixe, suivi des requêtes simultanées."""
+
+    def __init__(self, latency: float = 0.05, total_pages: int = 3):
+        self.latency = latency
+        self.total_pages = total_pages
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _respond(self, text: str):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        response = MagicMock()
+        response.text = text
+        return response
+
+    async def get(self, url):
+        return await self._respond('<script id="__NEXT_DATA__">{"buildId": "build-1"}</script>')
+
+    async def post(self, url):
+        if "echec.com" in url:
+            await asyncio.sleep(self.latency)
+            raise ConnectionError("Hôte injoignable")
+        business = url.split("businessUnit=")[1].split("&")[0]
+        page = int(url.split("&page=")[1]) if "&page=" in url else 1
+        return await self._respond(json.dumps({"pageProps": {
+            "reviews": [{"id": f"{business}-{page}-{index}"} for index in range(3)],
+            "filters": {"pagination": {"totalPages": self.total_pages}, "reviewStatistics": {"ratings": {"total": 9}}},
+            "businessUnit": {"displayName": business, "trustScore": 4.0, "numberOfReviews": 9},
+        }}))
+
+
+ENTERPRISES = [{"enterprise_url": "a.com"}, {"enterprise_url": "echec.com"}, {}, {"enterprise_url": "b.com"}]
+
+
+@pytest.mark.asyncio
+async def test_enterprises_scraped_concurrently():
+    client = FakeClient(latency=0.1)
+    with patch("etl.extract.reviews_scraper.client", client), \
+         patch("etl.extract.reviews_scraper.ENTERPRISES", ENTERPRISES):
+        start = time.perf_counter()
+        results = await get_reviews_from_trustpilot(max_pages=3)
+        elapsed = time.perf_counter() - start
+
+    # Forme et ordre conservés ; l'entreprise sans URL est ignorée
+    assert [result["enterprise_url"] for result in results] == ["a.com", "echec.com", "b.com"]
+    assert sorted(review["id"] for review in results[0]["reviews"]) == \
+        sorted(f"a.com-{page}-{index}" for page in range(1, 4) for index in range(3))
+    assert results[0]["enterprise"]["name"] == "a.com"
+    # Échec isolé : résultat vide pour cette entreprise uniquement
+    assert results[1] == {"enterprise_url": "echec.com", "enterprise": {}, "reviews": [], "error": True}
+    assert not results[0]["error"] and not results[2]["error"]
+    assert len(results[2]["reviews"]) == 9
+
+    # buildId partagé puis 2 allers-retours par entreprise (0.3 s) ; en séquentiel, 0.7 s
+    assert elapsed < 0.55
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limits_respected():
+    client = FakeClient(latency=0.02, total_pages=10)
+    with patch("etl.extract.reviews_scraper.client", client), \
+         patch("etl.extract.reviews_scraper.ENTERPRISES", [{"enterprise_url": f"e{i}.com"} for i in range(4)]), \
+         patch("etl.utils.concurrency_limiter.SCRAPE_MAX_CONCURRENCY", 3), \
+         patch("etl.utils.concurrency_limiter.SCRAPE_MAX_CONCURRENCY_PER_HOST", 2):
+        results = await get_reviews_from_trustpilot(max_pages=10)
+        limiter = ConcurrencyLimiter.get_limiter()
+
+    assert all(len(result["reviews"]) == 30 for result in results)
+    # Toutes les requêtes visent le même hôte : la limite par hôte s'applique
+    assert client.peak_in_flight == 2
+    assert limiter.peak_in_flight == {"www.trustpilot.com": 2}
+
+
+@pytest.mark.asyncio
+async def test_limiter_global_limit_across_hosts():
+    limiter = ConcurrencyLimiter(max_concurrency=3, max_per_host=2)
+    running, peak = 0, 0
+
+    async def request(url):
+        nonlocal running, peak
+        async with limiter.limit(url):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(request(f"https://host{i % 4}.com/page") for i in range(20)))
+
+    assert peak == 3
+    assert all(value <= 2 for value in limiter.peak_in_flight.values())
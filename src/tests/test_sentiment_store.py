@@ -0,0 +1,196 @@
+# File: src\tests\test_sentiment_store.py
+
+"""
+Tests du store persistant des sentiments et de son utilisation par la transformation.
+"""
+
+import copy
+import sqlite3
+import requests
+from unittest.mock import AsyncMock, MagicMock, patch
+from etl.utils.sentiment_store import SentimentStore
+from etl.transform.transform_reviews import sentiment_model_version, transform_reviews_for_elasticsearch
+from etl.pipeline.reviews_etl import run_reviews_etl
+
+
+PROBABILITIES = [0.1, 0.1, 0.2, 0.3, 0.3]
+
+
+def test_store_serves_only_unchanged_texts(tmp_path):
+    store = SentimentStore(str(tmp_path / "store.sqlite3"), model_version="v1")
+    store.put_many([
+        ("r1", "Très bon produit", {"sentiment": "Positif", "star_probabilities": PROBABILITIES}),
+        ("r2", "Colis perdu", {"sentiment": "Négatif", "star_probabilities": None}),
+    ])
+
+    found = store.get_many([("r1", "Très bon produit"), ("r2", "Colis finalement reçu"), ("r3", "Nouveau")])
+
+    # r2 a été modifié et r3 est nouveau : seuls les avis inchangés sont servis
+    assert found == {"r1": {"sentiment": "Positif", "star_probabilities": PROBABILITIES}}
+
+    # Une autre version du modèle ne réutilise pas les entrées
+    other_version = SentimentStore(str(tmp_path / "store.sqlite3"), model_version="v2")
+    assert other_version.get_many([("r1", "Très bon produit")]) == {}
+
+
+def test_store_compaction(tmp_path):
+    path = str(tmp_path / "store.sqlite3")
+    SentimentStore(path, model_version="v1").put_many(
+        [("old", "texte", {"sentiment": "Neutre"})])
+    store = SentimentStore(path, model_version="v2")
+    store.put_many([(f"r{i}", f"texte {i}", {"sentiment": "Neutre"}) for i in range(5)])
+
+    # Entrée de l'ancien modèle supprimée, puis limitation à 3 entrées
+    assert store.compact(max_age_days=90, max_entries=3) == 3
+    assert len(store) == 3
+
+
+def test_store_compaction_limits_and_vacuum(tmp_path):
+    store = SentimentStore(str(tmp_path / "store.sqlite3"), model_version="v1")
+    store.put_many([(f"r{i}", f"texte {i}", {"sentiment": "Neutre"}) for i in range(5)])
+
+    # '0' : sans limite, comme pour 'max_age_days'
+    assert store.compact(max_age_days=0, max_entries=0) == 0
+    assert len(store) == 5
+
+    # Peu d'entrées supprimées : pas de réécriture du fichier
+    store._connection = MagicMock(wraps=store._connection)
+    assert store.compact(max_age_days=0, max_entries=4, vacuum_min_deleted=2) == 1
+    assert not any(call.args == ("VACUUM",) for call in store._connection.execute.call_args_list)
+    assert store.compact(max_age_days=0, max_entries=2, vacuum_min_deleted=2) == 2
+    assert any(call.args == ("VACUUM",) for call in store._connection.execute.call_args_list)
+
+
+def test_transform_scores_only_new_reviews(tmp_path):
+    raw = [{
+        "enterprise": {"name": "Exemple"},
+        "reviews": [
+            {"id": "r1", "text": "Livraison rapide"},
+            {"id": "r2", "text": "Produit cassé"},
+        ],
+    }]
+    scored = []
+
+    def fake_predict(texts, mode=None):
+        scored.extend(texts)
+        return [{"sentiment": "Neutre", "star_probabilities": PROBABILITIES, "model_version": "v1"} for _ in texts]
+
+    with patch("etl.transform.transform_reviews.SENTIMENT_STORE_ENABLED", True), \
+         patch("etl.transform.transform_reviews.SENTIMENT_STORE_PATH", str(tmp_path / "store.sqlite3")), \
+         patch("etl.transform.transform_reviews.sentiment_model_version", return_value="v1"), \
+         patch("etl.transform.transform_reviews.predict_sentiments", side_effect=fake_predict):
+        transform_reviews_for_elasticsearch(copy.deepcopy(raw))
+        assert len(scored) == 2
+
+        # Deuxième exécution : r1 inchangé (store), r2 modifié (re-scoré)
+        raw[0]["reviews"][1]["text"] = "Produit cassé, mais remboursé"
+        documents = transform_reviews_for_elasticsearch(copy.deepcopy(raw))
+
+    assert scored[2:] == ["Produit cassé, mais remboursé"]
+    assert [document["user_sentiment"] for document in documents] == ["Neutre", "Neutre"]
+    assert documents[0]["user_sentiment_probability_five_star"] == 0.3
+
+
+def test_transform_survives_store_errors():
+    raw = [{"enterprise": {"name": "Exemple"}, "reviews": [{"id": "r1", "text": "Livraison rapide"}]}]
+    store = MagicMock()
+    store.get_many.side_effect = sqlite3.OperationalError("database is locked")
+    store.put_many.side_effect = sqlite3.OperationalError("disk I/O error")
+
+    with patch("etl.transform.transform_reviews.SENTIMENT_STORE_ENABLED", True), \
+         patch("etl.transform.transform_reviews.sentiment_model_version", return_value="v1"), \
+         patch("etl.transform.transform_reviews.open_sentiment_store", return_value=store), \
+         patch("etl.transform.transform_reviews.predict_sentiments",
+               return_value=[{"sentiment": "Positif", "star_probabilities": PROBABILITIES}]) as predict:
+        documents = transform_reviews_for_elasticsearch(copy.deepcopy(raw))
+
+    # Lecture en échec : tous les avis sont scorés ; écriture en échec : ignorée ; store fermé
+    assert predict.call_args.args[0] == ["Livraison rapide"]
+    assert documents[0]["user_sentiment"] == "Positif"
+    store.close.assert_called_once()
+
+
+def test_store_keyed_by_served_model_version(tmp_path):
+    raw = [{"enterprise": {"name": "Exemple"}, "reviews": [{"id": "r1", "text": "Livraison rapide"}]}]
+    served = {"version": "modele|torch|none"}
+    scored = []
+
+    def fake_predict(texts, mode=None):
+        scored.extend(texts)
+        return [{"sentiment": "Positif", "star_probabilities": PROBABILITIES, "model_version": served["version"]}
+                for _ in texts]
+
+    with patch("etl.transform.transform_reviews.SENTIMENT_STORE_ENABLED", True), \
+         patch("etl.transform.transform_reviews.SENTIMENT_STORE_PATH", str(tmp_path / "store.sqlite3")), \
+         patch("etl.transform.transform_reviews.sentiment_model_version", side_effect=lambda mode: served["version"]), \
+         patch("etl.transform.transform_reviews.predict_sentiments", side_effect=fake_predict):
+        transform_reviews_for_elasticsearch(copy.deepcopy(raw))
+        transform_reviews_for_elasticsearch(copy.deepcopy(raw))
+        assert len(scored) == 1
+
+        # Quantification activée côté API : nouvelle version, l'avis est scoré à nouveau
+        served["version"] = "modele|torch|int8"
+        transform_reviews_for_elasticsearch(copy.deepcopy(raw))
+        assert len(scored) == 2
+
+    # API injoignable : version inconnue, le store n'est pas utilisé
+    with patch("etl.transform.transform_reviews.SENTIMENT_STORE_ENABLED", True), \
+         patch("etl.transform.transform_reviews.sentiment_model_version", return_value=None), \
+         patch("etl.transform.transform_reviews.open_sentiment_store") as open_store, \
+         patch("etl.transform.transform_reviews.predict_sentiments", side_effect=fake_predict):
+        transform_reviews_for_elasticsearch(copy.deepcopy(raw))
+    open_store.assert_not_called()
+    assert len(scored) == 3
+
+
+def test_prediction_of_another_version_not_stored(tmp_path):
+    raw = [{"enterprise": {"name": "Exemple"}, "reviews": [{"id": "r1", "text": "Livraison rapide"}]}]
+
+    # Modèle redéployé entre la lecture de la version et la prédiction
+    with patch("etl.transform.transform_reviews.SENTIMENT_STORE_ENABLED", True), \
+         patch("etl.transform.transform_reviews.SENTIMENT_STORE_PATH", str(tmp_path / "store.sqlite3")), \
+         patch("etl.transform.transform_reviews.sentiment_model_version", return_value="v1"), \
+         patch("etl.transform.transform_reviews.predict_sentiments",
+               return_value=[{"sentiment": "Positif", "model_version": "v2"}]):
+        transform_reviews_for_elasticsearch(copy.deepcopy(raw))
+
+    assert len(SentimentStore(str(tmp_path / "store.sqlite3"), model_version="v1")) == 0
+
+
+def test_sentiment_model_version_from_called_model():
+    session = MagicMock()
+    session.get.return_value.json.return_value = {"model_version": "modele|onnx|int8"}
+    with patch("etl.transform.transform_reviews.SENTIMENT_MODEL_VERSION", ""), \
+         patch("etl.transform.transform_reviews.SentimentApiSession.get_session", return_value=session):
+        assert sentiment_model_version("http") == "modele|onnx|int8"
+        assert sentiment_model_version("local").startswith("cmarkea/")
+
+        session.get.side_effect = requests.exceptions.ConnectionError("API injoignable")
+        assert sentiment_model_version("http") is None
+
+    # Version forcée par la configuration
+    with patch("etl.transform.transform_reviews.SENTIMENT_MODEL_VERSION", "v-forcee"):
+        assert sentiment_model_version("http") == "v-forcee"
+
+
+def test_pipeline_survives_compaction_error(tmp_path):
+    store = MagicMock()
+    store.compact.side_effect = sqlite3.OperationalError("database is locked")
+    extract = AsyncMock(return_value=[{"enterprise_url": "a.com", "enterprise": {}, "reviews": [
+        {"id": "r1", "dates": {"publishedDate": "2024-01-01T10:00:00.000Z"}}]}])
+
+    with patch("etl.pipeline.reviews_etl.SENTIMENT_STORE_ENABLED", True), \
+         patch("etl.pipeline.reviews_etl.sentiment_model_version", return_value="v1"), \
+         patch("etl.pipeline.reviews_etl.open_sentiment_store", return_value=store), \
+         patch("etl.pipeline.reviews_etl.SCRAPE_STATE_PATH", str(tmp_path / "scrape_state.sqlite3")), \
+         patch("etl.pipeline.reviews_etl.get_reviews_from_trustpilot", extract), \
+         patch("etl.pipeline.reviews_etl.transform_reviews_for_elasticsearch", return_value=[{"id_review": "r1"}]), \
+         patch("etl.pipeline.reviews_etl.FileUtils") as file_utils, \
+         patch("etl.pipeline.reviews_etl.load_reviews_to_elasticsearch_bulk"), \
+         patch("etl.pipeline.reviews_etl._save_marks") as save_marks:
+        run_reviews_etl(max_pages=1, do_save=False, streaming=False)
+
+    # Store verrouillé : purge RGPD effectuée, repères enregistrés et store fermé
+    file_utils.delete_all_json_files.assert_called_once()
+    save_marks.assert_called_once()
+    store.close.assert_called_once()
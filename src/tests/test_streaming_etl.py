@@ -0,0 +1,98 @@
+# File: src\tests\test_streaming_etl.py
+
+"""
+Tests de l'ETL en flux.
+
+Vérifie que les pages traversent l'extraction, la transformation et le chargement dans
+l'ordre, que les files bornées limitent l'avance de l'extraction sur le chargement
+(contre-pression), qu'une erreur d'étape interrompt le pipeline sans blocage, et que
+l'extraction page par page produit les pages dans l'ordre.
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from etl.extract.reviews_scraper import iter_review_pages
+from etl.pipeline.streaming_etl import run_streaming_pipeline
+
+
+async def _pages(count: int, produced: list):
+    """Pages factices de 3 avis, numérotées dans l'ordre d'extraction."""
+    for number in range(count):
+        produced.append(number)
+        yield {"page": number, "reviews": [f"{number}-{index}" for index in range(3)]}
+        await asyncio.sleep(0)
+
+
+def _transform(page):
+    return [{"id_review": review} for review in page["reviews"]]
+
+
+@pytest.mark.asyncio
+async def test_streaming_pipeline_keeps_order():
+    produced, audit, loaded = [], [], []
+    total = await run_streaming_pipeline(
+        _pages(20, produced), _transform, [audit.extend, loaded.extend], queue_size=2)
+
+    expected = [f"{number}-{index}" for number in range(20) for index in range(3)]
+    assert total == 60
+    assert [doc["id_review"] for doc in audit] == expected
+    assert [doc["id_review"] for doc in loaded] == expected
+
+
+@pytest.mark.asyncio
+async def test_streaming_pipeline_backpressure():
+    produced, loaded_pages = [], []
+    max_ahead = 0
+
+    def slow_sink(documents):
+        nonlocal max_ahead
+        time.sleep(0.005)
+        loaded_pages.append(documents[0]["id_review"])
+        max_ahead = max(max_ahead, len(produced) - len(loaded_pages))
+
+    await run_streaming_pipeline(_pages(30, produced), _transform, [slow_sink], queue_size=2)
+
+    assert len(loaded_pages) == 30
+    # Deux files de 2 pages + une page par étape en cours : l'extraction ne prend pas d'avance illimitée
+    assert max_ahead <= 2 * 2 + 3
+
+
+@pytest.mark.asyncio
+async def test_streaming_pipeline_stops_on_error():
+    def failing_sink(documents):
+        raise RuntimeError("Elasticsearch indisponible")
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(
+            run_streaming_pipeline(_pages(50, []), _transform, [failing_sink], queue_size=1), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_iter_review_pages_yields_pages_in_order():
+    def page_response(number, total_pages=5):
+        response = MagicMock()
+        response.text = json.dumps({"pageProps": {
+            "reviews": [{"id": f"review_{number}"}],
+            "filters": {"pagination": {"totalPages": total_pages}, "reviewStatistics": {"ratings": {"total": 1}}},
+            "businessUnit": {"displayName": "Entreprise", "trustScore": 4.1, "numberOfReviews": 1},
+        }})
+        return response
+
+    async def post(url):
+        number = int(url.split("&page=")[1]) if "&page=" in url else 1
+        # Les pages les plus lointaines répondent en premier
+        await asyncio.sleep(0.001 * (10 - number))
+        return page_response(number)
+
+    client = MagicMock()
+    client.post = post
+    with patch("etl.extract.reviews_scraper.client", client), \
+         patch("etl.extract.reviews_scraper.get_build_id", AsyncMock(return_value="build-1")):
+        pages = [page async for page in iter_review_pages(max_pages=4, prefetch=2)]
+
+    assert [page["reviews"][0]["id"] for page in pages] == [f"review_{number}" for number in range(1, 5)]
+    assert all(page["enterprise"]["name"] == "Entreprise" for page in pages)
+    assert pages[0]["enterprise_url"] == "www.showroomprive.com"
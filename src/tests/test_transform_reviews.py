@@ -9,10 +9,18 @@ pourcentages de chaque note sont calculés correctement, et que le champ user_se
 est bien généré via le modèle ML (mocké ici pour le test).
 """
 
+import pytest
 from unittest.mock import patch
-from etl.transform.transform_reviews import transform_reviews_for_elasticsearch
+from etl.transform.transform_reviews import transform_reviews_for_elasticsearch, predict_sentiments_from_api
 from etl.load.mapping_reviews import MAPPING_REVIEWS
 
+@pytest.fixture(autouse=True)
+def disable_sentiment_store():
+    # Le store persistant est testé séparément (test_sentiment_store.py)
+    with patch("etl.transform.transform_reviews.SENTIMENT_STORE_ENABLED", False):
+        yield
+
+
 # Exemple de données brutes (comme tu as déjà)
 raw_reviews = [
     {
@@ -43,10 +51,13 @@ raw_reviews = [
     }
 ]
 
-@patch("etl.transform.transform_reviews.predict_sentiment_from_api")
+@patch("etl.transform.transform_reviews.predict_sentiments_from_api")
 def test_transform_reviews_for_elasticsearch(mock_predict):
-    # Mock du modèle de sentiment
-    mock_predict.side_effect = lambda text: {"text_clean": text, "sentiment": "Neutre"}
+    # Mock du modèle de sentiment (un résultat par texte, dans l'ordre)
+    mock_predict.side_effect = lambda texts: [
+        {"text_clean": text, "sentiment": "Neutre", "star_probabilities": [0.1, 0.2, 0.4, 0.2, 0.1]}
+        for text in texts
+    ]
 
     transformed_reviews = transform_reviews_for_elasticsearch(raw_reviews)
 
@@ -57,6 +68,7 @@ def test_transform_reviews_for_elasticsearch(mock_predict):
 
     # Vérification du champ user_sentiment
     assert first_review["user_sentiment"] == "Neutre"
+    assert first_review["user_sentiment_probability_three_star"] == 0.4
 
     # Vérification que tous les champs du mapping sont présents dans le document transformé
     excluded_fields = {"created_at", "updated_at"}
@@ -68,3 +80,125 @@ def test_transform_reviews_for_elasticsearch(mock_predict):
 
     assert not missing_fields, f"Champs manquants dans le document : {missing_fields}"
     assert not extra_fields, f"Champs non déclarés dans le mapping : {extra_fields}"
+
+
+@patch("etl.transform.transform_reviews.SENTIMENT_CHUNK_SIZE", 2)
+@patch("etl.transform.transform_reviews._predict_chunk_from_api")
+def test_predict_sentiments_from_api_keeps_order(mock_chunk):
+    # Chaque lot retourne le texte en guise de sentiment, pour vérifier le réassemblage
+    mock_chunk.side_effect = lambda texts: [{"sentiment": text} for text in texts]
+
+    texts = [f"avis {i}" for i in range(5)]
+    results = predict_sentiments_from_api(texts)
+
+    assert mock_chunk.call_count == 3
+    assert [result["sentiment"] for result in results] == texts
+
+
+def test_transform_reviews_in_process_mode():
+    # Mode "local" : le modèle (ici le backend factice) est appelé sans passer par l'API
+    from machine_learning.backends import StubBackend
+    from machine_learning.predict import prediction_cache
+
+    prediction_cache.clear()
+    with patch("machine_learning.predict._model", StubBackend()), \
+         patch("etl.transform.transform_reviews.predict_sentiments_from_api") as mock_api:
+        transformed_reviews = transform_reviews_for_elasticsearch(raw_reviews, sentiment_mode="local")
+    prediction_cache.clear()
+
+    mock_api.assert_not_called()
+    assert transformed_reviews[0]["user_sentiment"] in ("Négatif", "Neutre", "Positif")
+    assert transformed_reviews[0]["user_sentiment_probability_five_star"] is not None
+
+
+def _generated_raw_reviews(nb_enterprises: int = 3, nb_reviews: int = 40):
+    """Extractions brutes de plusieurs entreprises (avis, réponses et données personnelles)."""
+    raw_list = []
+    for e in range(nb_enterprises):
+        raw_list.append({
+            "enterprise_url": f"www.entreprise{e}.com",
+            "enterprise": {
+                "name": f"Entreprise {e}",
+                "ratings": {"total": 7 + e, "one": 1, "two": e, "three": 2, "four": 1, "five": 3},
+                "enterprise_rating": 3.5,
+                "enterprise_review_number": 7 + e,
+            },
+            "reviews": [
+                {
+                    "id": f"review_{e}_{r}",
+                    "consumer": {"id": f"user_{r}"},
+                    "text": (f"Bonjour Mme Martin, commande {r} reçue, écrivez à client{r}@mail.fr"
+                             if r % 3 else None),
+                    "rating": 1 + r % 5,
+                    "dates": {"publishedDate": "2024-03-0{}T10:00:00.000Z".format(1 + r % 9)},
+                    "reply": {"message": "Merci\nJean Dupont", "publishedDate": "2024-03-10"} if r % 2 else None,
+                    "labels": {"verification": {"isVerified": bool(r % 2)}},
+                }
+                for r in range(nb_reviews)
+            ],
+        })
+    return raw_list
+
+
+@patch("etl.transform.transform_reviews.TRANSFORM_PARALLEL_MIN_REVIEWS", 0)
+@patch("etl.transform.transform_reviews.TRANSFORM_CHUNK_SIZE", 7)
+@patch("etl.transform.transform_reviews.predict_sentiments_from_api")
+def test_transform_reviews_parallel_matches_serial(mock_predict):
+    # Le sentiment dépend du texte : vérifie aussi le réassemblage des lots dans l'ordre
+    mock_predict.side_effect = lambda texts: [{"sentiment": f"{len(text)}"} for text in texts]
+    raw_list = _generated_raw_reviews()
+
+    serial = transform_reviews_for_elasticsearch(raw_list, workers=1)
+    parallel = transform_reviews_for_elasticsearch(raw_list, workers=3)
+
+    assert len(serial) == 3 * 40
+    assert parallel == serial
+    assert [doc["id_review"] for doc in parallel] == [f"review_{e}_{r}" for e in range(3) for r in range(40)]
+    assert "client1@mail.fr" not in parallel[1]["user_review"]
+    assert parallel[0]["user_review"] == "indisponible"
+
+
+@patch("etl.transform.transform_reviews.predict_sentiments_from_api")
+def test_transform_reviews_columnar_matches_rows(mock_predict):
+    mock_predict.side_effect = lambda texts: [{"sentiment": f"{len(text)}"} for text in texts]
+    raw_list = _generated_raw_reviews()
+    # Valeurs hors format : converties par les fonctions de DataUtils, comme le moteur par lignes
+    edge_reviews = raw_list[0]["reviews"][:6]
+    edge_reviews[0]["dates"]["publishedDate"] = "2023-02-29T10:00:00.000Z"   # jour invalide
+    edge_reviews[1]["dates"]["publishedDate"] = "2024-03-01T23:30:00+02:00"  # décalage horaire
+    edge_reviews[2]["rating"] = "4"
+    edge_reviews[3]["rating"] = None
+    edge_reviews[4]["labels"] = {}
+    edge_reviews[5]["reply"] = {}
+    raw_list[1]["enterprise"]["ratings"] = {"total": 0}
+    raw_list.append({"enterprise_url": "www.vide.com", "reviews": []})
+
+    rows = transform_reviews_for_elasticsearch(raw_list, workers=1, engine="rows")
+    columnar = transform_reviews_for_elasticsearch(raw_list, workers=1, engine="columnar")
+
+    assert columnar == rows
+    assert [list(doc) for doc in columnar] == [list(doc) for doc in rows]
+    assert rows[0]["date_review"] is None and rows[1]["date_review"] == "2024-03-01"
+
+
+def test_transform_reviews_unknown_engine():
+    with pytest.raises(ValueError):
+        transform_reviews_for_elasticsearch(raw_reviews, engine="inconnu")
+
+
+@patch("etl.transform.transform_reviews.predict_sentiments_from_api")
+def test_transform_reviews_reports_unscored(mock_predict):
+    raw = [{"enterprise": {}, "reviews": [
+        {"id": "scored", "text": "Très bien"},
+        {"id": "echec", "text": "Lot en erreur"},
+        {"id": "sans_texte", "text": ""},
+    ]}]
+    # Le second avis appartient à un lot en échec : sentiment "Indéfini"
+    mock_predict.return_value = [{"sentiment": "Positif"}, {"sentiment": "Indéfini"}]
+
+    unscored = []
+    documents = transform_reviews_for_elasticsearch(raw, unscored=unscored)
+
+    # Un avis sans texte n'a pas de sentiment à prédire : il n'est pas signalé
+    assert unscored == ["echec"]
+    assert [doc["user_sentiment"] for doc in documents] == ["Positif", "Indéfini", "Indéfini"]